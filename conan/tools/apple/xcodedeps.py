@@ -2,11 +2,10 @@ import os
 import textwrap
 from collections import OrderedDict
 
-from jinja2 import Template
-
 from conan.tools._check_build_profile import check_using_build_profile
 from conans.errors import ConanException
 from conans.util.files import load, save
+from conans.util.templates import compiled_template
 from conans.client.tools.apple import to_apple_arch
 
 GLOBAL_XCCONFIG_TEMPLATE = textwrap.dedent("""\
@@ -149,7 +148,7 @@ class XcodeDeps(object):
             'condition': _xcconfig_conditional(self._conanfile.settings)
         }
 
-        template = Template(self._conf_xconfig)
+        template = compiled_template(self._conf_xconfig)
         content_multi = template.render(**fields)
         return content_multi
 
@@ -168,7 +167,7 @@ class XcodeDeps(object):
                         else f"conan_{_format_name(component[0])}_{_format_name(component[1])}.xcconfig"
                         for component in components]
 
-            content_multi = Template(content_multi).render({"pkg_name": pkg_name,
+            content_multi = compiled_template(content_multi).render({"pkg_name": pkg_name,
                                                             "comp_name": comp_name,
                                                             "dep_xconfig_filename": dep_xconfig_filename,
                                                             "deps_includes": _get_includes(reqs)})
@@ -1,7 +1,7 @@
 import jinja2
-from jinja2 import Template
 
 from conans.errors import ConanException
+from conans.util.templates import compiled_template
 
 
 class CMakeDepsFileTemplate(object):
@@ -44,8 +44,8 @@ class CMakeDepsFileTemplate(object):
             raise ConanException("error generating context for '{}': {}".format(self.conanfile, e))
         if context is None:
             return
-        return Template(self.template, trim_blocks=True, lstrip_blocks=True,
-                        undefined=jinja2.StrictUndefined).render(context)
+        return compiled_template(self.template, trim_blocks=True, lstrip_blocks=True,
+                                 undefined=jinja2.StrictUndefined).render(context)
 
     def context(self):
         raise NotImplementedError()
@@ -3,7 +3,11 @@ import os
 import shutil
 from collections import defaultdict
 
-from conans.util.files import mkdir
+from conans.util.dir_snapshot import DirSnapshotCache, pattern_matcher
+from conans.util.files import copy_is_up_to_date, mkdir
+
+# The source trees of the last copies, listed again only if they are modified
+_snapshots = DirSnapshotCache(max_snapshots=2)
 
 
 def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
@@ -58,47 +62,42 @@ def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
     if excludes:
         if not isinstance(excludes, (tuple, list)):
             excludes = (excludes, )
-        if ignore_case:
-            excludes = [e.lower() for e in excludes]
     else:
         excludes = []
+    folder_excludes = [pattern_matcher(e, ignore_case) for e in excludes]
+
+    def skip_folder(path, name):
+        return os.path.join(path, name) == excluded_folder
 
-    for root, subfolders, files in os.walk(src):
-        if root == excluded_folder:
-            subfolders[:] = []
+    snapshot = _snapshots.get(src, skip_folder=skip_folder, key=excluded_folder)
+    pruned = set()  # indexes of the folders whose files and subfolders are skipped
+    for index, folder in enumerate(snapshot.folders):
+        root = folder.path
+        if folder.parent in pruned or root == excluded_folder:
+            pruned.add(index)
             continue
 
         # Check if any of the subfolders is a symlink
-        for subfolder in subfolders:
+        for subfolder in folder.subfolders:
+            if subfolder not in folder.links:
+                continue
             relative_path = os.path.relpath(os.path.join(root, subfolder), src)
-            if os.path.islink(os.path.join(root, subfolder)):
-                if fnmatch.fnmatch(os.path.normpath(relative_path.lower()), pattern):
-                    files_symlinked_to_folders.append(relative_path)
+            if fnmatch.fnmatch(os.path.normpath(relative_path.lower()), pattern):
+                files_symlinked_to_folders.append(relative_path)
 
         relative_path = os.path.relpath(root, src)
-        compare_relative_path = relative_path.lower() if ignore_case else relative_path
-        for exclude in excludes:
-            if fnmatch.fnmatch(compare_relative_path, exclude):
-                subfolders[:] = []
-                files = []
-                break
-        for f in files:
+        if any(exclude(relative_path) for exclude in folder_excludes):
+            pruned.add(index)
+            continue
+        for f in folder.files:
             relative_name = os.path.normpath(os.path.join(relative_path, f))
             filenames.append(relative_name)
 
-    if ignore_case:
-        pattern = pattern.lower()
-        files_to_copy = [n for n in filenames if fnmatch.fnmatch(os.path.normpath(n.lower()),
-                                                                 pattern)]
-    else:
-        files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                     pattern)]
-
-    for exclude in excludes:
-        if ignore_case:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f.lower(), exclude)]
-        else:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatchcase(f, exclude)]
+    # Files are matched with fnmatchcase (no normcase) if not ignore_case
+    match = pattern_matcher(pattern, ignore_case, normcase=ignore_case)
+    file_excludes = [pattern_matcher(e, ignore_case, normcase=ignore_case) for e in excludes]
+    files_to_copy = [n for n in filenames
+                     if match(n) and not any(exclude(n) for exclude in file_excludes)]
 
     return files_to_copy, files_symlinked_to_folders
 
@@ -123,7 +122,7 @@ def _copy_files(files, src, dst, keep_path):
             except OSError:
                 pass
             os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
-        else:
+        elif not copy_is_up_to_date(abs_src_name, abs_dst_name):
             shutil.copy2(abs_src_name, abs_dst_name)
         copied_files.append(abs_dst_name)
     return copied_files
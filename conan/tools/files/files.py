@@ -17,7 +17,7 @@ from urllib.request import url2pathname
 from conan.tools import CONAN_TOOLCHAIN_ARGS_FILE, CONAN_TOOLCHAIN_ARGS_SECTION
 from conans.client.downloaders.download import run_downloader
 from conans.errors import ConanException
-from conans.util.files import rmdir as _internal_rmdir
+from conans.util.files import break_hardlink, rmdir as _internal_rmdir, parse_size
 from conans.util.runners import check_output_runner
 
 if six.PY3:  # Remove this IF in develop2
@@ -51,6 +51,7 @@ def save(conanfile, path, content, append=False, encoding="utf-8"):
             except Exception:
                 raise
 
+    break_hardlink(path)
     with open(path, mode) as handle:
         if not isinstance(content, bytes):
             content = bytes(content, encoding=encoding)
@@ -163,6 +164,12 @@ def download(conanfile, url, filename, verify=True, retry=None, retry_wait=None,
 
     checksum = sha256 or sha1 or md5
     download_cache = config["tools.files.download:download_cache"] if checksum else None
+    max_size = config["tools.files.download:download_cache_max_size"] if download_cache else None
+    try:
+        max_size = parse_size(max_size) if max_size else None
+    except ValueError as e:
+        raise ConanException("Invalid 'tools.files.download:download_cache_max_size': {}"
+                             .format(e))
 
     def _download_file(file_url):
         # The download cache is only used if a checksum is provided, otherwise, a normal download
@@ -171,7 +178,7 @@ def download(conanfile, url, filename, verify=True, retry=None, retry_wait=None,
                                       sha1=sha1, sha256=sha256)
         else:
             run_downloader(requester=requester, output=out, verify=verify, download_cache=download_cache,
-                        user_download=True, url=file_url,
+                        download_cache_max_size=max_size, user_download=True, url=file_url,
                         file_path=filename, retry=retry, retry_wait=retry_wait, overwrite=overwrite,
                         auth=auth, headers=headers, md5=md5, sha1=sha1, sha256=sha256)
         out.writeln("")
@@ -4,11 +4,10 @@ import re
 import textwrap
 from xml.dom import minidom
 
-from jinja2 import Template
-
 from conan.tools._check_build_profile import check_using_build_profile
 from conans.errors import ConanException
 from conans.util.files import load, save
+from conans.util.templates import compiled_template
 
 VALID_LIB_EXTENSIONS = (".so", ".lib", ".a", ".dylib", ".bc")
 
@@ -183,8 +182,8 @@ class MSBuildDeps(object):
             'linker_flags': " ".join(cpp_info.sharedlinkflags + cpp_info.exelinkflags),
             'host_context': not build
         }
-        formatted_template = Template(self._vars_props, trim_blocks=True,
-                                      lstrip_blocks=True).render(**fields)
+        formatted_template = compiled_template(self._vars_props, trim_blocks=True,
+                                               lstrip_blocks=True).render(**fields)
         return formatted_template
 
     def _activate_props_file(self, dep_name, vars_filename, deps, build):
@@ -199,7 +198,7 @@ class MSBuildDeps(object):
         # TODO: This must include somehow the user/channel, most likely pattern to exclude/include
         # Probably also the negation pattern, exclude all not @mycompany/*
         ca_exclude = any(fnmatch.fnmatch(dep_name, p) for p in self.exclude_code_analysis or ())
-        template = Template(self._conf_props, trim_blocks=True, lstrip_blocks=True)
+        template = compiled_template(self._conf_props, trim_blocks=True, lstrip_blocks=True)
         content_multi = template.render(host_context=not build, name=dep_name, ca_exclude=ca_exclude,
                                         vars_filename=vars_filename, deps=deps)
         return content_multi
@@ -226,7 +225,7 @@ class MSBuildDeps(object):
               </PropertyGroup>
             </Project>
             """)
-            content_multi = Template(content_multi).render({"name": dep_name})
+            content_multi = compiled_template(content_multi).render({"name": dep_name})
         # parse the multi_file and add new import statement if needed
         dom = minidom.parseString(content_multi)
         import_vars = dom.getElementsByTagName('ImportGroup')[0]
@@ -1,6 +1,7 @@
 import os
 
 from conan.tools.files import chdir
+from conans.client.cache.git_mirrors import GitMirrors
 from conans.errors import ConanException
 from conans.util.files import mkdir
 from conans.util.runners import check_output_runner
@@ -76,13 +77,31 @@ class Git(object):
         folder = self.run("rev-parse --show-toplevel")
         return folder.replace("\\", "/")
 
+    def _mirror(self, url, commit=None):
+        """ the local mirror of the url, updated, if the tools.scm:git_mirrors_folder is defined
+        """
+        mirrors_folder = self._conanfile.conf.get("tools.scm:git_mirrors_folder")
+        if not mirrors_folder:
+            return None
+        mirrors = GitMirrors(mirrors_folder, self._conanfile.output)
+        return mirrors.update(url, commit).replace("\\", "/")
+
     def clone(self, url, target="", args=None):
         args = args or []
         if os.path.exists(url):
             url = url.replace("\\", "/")  # Windows local directory
         mkdir(self.folder)
         self._conanfile.output.info("Cloning git repo")
-        self.run('clone "{}" {} {}'.format(url, " ".join(args), target))
+        mirror = self._mirror(url)
+        if mirror is None:
+            self.run('clone "{}" {} {}'.format(url, " ".join(args), target))
+            return
+        # The folder git would create cloning the url, not the mirror
+        target = target or os.path.basename(url.rstrip("/").rsplit(":", 1)[-1])
+        if target.endswith(".git"):
+            target = target[:-len(".git")]
+        self.run('clone "{}" {} "{}"'.format(mirror, " ".join(args), target))
+        self.run('-C "{}" remote set-url origin "{}"'.format(target, url))
 
     def fetch_commit(self, url, commit):
         """
@@ -92,10 +111,13 @@ class Git(object):
         if os.path.exists(url):
             url = url.replace("\\", "/")  # Windows local directory
         self._conanfile.output.info("Shallow fetch of git repo")
+        mirror = self._mirror(url, commit)
         self.run('init')
-        self.run(f'remote add origin "{url}"')
+        self.run(f'remote add origin "{mirror or url}"')
         self.run(f'fetch --depth 1 origin {commit}')
         self.run(f'checkout FETCH_HEAD')
+        if mirror is not None:
+            self.run(f'remote set-url origin "{url}"')
 
     def checkout(self, commit):
         self._conanfile.output.info("Checkout: {}".format(commit))
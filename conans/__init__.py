@@ -17,7 +17,14 @@ REVISIONS = "revisions"  # Only when enabled in config, not by default look at s
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
 MATRIX_PARAMS = "matrix_params"
 OAUTH_TOKEN = "oauth_token"
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+BATCH_PACKAGES_INFO = "batch_packages_info"  # Latest PREV + conaninfo of many packages, only v2
+BATCH_SNAPSHOTS = "batch_snapshots"  # Files + conanmanifest.txt of many revisions, only v2
+ARCHIVE_XZ = "archive_xz"  # Accepts conan_package.txz package archives
+ARCHIVE_TAR = "archive_tar"  # Accepts conan_package.tar (uncompressed) package archives
+REMOVE_PACKAGE_FILES = "remove_package_files"  # Removes single files of a package revision
+# Server is always with revisions
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS, BATCH_PACKAGES_INFO, BATCH_SNAPSHOTS,
+                       ARCHIVE_XZ, ARCHIVE_TAR, REMOVE_PACKAGE_FILES]
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.65.0-dev'
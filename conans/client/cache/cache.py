@@ -3,10 +3,8 @@ import platform
 import shutil
 from collections import OrderedDict
 
-from jinja2 import Environment, select_autoescape, FileSystemLoader, ChoiceLoader, Template
-
 from conan import conan_version
-from conans.assets.templates import dict_loader
+from conans.assets.templates import dict_templates
 from conans.client.cache.editable import EditablePackages
 from conans.client.cache.remote_registry import RemoteRegistry
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, \
@@ -79,6 +77,7 @@ class ClientCache(object):
         self._no_lock = None
         self._config = None
         self._new_config = None
+        self._localdb = None
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
         self._store_folder = self.config.storage_path or os.path.join(self.cache_folder, "data")
@@ -96,6 +95,10 @@ class ClientCache(object):
     def installed_as_editable(self, ref):
         return isinstance(self.package_layout(ref), PackageEditableLayout)
 
+    @property
+    def git_mirrors_folder(self):
+        return os.path.join(self.cache_folder, "git_mirrors")
+
     @property
     def config_install_file(self):
         return os.path.join(self.cache_folder, "config_install.json")
@@ -170,6 +173,7 @@ class ClientCache(object):
         if self._new_config is None:
             self._new_config = ConfDefinition()
             if os.path.exists(self.new_config_path):
+                from jinja2 import Template
                 text = load(self.new_config_path)
                 distro = None
                 if platform.system() in ["Linux", "FreeBSD"]:
@@ -181,9 +185,11 @@ class ClientCache(object):
 
     @property
     def localdb(self):
-        localdb_filename = os.path.join(self.cache_folder, LOCALDB)
         encryption_key = os.getenv('CONAN_LOGIN_ENCRYPTION_KEY', None)
-        return LocalDB.create(localdb_filename, encryption_key=encryption_key)
+        if self._localdb is None or self._localdb.encryption_key != encryption_key:
+            localdb_filename = os.path.join(self.cache_folder, LOCALDB)
+            self._localdb = LocalDB.create(localdb_filename, encryption_key=encryption_key)
+        return self._localdb
 
     @property
     def conan_conf_path(self):
@@ -276,7 +282,9 @@ class ClientCache(object):
 
     def get_template(self, template_name, user_overrides=False):
         # TODO: It can be initialized only once together with the Conan app
-        loaders = [dict_loader]
+        from jinja2 import (Environment, select_autoescape, DictLoader, FileSystemLoader,
+                            ChoiceLoader)
+        loaders = [DictLoader(dict_templates)]
         if user_overrides:
             loaders.insert(0, FileSystemLoader(os.path.join(self.cache_folder, 'templates')))
         env = Environment(loader=ChoiceLoader(loaders),
@@ -0,0 +1,101 @@
+import hashlib
+import os
+import re
+
+from six.moves.urllib.parse import urlparse
+
+from conans.util.files import mkdir, rmdir, save
+from conans.util.locks import SimpleLock
+from conans.util.runners import check_output_runner, pyinstaller_bundle_env_cleaned
+
+_COMMIT_REGEX = re.compile("^[0-9a-fA-F]{40}$")
+_SCP_REGEX = re.compile(r"^(?:[^@/]+@)?(?P<host>[^:/]{2,}):(?!//)(?P<path>.*)$")
+
+
+def normalize_git_url(url):
+    """ The same string for the different spellings of the URL of a repository: without
+    credentials, trailing slashes or ".git", lowercase scheme and host, scp-like URLs as ssh ones
+    and local folders as absolute paths
+    """
+    url = url.strip().replace("\\", "/").rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-len(".git")]
+    scp = _SCP_REGEX.match(url)
+    if scp:
+        return "ssh://{}/{}".format(scp.group("host").lower(), scp.group("path").lstrip("/"))
+    parsed = urlparse(url)
+    if parsed.scheme and parsed.scheme != "file" and parsed.netloc:
+        netloc = (parsed.hostname or "").lower()
+        if parsed.port:
+            netloc += ":{}".format(parsed.port)
+        return "{}://{}{}".format(parsed.scheme.lower(), netloc, parsed.path)
+    path = parsed.path if parsed.scheme == "file" else url
+    return os.path.normcase(os.path.abspath(path)).replace("\\", "/")
+
+
+class GitMirrors(object):
+    """ Local bare mirrors of git repositories, one per normalized URL, so cloning the same
+    repository again (for other package IDs, other builds) clones from the mirror, and only
+    fetches from the network the commits the mirror does not have yet.
+    A process lock per mirror serializes the updates of the same repository
+    """
+    def __init__(self, folder, output=None):
+        self._folder = folder
+        self._output = output
+
+    def mirror_folder(self, url):
+        key = hashlib.sha1(normalize_git_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self._folder, key[:20])
+
+    @staticmethod
+    def _run(folder, command, verify_ssl):
+        command = 'git -C "{}" -c http.sslVerify={} {}'.format(folder,
+                                                               "true" if verify_ssl else "false",
+                                                               command)
+        with pyinstaller_bundle_env_cleaned():
+            return check_output_runner(command).strip()
+
+    def _has_commit(self, mirror, revision):
+        try:
+            self._run(mirror, 'cat-file -e "{}^{{commit}}"'.format(revision), verify_ssl=True)
+            return True
+        except Exception:
+            return False
+
+    def _fetch(self, mirror, url, verify_ssl):
+        # The URL is not stored in the mirror, it could contain credentials
+        self._run(mirror, 'fetch --prune --force "{}" "+refs/heads/*:refs/heads/*" '
+                          '"+refs/tags/*:refs/tags/*"'.format(url), verify_ssl)
+
+    def update(self, url, revision=None, verify_ssl=True):
+        """ Makes sure the mirror of the url exists and is updated, and returns its folder.
+        If the revision is a commit the mirror already contains, the url is not contacted
+        (branches and tags can move, they are always fetched)
+        """
+        mirror = self.mirror_folder(url)
+        mkdir(self._folder)
+        with SimpleLock(mirror + ".lock"):
+            if not os.path.isdir(mirror):
+                if self._output:
+                    self._output.info("Creating the local git mirror of '{}'"
+                                      .format(normalize_git_url(url)))
+                tmp_mirror = mirror + ".tmp"
+                rmdir(tmp_mirror)
+                mkdir(tmp_mirror)
+                self._run(tmp_mirror, "init --bare", verify_ssl)
+                save(os.path.join(tmp_mirror, "description"), normalize_git_url(url))
+                self._fetch(tmp_mirror, url, verify_ssl)
+                # The clones from the mirror checkout the default branch of the repository
+                remote_head = self._run(tmp_mirror, 'ls-remote --symref "{}" HEAD'.format(url),
+                                        verify_ssl)
+                for line in remote_head.splitlines():
+                    if line.startswith("ref: "):
+                        self._run(tmp_mirror, "symbolic-ref HEAD {}".format(line.split()[1]),
+                                  verify_ssl)
+                os.rename(tmp_mirror, mirror)
+            elif revision and _COMMIT_REGEX.match(revision) and self._has_commit(mirror, revision):
+                if self._output:
+                    self._output.info("Commit '{}' found in the local git mirror".format(revision))
+            else:
+                self._fetch(mirror, url, verify_ssl)
+        return mirror
@@ -0,0 +1,144 @@
+import os
+import time
+
+from conans.client.downloaders.cached_file_downloader import CachedFileDownloader
+from conans.errors import ConanException
+from conans.model.ref import PackageReference
+from conans.paths import rm_conandir
+from conans.util.files import human_size
+from conans.util.log import logger
+
+
+def cmd_clean_download_cache(download_cache, max_size, output):
+    """ Evicts the least recently used files of the download cache until its size is below
+    max_size. Files being downloaded or read by other processes are kept
+    """
+    if not download_cache:
+        raise ConanException("There is no download cache defined, use "
+                             "'storage.download_cache' to define one")
+    cached_downloader = CachedFileDownloader(download_cache, file_downloader=None)
+    evicted, freed = cached_downloader.evict(max_size)
+    output.info("Removed {} files from the download cache, {} freed".format(evicted,
+                                                                           human_size(freed)))
+    return evicted, freed
+
+
+def _folder_size(folder):
+    total = 0
+    for root, _, files in os.walk(folder):
+        for f in files:
+            try:
+                total += os.lstat(os.path.join(root, f)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class _GCItem(object):
+    """ A removable part of the cache: a package, a build folder or the sources of a recipe,
+    the sources include both the "source" and the "scm_source" folders, removed together
+    """
+    def __init__(self, kind, ref, package_id, folders, last_access):
+        self.kind = kind
+        self.ref = ref
+        self.package_id = package_id
+        self.folders = folders
+        self.last_access = last_access
+        self.size = sum(_folder_size(folder) for folder in folders)
+
+    def __str__(self):
+        if self.package_id:
+            return "{}:{} {}".format(repr(self.ref), self.package_id, self.kind)
+        return "{} {}".format(repr(self.ref), self.kind)
+
+
+def _gc_items(cache):
+    items = []
+    for ref in cache.all_refs():
+        if cache.installed_as_editable(ref):
+            continue
+        layout = cache.package_layout(ref)
+        recipe_access = layout.recipe_last_access()
+        package_access = {}
+        for package_id in layout.package_ids():
+            pref = PackageReference(ref, package_id)
+            package_access[package_id] = layout.package_last_access(pref)
+            items.append(_GCItem("package", ref, package_id, [layout.package(pref)],
+                                 package_access[package_id]))
+        for build_id in layout.conan_builds():
+            # The build folder was last used when its package was, or if the build_id is
+            # different from the package_id, when the recipe was
+            last_access = package_access.get(build_id, recipe_access)
+            items.append(_GCItem("build", ref, build_id,
+                                 [layout.build(PackageReference(ref, build_id))], last_access))
+        sources = [f for f in (layout.source(), layout.scm_sources()) if os.path.isdir(f)]
+        if sources:
+            items.append(_GCItem("source", ref, None, sources, recipe_access))
+    return items
+
+
+def _remove_item(cache, item, output):
+    """ Only removes the item if the recipe and package locks can be acquired without waiting,
+    so anything being used by a concurrent Conan process is never removed
+    :return: None if removed, or the reason it was not
+    """
+    layout = cache.package_layout(item.ref, short_paths=False)
+    recipe_lock = layout.conanfile_write_lock(output)
+    if not recipe_lock.acquire(blocking=False):
+        return "it is being used"
+    try:
+        if item.kind == "source":
+            layout.sources_remove()
+            return None
+        pref = PackageReference(item.ref, item.package_id)
+        package_lock = layout.package_lock(pref)
+        if not package_lock.acquire(blocking=False):
+            return "it is being used"
+        try:
+            if item.kind == "package":
+                layout.package_remove(pref)
+            else:
+                rm_conandir(layout.build(pref))
+            return None
+        finally:
+            package_lock.release()
+    except (ConanException, OSError) as e:
+        return "it couldn't be removed: {}".format(e)
+    finally:
+        recipe_lock.release()
+
+
+def cmd_cache_gc(cache, output, max_size=None, max_age=None, dry_run=False):
+    """ Removes the least recently used packages, build folders and sources of the cache, those
+    not used in the last 'max_age' (timedelta) and the oldest ones until the total size of
+    them is below 'max_size' bytes
+    """
+    if max_size is None and max_age is None:
+        raise ConanException("Define a maximum size or a maximum age to collect the cache")
+
+    items = sorted(_gc_items(cache), key=lambda i: i.last_access or 0)
+    total = sum(item.size for item in items)
+    output.info("Cache packages, builds and sources use {}".format(human_size(total)))
+    limit = time.time() - max_age.total_seconds() if max_age is not None else None
+
+    removed, freed = [], 0
+    for item in items:
+        expired = limit is not None and (item.last_access or 0) < limit
+        oversize = max_size is not None and total - freed > max_size
+        if not expired and not oversize:
+            break  # items are sorted, next items are more recent
+        if dry_run:
+            output.info("Would remove {}, {}".format(item, human_size(item.size)))
+        else:
+            reason = _remove_item(cache, item, output)
+            if reason:
+                output.warn("Skipping {}, {}".format(item, reason))
+                continue
+            logger.debug("CACHE GC: Removed %s" % ", ".join(item.folders))
+            output.info("Removed {}, {}".format(item, human_size(item.size)))
+        removed.append(item)
+        freed += item.size
+
+    action = "Would free" if dry_run else "Freed"
+    output.info("{} {} in {} items".format(action, human_size(freed), len(removed)))
+    return removed
@@ -1,11 +1,10 @@
 import os
-import stat
-import tarfile
 import time
 import traceback
 from collections import defaultdict
 from multiprocessing.pool import ThreadPool
 
+from conans import REMOVE_PACKAGE_FILES
 from conans.util import progress_bar
 from conans.util.env_reader import get_env
 from conans.util.progress_bar import left_justify_message
@@ -15,10 +14,11 @@ from conans.errors import ConanException, NotFoundException
 from conans.model.manifest import gather_files, FileTreeManifest
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
-                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
+                          EXPORT_TGZ_NAME, CONANINFO)
 from conans.search.search import search_packages, search_recipes
-from conans.util.files import (load, clean_dirty, is_dirty,
-                               gzopen_without_timestamps, set_dirty_context_manager)
+from conans.util.archives import (GZIP_CODEC, PACKAGE_ARCHIVE_NAMES, find_package_archive,
+                                  get_archive_codec, write_archive)
+from conans.util.files import (load, clean_dirty, is_dirty, human_size, set_dirty_context_manager)
 from conans.util.log import logger
 from conans.util.tracer import log_recipe_upload, log_compressed_files, log_package_upload
 from conans.tools import cpu_count
@@ -158,19 +158,89 @@ class _UploadCollecter(object):
 
 
 class _PackagePreparator(object):
+    _SNAPSHOTS_BATCH = 500  # recipes and packages per batch snapshots request
+
     def __init__(self, cache, remote_manager, hook_manager, output):
         self._cache = cache
         self._remote_manager = remote_manager
         self._output = output
         self._hook_manager = hook_manager
+        self._remote_codecs = {}
+
+    def _package_codec(self, remote):
+        """ the codec of the configured compression format, gzip if the remote doesn't support it
+        (not checked without remote)
+        """
+        compression = self._cache.new_config["core.upload:compression_format"]
+        codec = get_archive_codec(compression) if compression else GZIP_CODEC
+        if remote is None or codec.capability is None:
+            return codec
+        supported = self._remote_codecs.get((remote.name, codec.name))
+        if supported is None:
+            supported = self._remote_manager.server_capable(remote, codec.capability)
+            if not supported:
+                self._output.warn("Remote '{}' doesn't support '{}' package archives, using "
+                                  "'{}'".format(remote.name, codec.name, GZIP_CODEC.name))
+            self._remote_codecs[(remote.name, codec.name)] = supported
+        return codec if supported else GZIP_CODEC
+
+    def remote_recipe_state(self, ref, remote, policy):
+        """ the remote snapshot of the recipe, and its manifest if the policy needs it
+        """
+        remote_snapshot = self._remote_manager.get_recipe_snapshot(ref, remote)
+        remote_manifest = None
+        if remote_snapshot and policy != UPLOAD_POLICY_FORCE:
+            remote_manifest = self._remote_recipe_manifest(ref, remote)
+        return remote_snapshot, remote_manifest
+
+    def remote_states(self, refs, prefs, remote, policy):
+        """ the remote states of many recipes and packages in one request per batch, like
+        remote_recipe_state() and remote_package_state(): {ref or pref: (snapshot, manifest)}.
+        The ones not in the result have to be requested one by one
+        """
+        ret = {}
+        refs, prefs = list(refs), list(prefs)
+        while refs or prefs:
+            batch_refs, refs = refs[:self._SNAPSHOTS_BATCH], refs[self._SNAPSHOTS_BATCH:]
+            size = self._SNAPSHOTS_BATCH - len(batch_refs)
+            batch_prefs, prefs = prefs[:size], prefs[size:]
+            snapshots = self._remote_manager.get_snapshots(batch_refs, batch_prefs, remote)
+            if snapshots is None:  # Not supported by the remote
+                break
+            for ref, (remote_snapshot, remote_manifest) in snapshots.items():
+                if not remote_snapshot or policy == UPLOAD_POLICY_FORCE:
+                    remote_manifest = None
+                elif (isinstance(ref, PackageReference) and
+                      not is_package_snapshot_complete(remote_snapshot)):
+                    remote_manifest = None
+                ret[ref] = remote_snapshot, remote_manifest
+        return ret
+
+    def remote_package_state(self, pref, remote, policy):
+        """ the remote snapshot of the package, and its manifest if the policy needs it
+        """
+        remote_snapshot = self._remote_manager.get_package_snapshot(pref, remote)
+        remote_manifest = None
+        if (remote_snapshot and policy != UPLOAD_POLICY_FORCE and
+                is_package_snapshot_complete(remote_snapshot)):
+            remote_manifest, _ = self._remote_manager.get_package_manifest(pref, remote)
+        return remote_snapshot, remote_manifest
 
-    def prepare_recipe(self, ref, conanfile, remote, remotes, policy):
+    def _remote_recipe_manifest(self, ref, remote):
+        try:
+            remote_manifest, _ = self._remote_manager.get_recipe_manifest(ref, remote)
+        except NotFoundException:
+            return None  # First time uploading this package
+        return remote_manifest
+
+    def prepare_recipe(self, ref, conanfile, remote, remotes, policy, remote_state=None):
         """ do a bunch of things that are necessary before actually executing the upload:
         - retrieve exports_sources to complete the recipe if necessary
         - compress the artifacts in conan_export.tgz and conan_export_sources.tgz
         - check if package is ok to be uploaded, if scm info missing, will raise
         - check if the remote recipe is newer, raise
         - compare and decide which files need to be uploaded (and deleted from server)
+        The remote_state (snapshot, manifest) is requested to the remote if not planned before
         """
         layout = self._cache.package_layout(ref)
         current_remote_name = layout.load_metadata().recipe.remote
@@ -203,20 +273,24 @@ class _PackagePreparator(object):
                                      " again the recipe ('conan export' or 'conan create') to"
                                      " fix these issues.")
 
-            remote_manifest = self._check_recipe_date(ref, remote, local_manifest)
+            if remote_state is None:
+                remote_manifest = self._remote_recipe_manifest(ref, remote)
+            else:
+                remote_manifest = remote_state[1]
+            self._check_recipe_date(ref, remote, local_manifest, remote_manifest)
 
         if policy == UPLOAD_POLICY_SKIP:
             return
 
+        remote_snapshot = remote_state[0] if remote_state is not None else None
         files_to_upload, deleted = self._recipe_files_to_upload(ref, policy, cache_files, remote,
-                                                                remote_manifest, local_manifest)
+                                                                remote_manifest, local_manifest,
+                                                                remote_snapshot)
         return files_to_upload, deleted, cache_files, conanfile_path, t1, current_remote_name, layout
 
-    def _check_recipe_date(self, ref, remote, local_manifest):
-        try:
-            remote_recipe_manifest, ref = self._remote_manager.get_recipe_manifest(ref, remote)
-        except NotFoundException:
-            return  # First time uploading this package
+    def _check_recipe_date(self, ref, remote, local_manifest, remote_recipe_manifest):
+        if remote_recipe_manifest is None:
+            return
 
         if (remote_recipe_manifest != local_manifest and
                 remote_recipe_manifest.time > local_manifest.time):
@@ -225,8 +299,6 @@ class _PackagePreparator(object):
                                  "\n Remote date: %s\n Local date: %s" %
                                  (remote_recipe_manifest.time, local_manifest.time))
 
-        return remote_recipe_manifest
-
     def _print_manifest_information(self, remote_recipe_manifest, local_manifest, ref, remote):
         try:
             self._output.info("\n%s" % ("-"*40))
@@ -247,9 +319,11 @@ class _PackagePreparator(object):
         except Exception as e:
             self._output.info("Error printing information about the diff: %s" % str(e))
 
-    def _recipe_files_to_upload(self, ref, policy, files, remote, remote_manifest, local_manifest):
-        self._remote_manager.check_credentials(remote)
-        remote_snapshot = self._remote_manager.get_recipe_snapshot(ref, remote)
+    def _recipe_files_to_upload(self, ref, policy, files, remote, remote_manifest, local_manifest,
+                                remote_snapshot=None):
+        if remote_snapshot is None:
+            self._remote_manager.check_credentials(remote)
+            remote_snapshot = self._remote_manager.get_recipe_snapshot(ref, remote)
         if not remote_snapshot:
             return files, set()
 
@@ -311,16 +385,49 @@ class _PackagePreparator(object):
 
         return result
 
-    def prepare_package(self, pref, integrity_check, policy, p_remote):
+    def prepare_package(self, pref, integrity_check, policy, p_remote, remote_state=None):
+        """ The remote is checked before compressing the package, so nothing is compressed
+        if the remote already has it. The remote_state (snapshot, manifest) is requested to the
+        remote if not planned before
+        """
         pkg_layout = self._cache.package_layout(pref.ref)
-        cache_files = self._compress_package_files(pkg_layout, pref, integrity_check)
-
+        files, symlinks = self._package_files(pkg_layout, pref, integrity_check)
+
+        deleted = None
+        if policy != UPLOAD_POLICY_SKIP:
+            if remote_state is None:
+                self._remote_manager.check_credentials(p_remote)
+                remote_state = self.remote_package_state(pref, p_remote, policy)
+            local_manifest = FileTreeManifest.loads(load(files[CONAN_MANIFEST]))
+            upload, deleted = self._package_files_to_upload(policy, local_manifest, remote_state)
+            if not upload:
+                cache_files = {CONANINFO: files[CONANINFO],
+                               CONAN_MANIFEST: files[CONAN_MANIFEST]}
+                package_archive = _package_archive(pkg_layout, pref)
+                if package_archive:
+                    cache_files[os.path.basename(package_archive)] = package_archive
+                return None, None, cache_files
+
+        codec = self._package_codec(p_remote if policy != UPLOAD_POLICY_SKIP else None)
+        stale = []
+        if policy != UPLOAD_POLICY_SKIP:
+            # An archive of other format in the remote would be downloaded instead of the new one
+            remote_snapshot = remote_state[0] or {}
+            stale = [name for name in PACKAGE_ARCHIVE_NAMES
+                     if name in remote_snapshot and name != codec.archive_name]
+            if stale and not self._remote_manager.server_capable(p_remote, REMOVE_PACKAGE_FILES):
+                raise ConanException("Remote '{}' can't remove '{}' of package '{}' to replace "
+                                     "it with '{}' in the same package revision. Upload it with "
+                                     "the same 'core.upload:compression_format' or remove the "
+                                     "package from the remote first"
+                                     .format(p_remote.name, "', '".join(stale), pref.full_str(),
+                                             codec.archive_name))
+        cache_files = self._compress_package_files(pkg_layout, pref, files, symlinks, codec)
         if policy == UPLOAD_POLICY_SKIP:
             return None
-        files_to_upload, deleted = self._package_files_to_upload(pref, policy, cache_files, p_remote)
-        return files_to_upload, deleted, cache_files
+        return cache_files, deleted.union(stale), cache_files
 
-    def _compress_package_files(self, layout, pref, integrity_check):
+    def _package_files(self, layout, pref, integrity_check):
         t1 = time.time()
         if layout.package_is_dirty(pref):
             raise ConanException("Package %s is corrupted, aborting upload.\n"
@@ -328,11 +435,12 @@ class _PackagePreparator(object):
                                  % (pref, pref.ref, pref.id))
 
         download_pkg_folder = layout.download_package(pref)
-        package_tgz = os.path.join(download_pkg_folder, PACKAGE_TGZ_NAME)
-        if is_dirty(package_tgz):
-            self._output.warn("%s: Removing %s, marked as dirty" % (str(pref), PACKAGE_TGZ_NAME))
-            os.remove(package_tgz)
-            clean_dirty(package_tgz)
+        for archive_name in PACKAGE_ARCHIVE_NAMES:
+            package_archive = os.path.join(download_pkg_folder, archive_name)
+            if is_dirty(package_archive):
+                self._output.warn("%s: Removing %s, marked as dirty" % (str(pref), archive_name))
+                os.remove(package_archive)
+                clean_dirty(package_archive)
 
         # Get all the files in that directory
         # existing package, will use short paths if defined
@@ -348,18 +456,26 @@ class _PackagePreparator(object):
             self._package_integrity_check(pref, files, package_folder)
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
+        return files, symlinks
 
-        if not os.path.isfile(package_tgz):
+    def _compress_package_files(self, layout, pref, files, symlinks, codec):
+        """ An existing archive (like a downloaded one) is reused if it has the codec format
+        """
+        download_pkg_folder = layout.download_package(pref)
+        package_archive = _package_archive(layout, pref)
+        if package_archive and os.path.basename(package_archive) != codec.archive_name:
+            os.remove(package_archive)
+            package_archive = None
+        if package_archive is None:
             if self._output and not self._output.is_terminal:
                 self._output.writeln("Compressing package...")
             tgz_files = {f: path for f, path in files.items() if
                          f not in [CONANINFO, CONAN_MANIFEST]}
-            tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, download_pkg_folder,
-                                      self._output)
-            assert tgz_path == package_tgz
-            assert os.path.exists(package_tgz)
+            package_archive = compress_files(tgz_files, symlinks, codec.archive_name,
+                                             download_pkg_folder, self._output, codec=codec)
+            assert os.path.exists(package_archive)
 
-        return {PACKAGE_TGZ_NAME: package_tgz,
+        return {codec.archive_name: package_archive,
                 CONANINFO: files[CONANINFO],
                 CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
@@ -378,8 +494,9 @@ class _PackagePreparator(object):
                 self._output.warn("Mismatched checksum '%s' (manifest: %s, file: %s)"
                                   % (fname, h1, h2))
 
-            if PACKAGE_TGZ_NAME in files:
-                tgz_path = os.path.join(package_folder, PACKAGE_TGZ_NAME)
+            archive_name = find_package_archive(files)
+            if archive_name:
+                tgz_path = os.path.join(package_folder, archive_name)
                 try:
                     os.unlink(tgz_path)
                 except OSError:
@@ -392,22 +509,22 @@ class _PackagePreparator(object):
             self._output.rewrite_line("Package integrity OK!")
         self._output.writeln("")
 
-    def _package_files_to_upload(self, pref, policy, the_files, remote):
-        self._remote_manager.check_credentials(remote)
-        remote_snapshot = self._remote_manager.get_package_snapshot(pref, remote)
-
+    @staticmethod
+    def _package_files_to_upload(policy, local_manifest, remote_state):
+        """ :return: (upload needed, remote files to delete)
+        """
+        remote_snapshot, remote_manifest = remote_state
         if remote_snapshot and policy != UPLOAD_POLICY_FORCE:
             if not is_package_snapshot_complete(remote_snapshot):
-                return the_files, set()
-            remote_manifest, _ = self._remote_manager.get_package_manifest(pref, remote)
-            local_manifest = FileTreeManifest.loads(load(the_files["conanmanifest.txt"]))
+                return True, set()
             if remote_manifest == local_manifest:
-                return None, None
+                return False, None
             if policy == UPLOAD_POLICY_NO_OVERWRITE:
                 raise ConanException("Local package is different from the remote package. Forbidden"
                                      " overwrite.")
-        deleted = set(remote_snapshot).difference(the_files)
-        return the_files, deleted
+        deleted = set(remote_snapshot).difference(PACKAGE_ARCHIVE_NAMES + [CONANINFO,
+                                                                           CONAN_MANIFEST])
+        return True, deleted
 
 
 class CmdUpload(object):
@@ -433,6 +550,11 @@ class CmdUpload(object):
               "_package_files_to_upload". Can raise if policy is NOT overwrite
             - Do the actual upload
 
+    Before uploading, "_plan_upload" requests the snapshots and manifests of all the recipes
+    and binaries to the remotes (concurrently with parallel_upload), so only the missing or
+    different ones are compressed and transferred. With dry_run, the plan is printed and
+    nothing is uploaded.
+
     All the REVISIONS are local defined, not retrieved from servers
 
     This requires calling to the remote API methods:
@@ -451,11 +573,12 @@ class CmdUpload(object):
         self._hook_manager = hook_manager
         self._upload_thread_pool = None
         self._exceptions_list = []
+        self._remote_states = {}  # {(remote name, ref or pref): (snapshot, manifest)}
         self._preparator = _PackagePreparator(cache, remote_manager, hook_manager, self._output)
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
-               policy=None, query=None, parallel_upload=False):
+               policy=None, query=None, parallel_upload=False, dry_run=False):
         t1 = time.time()
 
         collecter = _UploadCollecter(self._cache, self._user_io, self._output, self._loader)
@@ -464,6 +587,12 @@ class CmdUpload(object):
 
         if parallel_upload:
             self._user_io.disable_input()
+
+        if policy != UPLOAD_POLICY_SKIP:
+            self._remote_states = self._plan_upload(refs_by_remote, policy, parallel_upload)
+        if dry_run:
+            self._print_plan(refs_by_remote, policy)
+            return
         self._upload_thread_pool = ThreadPool(
             cpu_count() if parallel_upload else 1)
 
@@ -497,6 +626,113 @@ class CmdUpload(object):
 
         logger.debug("UPLOAD: Time manager upload: %f" % (time.time() - t1))
 
+    def _plan_upload(self, refs_by_remote, policy, parallel_upload=False):
+        """ Requests to the remotes the snapshot and manifest of all the recipes and packages to
+        upload, concurrently if parallel_upload. If it fails for some of them, the upload will
+        request it again and report the error
+        :return: {(remote name, ref or pref): (remote snapshot, remote manifest)}
+        """
+        items = []
+        batch_states = {}
+        for remote, refs in refs_by_remote.items():
+            # Authenticate before the concurrent requests, it can be interactive
+            try:
+                self._remote_manager.check_credentials(remote)
+            except ConanException:
+                continue
+            remote_refs = [ref for ref, _, _ in refs]
+            remote_prefs = [pref for _, _, prefs in refs for pref in prefs]
+            try:
+                states = self._preparator.remote_states(remote_refs, remote_prefs, remote, policy)
+            except Exception as e:
+                logger.debug("UPLOAD: Cannot plan in batch the upload to %s: %s"
+                             % (remote.name, str(e)))
+                states = {}
+            for ref, state in states.items():
+                batch_states[(remote.name, ref)] = state
+            items.extend((remote, ref) for ref in remote_refs + remote_prefs if ref not in states)
+
+        def remote_state(item):
+            remote, ref = item
+            try:
+                if isinstance(ref, PackageReference):
+                    state = self._preparator.remote_package_state(ref, remote, policy)
+                else:
+                    state = self._preparator.remote_recipe_state(ref, remote, policy)
+            except Exception as e:
+                logger.debug("UPLOAD: Cannot plan the upload of %s: %s" % (repr(ref), str(e)))
+                return None
+            return (remote.name, ref), state
+
+        if not items:
+            return batch_states
+        if not parallel_upload:
+            states = [remote_state(item) for item in items]
+        else:
+            pool = ThreadPool(cpu_count())
+            try:
+                states = pool.map(remote_state, items)
+            finally:
+                pool.close()
+                pool.join()
+        batch_states.update(state for state in states if state is not None)
+        return batch_states
+
+    def _print_plan(self, refs_by_remote, policy):
+        total_recipes, total_packages, total_size = 0, 0, 0
+        for remote, refs in refs_by_remote.items():
+            self._output.info("Upload plan to remote '{}':".format(remote.name))
+            for ref, _, prefs in refs:
+                layout = self._cache.package_layout(ref)
+                local_manifest = FileTreeManifest.load(layout.export())
+                state = self._remote_states.get((remote.name, ref))
+                status, upload = self._plan_status(state, local_manifest, policy, recipe=True)
+                if upload:
+                    size = _files_size([layout.export(), layout.export_sources()])
+                    total_recipes += 1
+                    total_size += size
+                    status = "{}, {}".format(status, human_size(size))
+                self._output.info("  {}: {}".format(str(ref), status))
+
+                for pref in prefs:
+                    package_folder = layout.package(pref)
+                    local_manifest = FileTreeManifest.load(package_folder)
+                    state = self._remote_states.get((remote.name, pref))
+                    status, upload = self._plan_status(state, local_manifest, policy)
+                    if upload:
+                        package_tgz = _package_archive(layout, pref)
+                        if package_tgz:
+                            size = os.path.getsize(package_tgz)
+                            size += _files_size([package_folder], only=(CONANINFO, CONAN_MANIFEST))
+                        else:  # Not compressed yet, the uncompressed size
+                            size = _files_size([package_folder])
+                        total_packages += 1
+                        total_size += size
+                        status = "{}, {}".format(status, human_size(size))
+                    self._output.info("  {}: {}".format(str(pref), status))
+        self._output.info("Would upload {} recipes and {} packages, {}"
+                          .format(total_recipes, total_packages, human_size(total_size)))
+
+    @staticmethod
+    def _plan_status(state, local_manifest, policy, recipe=False):
+        """ :return: (description of what would be done, True if it would be uploaded)
+        """
+        if state is None:
+            return "Upload, the remote couldn't be checked", True
+        remote_snapshot, remote_manifest = state
+        if not remote_snapshot or policy == UPLOAD_POLICY_FORCE:
+            return "Upload", True
+        if remote_manifest is None:
+            return "Upload, incomplete in the remote", True
+        if remote_manifest == local_manifest:
+            return "Skip, up to date", False
+        if recipe and remote_manifest.time > local_manifest.time:
+            return "Error, the remote recipe is newer", False
+        if policy == UPLOAD_POLICY_NO_OVERWRITE or \
+                (recipe and policy == UPLOAD_POLICY_NO_OVERWRITE_RECIPE):
+            return "Error, forbidden overwrite", False
+        return "Upload, different in the remote", True
+
     def _upload_ref(self, conanfile, ref, prefs, retry, retry_wait, integrity_check, policy,
                     recipe_remote, upload_recorder, remotes):
         """ Uploads the recipes and binaries identified by ref
@@ -552,7 +788,9 @@ class CmdUpload(object):
                                        remote=recipe_remote)
 
     def _upload_recipe(self, ref, conanfile, retry, retry_wait, policy, remote, remotes):
-        prep = self._preparator.prepare_recipe(ref, conanfile, remote, remotes, policy)
+        remote_state = self._remote_states.get((remote.name, ref))
+        prep = self._preparator.prepare_recipe(ref, conanfile, remote, remotes, policy,
+                                               remote_state)
 
         if policy == UPLOAD_POLICY_SKIP:
             return ref
@@ -591,7 +829,9 @@ class CmdUpload(object):
                                    remote=p_remote)
 
         t1 = time.time()
-        prep = self._preparator.prepare_package(pref, integrity_check, policy, p_remote)
+        remote_state = self._remote_states.get((p_remote.name, pref))
+        prep = self._preparator.prepare_package(pref, integrity_check, policy, p_remote,
+                                                remote_state)
         if policy == UPLOAD_POLICY_SKIP:
             return None
         files_to_upload, deleted, cache_files = prep
@@ -610,17 +850,29 @@ class CmdUpload(object):
 
         logger.debug("UPLOAD: Time uploader upload_package: %f" % (time.time() - t1))
 
-        # Update the package metadata
-        checksums = calc_files_checksum(cache_files)
+        # Update the package metadata, the checksums only if it has been compressed
+        compressed = find_package_archive(cache_files) is not None
+        checksums = calc_files_checksum(cache_files) if compressed else None
         with pkg_layout.update_metadata() as metadata:
             cur_package_remote = metadata.packages[pref.id].remote
             if not cur_package_remote:
                 metadata.packages[pref.id].remote = p_remote.name
-            metadata.packages[pref.id].checksums = checksums
+            if checksums is not None:
+                metadata.packages[pref.id].checksums = checksums
 
         return pref
 
 
+def _files_size(folders, only=None):
+    size = 0
+    for folder in folders:
+        files, _ = gather_files(folder)
+        for name, path in files.items():
+            if only is None or name in only:
+                size += os.path.getsize(path)
+    return size
+
+
 
 
 
@@ -633,38 +885,27 @@ class CmdUpload(object):
 
 
 
-def compress_files(files, symlinks, name, dest_dir, output=None):
+def compress_files(files, symlinks, name, dest_dir, output=None, codec=GZIP_CODEC):
     t1 = time.time()
     # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
     with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
-
-        for filename, dest in sorted(symlinks.items()):
-            info = tarfile.TarInfo(name=filename)
-            info.type = tarfile.SYMTYPE
-            info.linkname = dest
-            info.size = 0  # A symlink shouldn't have size
-            tgz.addfile(tarinfo=info)
-
-        mask = ~(stat.S_IWOTH | stat.S_IWGRP)
         with progress_bar.iterate_list_with_progress(sorted(files.items()), output,
                                                      "Compressing %s" % name) as pg_file_list:
-            for filename, abs_path in pg_file_list:
-                info = tarfile.TarInfo(name=filename)
-                info.size = os.stat(abs_path).st_size
-                info.mode = os.stat(abs_path).st_mode & mask
-                if os.path.islink(abs_path):
-                    info.type = tarfile.SYMTYPE
-                    info.size = 0  # A symlink shouldn't have size
-                    info.linkname = os.readlink(abs_path)  # @UndefinedVariable
-                    tgz.addfile(tarinfo=info)
-                else:
-                    with open(abs_path, 'rb') as file_handler:
-                        tgz.addfile(tarinfo=info, fileobj=file_handler)
-        tgz.close()
+            write_archive(codec, tgz_handle, name, pg_file_list, symlinks)
 
     duration = time.time() - t1
     log_compressed_files(files, duration, tgz_path)
 
     return tgz_path
+
+
+def _package_archive(layout, pref):
+    """ the path of the existing archive of the package in the download folder, or None
+    """
+    download_pkg_folder = layout.download_package(pref)
+    for archive_name in PACKAGE_ARCHIVE_NAMES:
+        package_archive = os.path.join(download_pkg_folder, archive_name)
+        if os.path.isfile(package_archive):
+            return package_archive
+    return None
@@ -23,7 +23,8 @@ from conans.model.ref import ConanFileReference, PackageReference, get_reference
     check_valid_ref
 from conans.model.conf import BUILT_IN_CONFS
 from conans.util.config_parser import get_bool_from_text
-from conans.util.files import exception_message_safe
+from conans.util.dates import timedelta_from_text
+from conans.util.files import exception_message_safe, parse_size
 from conans.util.files import save
 from conans.util.log import logger
 from conans.assets import templates
@@ -1211,6 +1212,47 @@ class Command(object):
                                   packages=packages, builds=args.builds, src=args.src,
                                   force=args.force, remote_name=args.remote, outdated=args.outdated)
 
+    def cache(self, *args):
+        """
+        Manages the Conan caches: cleans the download cache, and garbage collects the
+        least recently used packages of the local cache.
+        """
+        parser = argparse.ArgumentParser(description=self.cache.__doc__,
+                                         prog="conan cache",
+                                         formatter_class=SmartFormatter)
+        subparsers = parser.add_subparsers(dest='subcommand', help='sub-command help')
+        subparsers.required = True
+
+        clean_downloads_subparser = subparsers.add_parser('clean-downloads',
+                                                          help='Remove the least recently used '
+                                                               'files of the download cache')
+        clean_downloads_subparser.add_argument("-s", "--max-size", action=OnceArgument,
+                                               help="Size to keep, like '10GB'. By default the "
+                                                    "'storage.download_cache_max_size' value, "
+                                                    "or remove everything if not defined")
+        gc_subparser = subparsers.add_parser('gc', help='Remove the least recently used '
+                                                        'packages, build and source folders of '
+                                                        'the local cache')
+        gc_subparser.add_argument("-s", "--max-size", action=OnceArgument,
+                                  help="Remove the least recently used items until packages, "
+                                       "builds and sources use less than this size, like '50GB'")
+        gc_subparser.add_argument("-a", "--max-age", action=OnceArgument,
+                                  help="Remove the items not used in this time, like '4w' "
+                                       "(units: s, m, h, d, w)")
+        gc_subparser.add_argument("--dry-run", default=False, action="store_true",
+                                  help="Only print what would be removed")
+        args = parser.parse_args(*args)
+
+        try:
+            max_size = parse_size(args.max_size)
+        except ValueError as e:
+            raise ConanException(str(e))
+        if args.subcommand == "clean-downloads":
+            self._conan.clean_download_cache(max_size=max_size)
+        elif args.subcommand == "gc":
+            max_age = timedelta_from_text(args.max_age) if args.max_age else None
+            self._conan.cache_gc(max_size=max_size, max_age=max_age, dry_run=args.dry_run)
+
     def copy(self, *args):
         """
         Copies conan recipes and packages to another user/channel.
@@ -1506,6 +1548,9 @@ class Command(object):
                                  'The default number of launched threads is set to the value of '
                                  'cpu_count and can be configured using the CONAN_CPU_COUNT '
                                  'environment variable or defining cpu_count in conan.conf')
+        parser.add_argument("--dry-run", action='store_true', default=False,
+                            help='Do not upload anything, print which recipes and packages would '
+                                 'be uploaded, comparing them with the remote, and their size')
 
         args = parser.parse_args(*args)
 
@@ -1540,6 +1585,9 @@ class Command(object):
         if args.no_overwrite and args.skip_upload:
             raise ConanException("'--skip-upload' argument cannot be used together "
                                  "with '--no-overwrite'")
+        if args.dry_run and args.skip_upload:
+            raise ConanException("'--dry-run' argument cannot be used together "
+                                 "with '--skip-upload'")
 
         self._warn_python_version()
 
@@ -1561,7 +1609,7 @@ class Command(object):
                                       all_packages=args.all, policy=policy,
                                       confirm=args.confirm, retry=args.retry,
                                       retry_wait=args.retry_wait, integrity_check=args.check,
-                                      parallel_upload=args.parallel)
+                                      parallel_upload=args.parallel, dry_run=args.dry_run)
 
         except ConanException as exc:
             info = exc.info
@@ -2085,7 +2133,8 @@ class Command(object):
                 ("Package development commands", ("source", "build", "package", "editable",
                                                   "workspace")),
                 ("Misc commands", ("profile", "remote", "user", "imports", "copy", "remove",
-                                   "alias", "download", "inspect", "help", "lock", "frogarian"))]
+                                   "cache", "alias", "download", "inspect", "help", "lock",
+                                   "frogarian"))]
 
         def check_all_commands_listed():
             """Keep updated the main directory, raise if don't"""
@@ -10,6 +10,7 @@ import conans
 from conans import __version__ as client_version
 from conans.client.cache.cache import ClientCache
 from conans.client.cmd.build import cmd_build
+from conans.client.cmd.cache import cmd_clean_download_cache, cmd_cache_gc
 from conans.client.cmd.create import create
 from conans.client.cmd.download import download
 from conans.client.cmd.export import cmd_export, export_alias
@@ -22,6 +23,7 @@ from conans.client.cmd.uploader import CmdUpload
 from conans.client.cmd.user import user_set, users_clean, users_list, token_present
 from conans.client.conanfile.package import run_package_method
 from conans.client.conf.required_version import check_required_conan_version
+from conans.client.downloaders.cached_file_downloader import CachedFileDownloader
 from conans.client.generators import GeneratorManager
 from conans.client.graph.graph import RECIPE_EDITABLE
 from conans.client.graph.graph_binaries import GraphBinariesAnalyzer
@@ -32,6 +34,7 @@ from conans.client.graph.python_requires import ConanPythonRequire, PyRequireLoa
 from conans.client.graph.range_resolver import RangeResolver
 from conans.client.hook_manager import HookManager
 from conans.client.importer import run_imports, undo_imports
+from conans.client.install_fingerprint import InstallFingerprint
 from conans.client.installer import BinaryInstaller
 from conans.client.loader import ConanFileLoader
 from conans.client.manager import deps_install
@@ -64,9 +67,11 @@ from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
 from conans.search.search import search_recipes
 from conans.tools import set_global_instances
 from conans.util.conan_v2_mode import conan_v2_error
-from conans.util.files import exception_message_safe, mkdir, save_files, load, save
+from conans.util.files import exception_message_safe, mkdir, save_files, load, save, \
+    file_digests_registry
 from conans.util.log import configure_logger
-from conans.util.tracer import log_command, log_exception
+from conans.util.tracer import log_command, log_exception, log_download_cache_stats, \
+    log_http_connections
 
 default_manifest_folder = '.conan_manifests'
 
@@ -86,11 +91,14 @@ def api_method(f):
             old_curdir = None
         old_output = api.user_io.out
         quiet_output = ConanOutput(StringIO(), color=api.color) if quiet else None
+        download_cache_stats = CachedFileDownloader.stats
+        download_cache_stats.reset()
         try:
             api.create_app(quiet_output=quiet_output)
             log_command(f.__name__, kwargs)
             with environment_append(api.app.cache.config.env_vars):
-                return f(api, *args, **kwargs)
+                with file_digests_registry.enabled():
+                    return f(api, *args, **kwargs)
         except Exception as exc:
             if quiet_output:
                 old_output.write(quiet_output._stream.getvalue())
@@ -102,6 +110,10 @@ def api_method(f):
                 pass
             raise
         finally:
+            if download_cache_stats.hits or download_cache_stats.misses:
+                log_download_cache_stats(download_cache_stats)
+            if api.app is not None:
+                log_http_connections(api.app.requester.connections_stats())
             if old_curdir:
                 os.chdir(old_curdir)
     return wrapper
@@ -193,7 +205,8 @@ class ConanApp(object):
         self.runner = runner or ConanRunner(self.config.print_commands_to_output,
                                             self.config.generate_run_log_file,
                                             self.config.log_run_to_output,
-                                            self.out)
+                                            self.out,
+                                            self.config.log_run_to_output_max_rate)
 
         self.proxy = ConanProxy(self.cache, self.out, self.remote_manager)
         self.range_resolver = RangeResolver(self.cache, self.remote_manager)
@@ -607,6 +620,23 @@ class ConanAPIV1(object):
                 output_folder = _make_abs_path(output_folder, cwd)
             conanfile_path = _get_conanfile_path(path, cwd, py=None)
 
+            fingerprint = InstallFingerprint(self.app.cache, install_folder)
+            incremental = InstallFingerprint.enabled(self.app.cache, update, build,
+                                                     manifest_folder, lockfile_out)
+            if incremental:
+                fingerprint.compute_inputs(conanfile_path, graph_info, lockfile,
+                                           arguments=[name, version, user, channel, build,
+                                                      remote_name, sorted(generators or []),
+                                                      no_imports, output_folder,
+                                                      require_overrides])
+                result = fingerprint.load()
+                if result is not None:
+                    self.app.out.info("Nothing changed since the previous install in '%s', "
+                                      "skipping it" % install_folder)
+                    return result
+            # The files of the previous install will be overwritten, its fingerprint is not valid
+            fingerprint.remove()
+
             remotes = self.app.load_remotes(remote_name=remote_name, update=update)
             deps_install(app=self.app,
                          ref_or_path=conanfile_path,
@@ -624,14 +654,18 @@ class ConanAPIV1(object):
                          no_imports=no_imports,
                          recorder=recorder,
                          require_overrides=require_overrides,
-                         conanfile_path=os.path.dirname(conanfile_path))
+                         conanfile_path=os.path.dirname(conanfile_path),
+                         install_fingerprint=fingerprint if incremental else None)
 
             if lockfile_out:
                 lockfile_out = _make_abs_path(lockfile_out, cwd)
                 graph_lock_file = GraphLockFile(graph_info.profile_host, graph_info.profile_build,
                                                 graph_info.graph_lock)
                 graph_lock_file.save(lockfile_out)
-            return recorder.get_info(self.app.config.revisions_enabled)
+            result = recorder.get_info(self.app.config.revisions_enabled)
+            if incremental:
+                fingerprint.save(result)
+            return result
         except ConanException as exc:
             recorder.error = True
             exc.info = recorder.get_info(self.app.config.revisions_enabled)
@@ -1001,7 +1035,7 @@ class ConanAPIV1(object):
     @api_method
     def upload(self, pattern, package=None, remote_name=None, all_packages=False, confirm=False,
                retry=None, retry_wait=None, integrity_check=False, policy=None, query=None,
-               parallel_upload=False):
+               parallel_upload=False, dry_run=False):
         """ Uploads a package recipe and the generated binary packages to a specified remote
         """
         upload_recorder = UploadRecorder()
@@ -1011,7 +1045,7 @@ class ConanAPIV1(object):
         try:
             uploader.upload(pattern, remotes, upload_recorder, package, all_packages, confirm,
                             retry, retry_wait, integrity_check, policy, query=query,
-                            parallel_upload=parallel_upload)
+                            parallel_upload=parallel_upload, dry_run=dry_run)
             return upload_recorder.get_info()
         except ConanException as exc:
             upload_recorder.error = True
@@ -1145,6 +1179,22 @@ class ConanAPIV1(object):
     def remove_locks(self):
         self.app.cache.remove_locks()
 
+    @api_method
+    def clean_download_cache(self, max_size=None):
+        """ max_size: in bytes, defaults to 'storage.download_cache_max_size' or 0 (remove all)
+        """
+        config = self.app.config
+        if max_size is None:
+            max_size = config.download_cache_max_size or 0
+        return cmd_clean_download_cache(config.download_cache, max_size, self.app.out)
+
+    @api_method
+    def cache_gc(self, max_size=None, max_age=None, dry_run=False):
+        """ max_size: in bytes, max_age: timedelta
+        """
+        return cmd_cache_gc(self.app.cache, self.app.out, max_size=max_size, max_age=max_age,
+                            dry_run=dry_run)
+
     @api_method
     def profile_list(self):
         return cmd_profile_list(self.app.cache.profiles_path, self.app.out)
@@ -1,5 +1,7 @@
 import json
 import os
+import types
+import uuid
 from collections import OrderedDict
 
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL
@@ -12,11 +14,49 @@ from conans.paths import CONAN_MANIFEST
 from conans.paths.package_layouts.package_editable_layout import PackageEditableLayout
 from conans.search.binary_html_table import html_binary_graph
 from conans.util.dates import iso8601_to_str, timestamp_to_str
-from conans.util.files import save
+from conans.util.files import mkdir, save
 from conans import __version__ as client_version
 from conans.util.misc import make_tuple
 
 
+def _date_handler(obj):
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    else:
+        raise TypeError("Unserializable object {} of type {}".format(obj, type(obj)))
+
+
+def _json_chunks(data, default=None):
+    """ The text of json.dumps(data) in chunks. A generator is written as a json list while it
+    is iterated, one item at a time, so the whole document is never in memory
+    """
+    if isinstance(data, types.GeneratorType):
+        yield "["
+        for i, item in enumerate(data):
+            yield (", " if i else "") + json.dumps(item, default=default)
+        yield "]"
+    else:
+        for chunk in json.JSONEncoder(default=default).iterencode(data):
+            yield chunk
+
+
+def _save_json(path, data, default=None):
+    """ save(path, json.dumps(data)) without building the json string in memory. It is written
+    to a temporary file renamed when complete, so an error while iterating the data doesn't
+    leave a truncated file
+    """
+    mkdir(os.path.dirname(path))
+    tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for chunk in _json_chunks(data, default=default):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 class CommandOutputer(object):
 
     def __init__(self, output, cache):
@@ -73,14 +113,7 @@ class CommandOutputer(object):
         cwd = os.path.abspath(cwd or os.getcwd())
         if not os.path.isabs(json_output):
             json_output = os.path.join(cwd, json_output)
-
-        def date_handler(obj):
-            if hasattr(obj, 'isoformat'):
-                return obj.isoformat()
-            else:
-                raise TypeError("Unserializable object {} of type {}".format(obj, type(obj)))
-
-        save(json_output, json.dumps(info, default=date_handler))
+        _save_json(json_output, info, default=_date_handler)
         self._output.writeln("")
         self._output.info("JSON file created at '%s'" % json_output)
 
@@ -99,14 +132,13 @@ class CommandOutputer(object):
         self._output.info(", ".join(str(n) for n in nodes_to_build))
 
     def _handle_json_output(self, data, json_output, cwd):
-        json_str = json.dumps(data)
-
         if json_output is True:
-            self._output.write(json_str)
+            for chunk in _json_chunks(data):
+                self._output.write(chunk)
         else:
             if not os.path.isabs(json_output):
                 json_output = os.path.join(cwd, json_output)
-            save(json_output, json.dumps(data))
+            _save_json(json_output, data)
             self._output.writeln("")
             self._output.info("JSON file created at '%s'" % json_output)
 
@@ -115,14 +147,15 @@ class CommandOutputer(object):
         self._handle_json_output(data, json_output, cwd)
 
     def _grab_info_data(self, deps_graph, grab_paths):
-        """ Convert 'deps_graph' into consumible information for json and cli """
+        """ Convert 'deps_graph' into consumible information for json and cli, yielding the
+        data of every node, so it is printed or written while the next ones are computed
+        """
         compact_nodes = OrderedDict()
         for node in sorted(deps_graph.nodes):
             compact_nodes.setdefault((node.ref, node.package_id), []).append(node)
 
         build_time_nodes = deps_graph.build_time_nodes()
         remotes = self._cache.registry.load_remotes()
-        ret = []
 
         node_times = self._read_dates(deps_graph)
         for (ref, package_id), list_nodes in compact_nodes.items():
@@ -227,9 +260,7 @@ class CommandOutputer(object):
                 item_data["build_requires"] = [repr(d.ref.copy_clear_rev())
                                                for d in build_requires]
 
-            ret.append(item_data)
-
-        return ret
+            yield item_data
 
     def info(self, deps_graph, only, package_filter, show_paths):
         data = self._grab_info_data(deps_graph, grab_paths=show_paths)
@@ -2,7 +2,6 @@ import logging
 import os
 import textwrap
 
-from jinja2 import Template
 from six.moves.configparser import ConfigParser, NoSectionError
 
 from conans.errors import ConanException
@@ -10,9 +9,9 @@ from conans.model.env_info import unquote
 from conans.paths import DEFAULT_PROFILE_NAME, conan_expand_user, CACERT_FILE
 from conans.util.dates import timedelta_from_text
 from conans.util.env_reader import get_env
-from conans.util.files import load
+from conans.util.files import load, parse_size
 
-_t_default_settings_yml = Template(textwrap.dedent("""
+_t_default_settings_yml = textwrap.dedent("""
     # Only for cross building, 'os_build/arch_build' is the system that runs Conan
     os_build: [Windows, WindowsStore, Linux, Macos, FreeBSD, SunOS, AIX, VxWorks]
     arch_build: [x86, x86_64, ppc32be, ppc32, ppc64le, ppc64, armv5el, armv5hf, armv6, armv7, armv7hf, armv7s, armv7k, armv8, armv8_32, armv8.3, sparc, sparcv9, mips, mips64, avr, s390, s390x, sh4le, e2k-v2, e2k-v3, e2k-v4, e2k-v5, e2k-v6, e2k-v7]
@@ -168,14 +167,15 @@ _t_default_settings_yml = Template(textwrap.dedent("""
 
     cppstd: [None, 98, gnu98, 11, gnu11, 14, gnu14, 17, gnu17, 20, gnu20, 23, gnu23]  # Deprecated, use compiler.cppstd
 
-    """))
+    """)
 
 
 def get_default_settings_yml():
-    return _t_default_settings_yml.render()
+    from jinja2 import Template
+    return Template(_t_default_settings_yml).render()
 
 
-_t_default_client_conf = Template(textwrap.dedent("""
+_t_default_client_conf = textwrap.dedent("""
     [log]
     run_to_output = True        # environment CONAN_LOG_RUN_TO_OUTPUT
     run_to_file = False         # environment CONAN_LOG_RUN_TO_FILE
@@ -257,11 +257,12 @@ _t_default_client_conf = Template(textwrap.dedent("""
     [hooks]    # environment CONAN_HOOKS
     attribute_checker
 
-    """))
+    """)
 
 
 def get_default_client_conf(force_v1=False):
-    return _t_default_client_conf.render(default_profile=DEFAULT_PROFILE_NAME)
+    from jinja2 import Template
+    return Template(_t_default_client_conf).render(default_profile=DEFAULT_PROFILE_NAME)
 
 
 class ConanClientConfigParser(ConfigParser, object):
@@ -277,6 +278,7 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_LOGGING_LEVEL", "level", logging.CRITICAL),
             ("CONAN_TRACE_FILE", "trace_file", None),
             ("CONAN_PRINT_RUN_COMMANDS", "print_run_commands", False),
+            ("CONAN_LOG_RUN_TO_OUTPUT_MAX_RATE", "run_to_output_max_rate", None),
         ],
         "general": [
             ("CONAN_COMPRESSION_LEVEL", "compression_level", 9),
@@ -495,6 +497,17 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return None
 
+    @property
+    def download_cache_max_size(self):
+        try:
+            max_size = self.get_item("storage.download_cache_max_size")
+        except ConanException:
+            return None
+        try:
+            return parse_size(max_size) if max_size else None
+        except ValueError as e:
+            raise ConanException("Invalid 'storage.download_cache_max_size': {}".format(e))
+
     @property
     def scm_to_conandata(self):
         try:
@@ -745,6 +758,20 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return True
 
+    @property
+    def log_run_to_output_max_rate(self):
+        max_rate = os.getenv("CONAN_LOG_RUN_TO_OUTPUT_MAX_RATE")
+        if not max_rate:
+            try:
+                max_rate = self.get_item("log.run_to_output_max_rate")
+            except ConanException:
+                return None
+
+        try:
+            return int(max_rate) or None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'run_to_output_max_rate'")
+
     @staticmethod
     def get_log_level_by_name(level_name):
         levels = {
@@ -0,0 +1,90 @@
+""" Thin client of the conan daemon: it sends the command line, the current folder and the
+environment of the "conan" invocation to the daemon, and writes the output of the command as it
+arrives. It doesn't import the conan client, so the invocation doesn't pay for it.
+
+The messages in the socket are JSON objects, each one preceded by its length (4 bytes, big
+endian). The request is {"args", "cwd", "env", "color", "isatty", "version"}, the responses
+{"out": text} and {"err": text}, and finally {"exit": code} or {"fallback": reason} if the
+command has to run in the invocation process instead of the daemon.
+"""
+import json
+import os
+import socket
+import struct
+import sys
+
+from conans import __version__ as client_version
+from conans.cli.exit_codes import ERROR_GENERAL, USER_CTRL_C
+
+_HEADER = struct.Struct(">I")
+
+
+def send_message(sock, message):
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _receive_exactly(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def receive_message(sock):
+    """ the next message, or None if the connection was closed
+    """
+    header = _receive_exactly(sock, _HEADER.size)
+    if header is None:
+        return None
+    data = _receive_exactly(sock, _HEADER.unpack(header)[0])
+    if data is None:
+        return None
+    return json.loads(data.decode("utf-8"))
+
+
+def run_in_daemon(socket_path, args):
+    """ runs the command in the daemon listening in socket_path, returning its exit code, or None
+    if it has to run in this process: there is no daemon or it can't run it
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except (OSError, socket.error):
+            return None  # The daemon is not running
+
+        from conans.client.output import colorama_initialize
+        isatty = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+        send_message(sock, {"args": list(args),
+                            "cwd": os.getcwd(),
+                            "env": dict(os.environ),
+                            "color": colorama_initialize(),
+                            "isatty": isatty,
+                            "version": client_version})
+        try:
+            while True:
+                message = receive_message(sock)
+                if message is None:
+                    sys.stderr.write("ERROR: The conan daemon closed the connection\n")
+                    return ERROR_GENERAL  # The daemon was stopped while running the command
+                if "out" in message:
+                    sys.stdout.write(message["out"])
+                    sys.stdout.flush()
+                elif "err" in message:
+                    sys.stderr.write(message["err"])
+                    sys.stderr.flush()
+                elif "fallback" in message:
+                    return None
+                else:
+                    return message["exit"]
+        except KeyboardInterrupt:
+            print('You pressed Ctrl+C!')
+            return USER_CTRL_C
+    finally:
+        sock.close()
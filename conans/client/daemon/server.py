@@ -0,0 +1,188 @@
+""" The conan daemon: a process listening in a Unix domain socket that runs the commands of the
+"conan" invocations with CONAN_DAEMON_SOCKET defined, so they don't pay for the python startup,
+the imports, the migrations checks and the TLS handshakes with the remotes. The commands run
+one at a time, in the folder and with the environment of the invocation, and every command has
+its own ConanApp, as in a new process: only the state that doesn't depend on the command is
+kept warm (modules, HTTP connections, parsed settings.yml, version ranges)
+
+If the client is gone (Ctrl+C), the command runs to completion and its output is discarded. It
+is not interrupted: an exception raised at any point of the command could leave locks acquired
+and the state kept for the next commands half updated
+"""
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+
+from conans import __version__ as client_version
+from conans.cli.exit_codes import ERROR_GENERAL, ERROR_MIGRATION
+from conans.client.command import Command
+from conans.client.conan_api import Conan
+from conans.client.daemon.client import receive_message, send_message
+from conans.client.output import ConanOutput, colorama_initialize
+from conans.client.rest.conan_requester import ConanRequester
+from conans.client.userio import UserIO
+from conans.errors import ConanException, ConanMigrationError
+from conans.paths import get_conan_user_home
+
+
+class _ClientStream(object):
+    """ The stdout or stderr of the command, sent to the client as it is written. If the client
+    is gone, the output is discarded and the command finishes anyway
+    """
+    def __init__(self, connection, channel, isatty):
+        self._connection = connection
+        self._channel = channel
+        self._isatty = isatty
+
+    def write(self, data):
+        if not data or self._connection.closed:
+            return
+        try:
+            send_message(self._connection.socket, {self._channel: data})
+        except (OSError, socket.error):
+            self._connection.closed = True
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return self._isatty
+
+
+class _Connection(object):
+    def __init__(self, sock):
+        self.socket = sock
+        self.closed = False
+
+
+def _peer_uid(sock):
+    """ The user id of the process at the other end of the socket, None if it can't be known
+    """
+    if not hasattr(socket, "SO_PEERCRED"):  # Linux only, the socket permissions still apply
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+class _IsolatedCommand(object):
+    """ The process state of a command: the current folder, the environment, sys.path, the
+    recipe modules and sys.stdout and sys.stderr (the output not written with the ConanOutput,
+    like the argparse help), restored after it
+    """
+    def __init__(self, cwd, env, stdout, stderr):
+        self._cwd = cwd
+        self._env = env
+        self._stdout = stdout
+        self._stderr = stderr
+
+    def __enter__(self):
+        self._old_cwd = os.getcwd()
+        self._old_env = os.environ.copy()
+        self._old_path = sys.path[:]
+        self._old_modules = set(sys.modules)
+        self._old_streams = sys.stdout, sys.stderr
+        os.environ.clear()
+        os.environ.update(self._env)
+        os.chdir(self._cwd)
+        sys.stdout, sys.stderr = self._stdout, self._stderr
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        sys.stdout, sys.stderr = self._old_streams
+        os.chdir(self._old_cwd)
+        os.environ.clear()
+        os.environ.update(self._old_env)
+        sys.path[:] = self._old_path
+        # The recipe modules, named after an uuid by the loader, are not reused
+        for name in set(sys.modules).difference(self._old_modules):
+            if not name.split(".")[0].isidentifier():
+                sys.modules.pop(name, None)
+
+
+class ConanDaemon(object):
+
+    def __init__(self, socket_path, cache_folder=None, output=None):
+        self._socket_path = socket_path
+        self._out = output or ConanOutput(sys.stdout, sys.stderr, colorama_initialize())
+        # Runs the migrations, the commands only check them
+        conan_api = Conan(cache_folder=cache_folder, output=self._out)
+        self._cache_folder = conan_api.cache_folder
+        self._stopped = False
+
+    def serve_forever(self):
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)  # From a previous daemon
+        daemon = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                daemon.handle(self.request)
+
+        # Not threaded, the commands change the process state and run one at a time. Only the
+        # user running the daemon can connect, the commands run with its permissions
+        old_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(self._socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self._socket_path, stat.S_IRUSR | stat.S_IWUSR)
+        server.timeout = 0.5  # To check if it has been stopped
+        # The HTTP sessions are kept between commands, with their connections to the remotes
+        ConanRequester.sessions = {}
+        self._out.info("Conan daemon listening in '%s'" % self._socket_path)
+        try:
+            while not self._stopped:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            ConanRequester.sessions = None
+            server.server_close()
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+            self._out.info("Conan daemon stopped")
+
+    def stop(self):
+        """ stops serving after the running command, if any
+        """
+        self._stopped = True
+
+    def handle(self, sock):
+        if _peer_uid(sock) not in (None, os.getuid()):
+            return
+        request = receive_message(sock)
+        if request is None:
+            return
+        if request.get("version") != client_version:
+            send_message(sock, {"fallback": "Conan version %s, the daemon is %s"
+                                            % (request.get("version"), client_version)})
+            return
+
+        connection = _Connection(sock)
+        stdout = _ClientStream(connection, "out", request["isatty"])
+        stderr = _ClientStream(connection, "err", request["isatty"])
+        out = ConanOutput(stdout, stderr, color=request["color"])
+        with _IsolatedCommand(request["cwd"], request["env"], stdout, stderr):
+            cache_folder = os.path.join(get_conan_user_home(), ".conan")
+            if cache_folder != self._cache_folder:
+                send_message(sock, {"fallback": "The daemon cache is '%s', not '%s'"
+                                                % (self._cache_folder, cache_folder)})
+                return
+            exit_code = self._run(request["args"], out)
+        if not connection.closed:
+            send_message(sock, {"exit": exit_code})
+
+    def _run(self, args, out):
+        user_io = UserIO(out=out)
+        user_io.disable_input()  # There is no stdin, credentials have to be in the environment
+        try:
+            conan_api = Conan(cache_folder=self._cache_folder, output=out, user_io=user_io)
+        except ConanMigrationError:
+            return ERROR_MIGRATION
+        except ConanException as e:
+            out.error("Error in Conan initialization: {}".format(e))
+            return ERROR_GENERAL
+        return Command(conan_api).run(args)
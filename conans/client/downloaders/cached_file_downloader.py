@@ -1,5 +1,7 @@
+import json
 import os
 import shutil
+import time
 from contextlib import contextmanager
 from threading import Lock
 
@@ -8,18 +10,155 @@ from six.moves.urllib_parse import urlsplit, urlunsplit
 from conans.client.downloaders.file_downloader import check_checksum
 from conans.errors import ConanException
 from conans.util.log import logger
-from conans.util.files import mkdir, set_dirty, clean_dirty, is_dirty, remove
+from conans.util.files import mkdir, set_dirty, clean_dirty, is_dirty, remove, load, save, \
+    human_size
 from conans.util.locks import SimpleLock
 from conans.util.sha import sha256 as sha256_sum
 
+DOWNLOAD_CACHE_INDEX = "index.json"
+
+
+class DownloadCacheStats(object):
+    """ hits/misses counters of the download cache, for the current command
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evicted = 0
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.bytes_saved = self.evicted = 0
+
+    def hit(self, size):
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += size
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def evict(self, count):
+        with self._lock:
+            self.evicted += count
+
+    def __str__(self):
+        return "{} hits, {} misses, {} saved, {} evicted".format(self.hits, self.misses,
+                                                                 human_size(self.bytes_saved),
+                                                                 self.evicted)
+
+
+class DownloadCacheIndex(object):
+    """ Size and last access time of every entry of the download cache, used to evict them in
+    LRU order. The sizes are in a json file in the cache folder, only rewritten (atomically,
+    temporary file + rename, holding its own lock) when entries are added or removed. The last
+    access time of an entry is the modification time of its own file in the "access" folder,
+    so using a cached file doesn't rewrite the index. The index lock can be acquired while
+    holding an entry lock, but never the other way around.
+    """
+    _thread_lock = Lock()
+
+    def __init__(self, cache_folder):
+        self._cache_folder = cache_folder
+        self._path = os.path.join(cache_folder, DOWNLOAD_CACHE_INDEX)
+        self._lock_path = os.path.join(cache_folder, "locks", DOWNLOAD_CACHE_INDEX)
+
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock:
+            with SimpleLock(self._lock_path):
+                yield
+
+    def _load(self):
+        try:
+            return json.loads(load(self._path))
+        except (IOError, OSError, ValueError):  # Not existing or corrupted, it is rebuilt
+            return {}
+
+    def _save(self, entries):
+        tmp_path = self._path + ".tmp"
+        save(tmp_path, json.dumps(entries))
+        os.replace(tmp_path, self._path)
+
+    def _access_file(self, h):
+        return os.path.join(self._cache_folder, "access", h)
+
+    def touch(self, h):
+        access_file = self._access_file(h)
+        now = time.time()
+        try:
+            os.utime(access_file, (now, now))
+        except OSError:  # First access of this entry
+            try:
+                save(access_file, "")
+            except (IOError, OSError):
+                pass  # Never fail because of tracking, the entry is evicted earlier at most
+
+    def add(self, h, size):
+        with self._locked():
+            entries = self._load()
+            if entries.get(h, {}).get("size") != size:
+                entries[h] = {"size": size}
+                self._save(entries)
+        self.touch(h)
+
+    def discard(self, h):
+        with self._locked():
+            entries = self._load()
+            if entries.pop(h, None) is not None:
+                self._save(entries)
+        access_file = self._access_file(h)
+        if os.path.exists(access_file):
+            remove(access_file)
+
+    def entries(self):
+        """ the index entries, {h: {"size": bytes, "access": timestamp}}, reconciled with the
+        files actually in the cache folder, as entries could have been added by older clients
+        or removed manually
+        """
+        with self._locked():
+            entries = self._load()
+            try:
+                files = set(f for f in os.listdir(self._cache_folder)
+                            if len(f) == 64 and os.path.isfile(os.path.join(self._cache_folder, f)))
+            except OSError:
+                files = set()
+            sizes = {}
+            for h in files:
+                size = entries.get(h, {}).get("size")
+                if size is None:
+                    size = os.path.getsize(os.path.join(self._cache_folder, h))
+                sizes[h] = {"size": size}
+            if sizes != entries:
+                self._save(sizes)
+
+        result = {}
+        for h, entry in sizes.items():
+            access = 0
+            # Entries without access file (older clients) were last used when downloaded
+            for path in (self._access_file(h), os.path.join(self._cache_folder, h)):
+                try:
+                    access = os.path.getmtime(path)
+                    break
+                except OSError:
+                    pass
+            result[h] = {"size": entry["size"], "access": access}
+        return result
+
 
 class CachedFileDownloader(object):
     _thread_locks = {}  # Needs to be shared among all instances
+    stats = DownloadCacheStats()
 
-    def __init__(self, cache_folder, file_downloader, user_download=False):
+    def __init__(self, cache_folder, file_downloader, user_download=False, max_size=None):
         self._cache_folder = cache_folder
         self._file_downloader = file_downloader
         self._user_download = user_download
+        self._max_size = max_size
+        self._index = DownloadCacheIndex(cache_folder)
 
     @contextmanager
     def _lock(self, lock_id):
@@ -34,6 +173,29 @@ class CachedFileDownloader(object):
             finally:
                 thread_lock.release()
 
+    @contextmanager
+    def _try_lock(self, lock_id):
+        """ Non blocking version of _lock(), yields False if the entry is being used by other
+        thread or process. Thread lock goes first, so the process lock is never touched while
+        other thread of this process is using the entry
+        """
+        lock = os.path.join(self._cache_folder, "locks", lock_id)
+        thread_lock = self._thread_locks.setdefault(lock, Lock())
+        if not thread_lock.acquire(False):
+            yield False
+            return
+        try:
+            process_lock = SimpleLock(lock)
+            if not process_lock.acquire(blocking=False):
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                process_lock.release()
+        finally:
+            thread_lock.release()
+
     def download(self, url, file_path=None, md5=None, sha1=None, sha256=None, **kwargs):
         """ compatible interface of FileDownloader + checksum
         """
@@ -59,19 +221,64 @@ class CachedFileDownloader(object):
                     remove(cached_path)
 
             if not os.path.exists(cached_path):
+                self.stats.miss()
                 set_dirty(cached_path)
                 self._file_downloader.download(url=url, file_path=cached_path, md5=md5,
                                                sha1=sha1, sha256=sha256, **kwargs)
                 clean_dirty(cached_path)
+                downloaded = True
+            else:
+                self.stats.hit(os.path.getsize(cached_path))
+                downloaded = False
+            if downloaded:
+                self._index.add(h, os.path.getsize(cached_path))
+            else:
+                self._index.touch(h)
 
             if file_path is not None:
                 file_path = os.path.abspath(file_path)
                 mkdir(os.path.dirname(file_path))
                 shutil.copy2(cached_path, file_path)
+                result = None
             else:
                 with open(cached_path, 'rb') as handle:
-                    tmp = handle.read()
-                return tmp
+                    result = handle.read()
+
+        # Out of the entry lock, to respect the locks order with the index
+        if downloaded and self._max_size is not None:
+            self.evict(self._max_size, keep=h)
+        return result
+
+    def evict(self, max_size, keep=None):
+        """ Removes the least recently used entries until the cache size is below max_size.
+        Entries currently in use by other threads or processes are skipped
+        :return: (number of evicted entries, bytes freed)
+        """
+        entries = self._index.entries()
+        total = sum(entry["size"] for entry in entries.values())
+        evicted, freed = 0, 0
+        for h, entry in sorted(entries.items(), key=lambda e: e[1]["access"]):
+            if total <= max_size:
+                break
+            if h == keep:
+                continue
+            with self._try_lock(h) as locked:
+                if not locked:
+                    continue
+                cached_path = os.path.join(self._cache_folder, h)
+                if os.path.exists(cached_path):
+                    remove(cached_path)
+                if is_dirty(cached_path):
+                    clean_dirty(cached_path)
+                self._index.discard(h)
+            total -= entry["size"]
+            freed += entry["size"]
+            evicted += 1
+        if evicted:
+            logger.debug("DOWNLOAD CACHE: Evicted {} entries, {}".format(evicted,
+                                                                        human_size(freed)))
+            self.stats.evict(evicted)
+        return evicted, freed
 
     def _get_hash(self, url, checksum=None):
         """ For Api V2, the cached downloads always have recipe and package REVISIONS in the URL,
@@ -1,10 +1,10 @@
-import fnmatch
 import os
 import shutil
 from collections import defaultdict
 
 from conans.errors import ConanException
-from conans.util.files import mkdir, walk
+from conans.util.dir_snapshot import DirSnapshotCache, pattern_matcher
+from conans.util.files import copy_is_up_to_date, mkdir
 
 
 def report_copied_files(copied, output, message_suffix="Copied"):
@@ -46,6 +46,8 @@ class FileCopier(object):
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
         self._copied = []
+        # The source trees are listed once, and listed again only if they are modified
+        self._snapshots = DirSnapshotCache()
 
     def report(self, output):
         return report_copied_files(self._copied, output)
@@ -105,8 +107,19 @@ class FileCopier(object):
         self._copied.extend(files_to_copy)
         return copied_files
 
-    @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _snapshot(self, src, links, excluded_folders):
+        def skip_folder(path, name):
+            if name in (".git", ".svn") or os.path.join(path, name) in excluded_folders:
+                return True
+            if name == "build" and os.path.basename(path) == "test_package":
+                return True
+            # Linked folders are copied as links, their contents are not needed
+            return links and os.path.islink(path)
+
+        key = (links, tuple(excluded_folders))
+        return self._snapshots.get(src, followlinks=True, skip_folder=skip_folder, key=key)
+
+    def _filter_files(self, src, pattern, links, excludes, ignore_case, excluded_folders):
 
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
@@ -117,56 +130,40 @@ class FileCopier(object):
         if excludes:
             if not isinstance(excludes, (tuple, list)):
                 excludes = (excludes, )
-            if ignore_case:
-                excludes = [e.lower() for e in excludes]
         else:
             excludes = []
+        folder_excludes = [pattern_matcher(e, ignore_case) for e in excludes]
 
-        for root, subfolders, files in walk(src, followlinks=True):
-            if root in excluded_folders:
-                subfolders[:] = []
+        pruned = set()  # indexes of the folders whose files and subfolders are skipped
+        for index, folder in enumerate(self._snapshot(src, links, excluded_folders).folders):
+            root = folder.path
+            if folder.parent in pruned or root in excluded_folders:
+                pruned.add(index)
                 continue
 
-            if links and os.path.islink(root):
+            if links and folder.is_link:
                 linked_folders.append(os.path.relpath(root, src))
-                subfolders[:] = []
+                pruned.add(index)
                 continue
             basename = os.path.basename(root)
             # Skip git or svn subfolders
             if basename in [".git", ".svn"]:
-                subfolders[:] = []
+                pruned.add(index)
                 continue
-            if basename == "test_package":  # DO NOT export test_package/build folder
-                try:
-                    subfolders.remove("build")
-                except ValueError:
-                    pass
 
             relative_path = os.path.relpath(root, src)
-            compare_relative_path = relative_path.lower() if ignore_case else relative_path
-            for exclude in excludes:
-                if fnmatch.fnmatch(compare_relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
-                    break
-            for f in files:
+            if any(exclude(relative_path) for exclude in folder_excludes):
+                pruned.add(index)
+                continue
+            for f in folder.files:
                 relative_name = os.path.normpath(os.path.join(relative_path, f))
                 filenames.append(relative_name)
 
-        if ignore_case:
-            pattern = pattern.lower()
-            files_to_copy = [n for n in filenames if fnmatch.fnmatch(os.path.normpath(n.lower()),
-                                                                     pattern)]
-        else:
-            files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                         pattern)]
-
-        for exclude in excludes:
-            if ignore_case:
-                files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f.lower(), exclude)]
-            else:
-                files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatchcase(f, exclude)]
-
+        # Files are matched with fnmatchcase (no normcase) if not ignore_case
+        match = pattern_matcher(pattern, ignore_case, normcase=ignore_case)
+        file_excludes = [pattern_matcher(e, ignore_case, normcase=ignore_case) for e in excludes]
+        files_to_copy = [n for n in filenames
+                         if match(n) and not any(exclude(n) for exclude in file_excludes)]
         return files_to_copy, linked_folders
 
     @staticmethod
@@ -236,7 +233,7 @@ class FileCopier(object):
                 except OSError:
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
-            else:
+            elif not copy_is_up_to_date(abs_src_name, abs_dst_name):
                 shutil.copy2(abs_src_name, abs_dst_name)
             copied_files.append(abs_dst_name)
         return copied_files
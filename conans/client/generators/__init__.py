@@ -1,79 +1,105 @@
+import importlib
 import os
+import sys
 import traceback
 from os.path import join
 
-from conan.tools.env import VirtualRunEnv
-from conans.client.generators.cmake_find_package import CMakeFindPackageGenerator
-from conans.client.generators.cmake_find_package_multi import CMakeFindPackageMultiGenerator
-from conans.client.generators.compiler_args import CompilerArgsGenerator
-from conans.client.generators.pkg_config import PkgConfigGenerator
 from conans.client.subsystems import deduce_subsystem, subsystem_path
 from conans.errors import ConanException, conanfile_exception_formatter
 from conans.util.env_reader import get_env
 from conans.util.files import normalize, save, mkdir
-from .b2 import B2Generator
-from .boostbuild import BoostBuildGenerator
-from .cmake import CMakeGenerator
-from .cmake_multi import CMakeMultiGenerator
-from .cmake_paths import CMakePathsGenerator
-from .deploy import DeployGenerator
-from .gcc import GCCGenerator
-from .json_generator import JsonGenerator
-from .make import MakeGenerator
-from .markdown import MarkdownGenerator
-from .premake import PremakeGenerator
-from .qbs import QbsGenerator
-from .qmake import QmakeGenerator
-from .scons import SConsGenerator
-from .text import TXTGenerator
-from .virtualbuildenv import VirtualBuildEnvGenerator
-from .virtualenv import VirtualEnvGenerator
-from .virtualenv_python import VirtualEnvPythonGenerator
-from .virtualrunenv import VirtualRunEnvGenerator
-from .visualstudio import VisualStudioGenerator
-from .visualstudio_multi import VisualStudioMultiGenerator
-from .visualstudiolegacy import VisualStudioLegacyGenerator
-from .xcode import XCodeGenerator
-from .ycm import YouCompleteMeGenerator
 from ..tools import chdir
 
+# The built-in generators, imported the first time they are used: {name: "module:class"}
+_GENERATORS = {"txt": "conans.client.generators.text:TXTGenerator",
+               "gcc": "conans.client.generators.gcc:GCCGenerator",
+               "compiler_args": "conans.client.generators.compiler_args:CompilerArgsGenerator",
+               "cmake": "conans.client.generators.cmake:CMakeGenerator",
+               "cmake_multi": "conans.client.generators.cmake_multi:CMakeMultiGenerator",
+               "cmake_paths": "conans.client.generators.cmake_paths:CMakePathsGenerator",
+               "cmake_find_package":
+                   "conans.client.generators.cmake_find_package:CMakeFindPackageGenerator",
+               "cmake_find_package_multi":
+                   "conans.client.generators.cmake_find_package_multi:"
+                   "CMakeFindPackageMultiGenerator",
+               "qmake": "conans.client.generators.qmake:QmakeGenerator",
+               "qbs": "conans.client.generators.qbs:QbsGenerator",
+               "scons": "conans.client.generators.scons:SConsGenerator",
+               "visual_studio": "conans.client.generators.visualstudio:VisualStudioGenerator",
+               "visual_studio_multi":
+                   "conans.client.generators.visualstudio_multi:VisualStudioMultiGenerator",
+               "visual_studio_legacy":
+                   "conans.client.generators.visualstudiolegacy:VisualStudioLegacyGenerator",
+               "xcode": "conans.client.generators.xcode:XCodeGenerator",
+               "ycm": "conans.client.generators.ycm:YouCompleteMeGenerator",
+               "virtualenv": "conans.client.generators.virtualenv:VirtualEnvGenerator",
+               "virtualenv_python":
+                   "conans.client.generators.virtualenv_python:VirtualEnvPythonGenerator",
+               "virtualbuildenv":
+                   "conans.client.generators.virtualbuildenv:VirtualBuildEnvGenerator",
+               "virtualrunenv": "conans.client.generators.virtualrunenv:VirtualRunEnvGenerator",
+               "boost-build": "conans.client.generators.boostbuild:BoostBuildGenerator",
+               "pkg_config": "conans.client.generators.pkg_config:PkgConfigGenerator",
+               "json": "conans.client.generators.json_generator:JsonGenerator",
+               "b2": "conans.client.generators.b2:B2Generator",
+               "premake": "conans.client.generators.premake:PremakeGenerator",
+               "make": "conans.client.generators.make:MakeGenerator",
+               "deploy": "conans.client.generators.deploy:DeployGenerator",
+               "markdown": "conans.client.generators.markdown:MarkdownGenerator"}
+
+# The new generators, with the "generate()" method
+_NEW_GENERATORS = {"CMakeToolchain": "conan.tools.cmake:CMakeToolchain",
+                   "CMakeDeps": "conan.tools.cmake:CMakeDeps",
+                   "MSBuildToolchain": "conan.tools.microsoft:MSBuildToolchain",
+                   "MesonToolchain": "conan.tools.meson:MesonToolchain",
+                   "MSBuildDeps": "conan.tools.microsoft:MSBuildDeps",
+                   "QbsToolchain": "conan.tools.qbs.qbsprofile:QbsProfile",
+                   "msbuild": "conan.tools.microsoft:MSBuildDeps",
+                   "VirtualRunEnv": "conan.tools.env.virtualrunenv:VirtualRunEnv",
+                   "VirtualBuildEnv": "conan.tools.env.virtualbuildenv:VirtualBuildEnv",
+                   "AutotoolsDeps": "conan.tools.gnu:AutotoolsDeps",
+                   "AutotoolsToolchain": "conan.tools.gnu:AutotoolsToolchain",
+                   "BazelDeps": "conan.tools.google:BazelDeps",
+                   "BazelToolchain": "conan.tools.google:BazelToolchain",
+                   "PkgConfigDeps": "conan.tools.gnu:PkgConfigDeps",
+                   "VCVars": "conan.tools.microsoft:VCVars",
+                   "IntelCC": "conan.tools.intel:IntelCC",
+                   "XcodeDeps": "conan.tools.apple:XcodeDeps",
+                   "PremakeDeps": "conan.tools.premake:PremakeDeps",
+                   "XcodeToolchain": "conan.tools.apple:XcodeToolchain",
+                   "MesonDeps": "conan.tools.meson:MesonDeps",
+                   "NMakeToolchain": "conan.tools.microsoft:NMakeToolchain",
+                   "NMakeDeps": "conan.tools.microsoft:NMakeDeps",
+                   "SConsDeps": "conan.tools.scons:SConsDeps"}
+
+
+def _import_class(path):
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# The classes this package imported before importing the generators lazily
+_EXPORTED = list(_GENERATORS.values()) + [_NEW_GENERATORS["VirtualRunEnv"]]
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """ The generator classes are still importable from this package, as they were before
+        being imported lazily: "from conans.client.generators import CMakeGenerator"
+        """
+        for path in _EXPORTED:
+            if path.endswith(":" + name):
+                return _import_class(path)
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+else:  # No module __getattr__ (PEP 562), they are imported here
+    for _path in _EXPORTED:
+        globals()[_path.split(":")[1]] = _import_class(_path)
+
 
 class GeneratorManager(object):
     def __init__(self):
-        self._generators = {"txt": TXTGenerator,
-                            "gcc": GCCGenerator,
-                            "compiler_args": CompilerArgsGenerator,
-                            "cmake": CMakeGenerator,
-                            "cmake_multi": CMakeMultiGenerator,
-                            "cmake_paths": CMakePathsGenerator,
-                            "cmake_find_package": CMakeFindPackageGenerator,
-                            "cmake_find_package_multi": CMakeFindPackageMultiGenerator,
-                            "qmake": QmakeGenerator,
-                            "qbs": QbsGenerator,
-                            "scons": SConsGenerator,
-                            "visual_studio": VisualStudioGenerator,
-                            "visual_studio_multi": VisualStudioMultiGenerator,
-                            "visual_studio_legacy": VisualStudioLegacyGenerator,
-                            "xcode": XCodeGenerator,
-                            "ycm": YouCompleteMeGenerator,
-                            "virtualenv": VirtualEnvGenerator,
-                            "virtualenv_python": VirtualEnvPythonGenerator,
-                            "virtualbuildenv": VirtualBuildEnvGenerator,
-                            "virtualrunenv": VirtualRunEnvGenerator,
-                            "boost-build": BoostBuildGenerator,
-                            "pkg_config": PkgConfigGenerator,
-                            "json": JsonGenerator,
-                            "b2": B2Generator,
-                            "premake": PremakeGenerator,
-                            "make": MakeGenerator,
-                            "deploy": DeployGenerator,
-                            "markdown": MarkdownGenerator}
-        self._new_generators = ["CMakeToolchain", "CMakeDeps", "MSBuildToolchain",
-                                "MesonToolchain", "MSBuildDeps", "QbsToolchain", "msbuild",
-                                "VirtualRunEnv", "VirtualBuildEnv", "AutotoolsDeps",
-                                "AutotoolsToolchain", "BazelDeps", "BazelToolchain", "PkgConfigDeps",
-                                "VCVars", "IntelCC", "XcodeDeps", "PremakeDeps", "XcodeToolchain",
-                                "MesonDeps", "NMakeToolchain", "NMakeDeps", "SConsDeps"]
+        # The values are the classes, or the "module:class" of the ones not imported yet
+        self._generators = dict(_GENERATORS)
+        self._new_generators = list(_NEW_GENERATORS)
 
     def add(self, name, generator_class, custom=False):
         if name not in self._generators or custom:
@@ -83,7 +109,10 @@ class GeneratorManager(object):
         return name in self._generators
 
     def __getitem__(self, key):
-        return self._generators[key]
+        generator_class = self._generators[key]
+        if isinstance(generator_class, str):
+            generator_class = self._generators[key] = _import_class(generator_class)
+        return generator_class
 
     def _new_generator(self, generator_name, output):
         if generator_name not in self._new_generators:
@@ -93,80 +122,15 @@ class GeneratorManager(object):
                    "built-in one. It is recommended to rename it. *******".format(generator_name))
             output.warn(msg)
             return
-        if generator_name == "CMakeToolchain":
-            from conan.tools.cmake import CMakeToolchain
-            return CMakeToolchain
-        elif generator_name == "CMakeDeps":
-            from conan.tools.cmake import CMakeDeps
-            return CMakeDeps
-        elif generator_name == "AutotoolsDeps":
-            from conan.tools.gnu import AutotoolsDeps
-            return AutotoolsDeps
-        elif generator_name == "AutotoolsToolchain":
-            from conan.tools.gnu import AutotoolsToolchain
-            return AutotoolsToolchain
-        elif generator_name == "PkgConfigDeps":
-            from conan.tools.gnu import PkgConfigDeps
-            return PkgConfigDeps
-        elif generator_name == "MSBuildToolchain":
-            from conan.tools.microsoft import MSBuildToolchain
-            return MSBuildToolchain
-        elif generator_name == "MesonToolchain":
-            from conan.tools.meson import MesonToolchain
-            return MesonToolchain
-        elif generator_name == "MesonDeps":
-            from conan.tools.meson import MesonDeps
-            return MesonDeps
-        elif generator_name == "MSBuildDeps":
-            from conan.tools.microsoft import MSBuildDeps
-            return MSBuildDeps
-        elif generator_name == "VCVars":
-            from conan.tools.microsoft import VCVars
-            return VCVars
-        elif generator_name == "IntelCC":
-            from conan.tools.intel import IntelCC
-            return IntelCC
-        elif generator_name == "QbsToolchain" or generator_name == "QbsProfile":
-            from conan.tools.qbs.qbsprofile import QbsProfile
-            return QbsProfile
-        elif generator_name == "VirtualBuildEnv":
-            from conan.tools.env.virtualbuildenv import VirtualBuildEnv
-            return VirtualBuildEnv
-        elif generator_name == "VirtualRunEnv":
-            from conan.tools.env.virtualrunenv import VirtualRunEnv
-            return VirtualRunEnv
-        elif generator_name == "BazelDeps":
-            from conan.tools.google import BazelDeps
-            return BazelDeps
-        elif generator_name == "BazelToolchain":
-            from conan.tools.google import BazelToolchain
-            return BazelToolchain
-        elif generator_name == "XcodeDeps":
-            from conan.tools.apple import XcodeDeps
-            return XcodeDeps
-        elif generator_name == "PremakeDeps":
-            from conan.tools.premake import PremakeDeps
-            return PremakeDeps
-        elif generator_name == "XcodeToolchain":
-            from conan.tools.apple import XcodeToolchain
-            return XcodeToolchain
-        elif generator_name == "NMakeToolchain":
-            from conan.tools.microsoft import NMakeToolchain
-            return NMakeToolchain
-        elif generator_name == "NMakeDeps":
-            from conan.tools.microsoft import NMakeDeps
-            return NMakeDeps
-        elif generator_name == "SConsDeps":
-            from conan.tools.scons import SConsDeps
-            return SConsDeps
-        else:
-            raise ConanException("Internal Conan error: Generator '{}' "
-                                 "not commplete".format(generator_name))
+        return _import_class(_NEW_GENERATORS[generator_name])
 
     def write_generators(self, conanfile, old_gen_folder, new_gen_folder, output):
         """ produces auxiliary files, required to build a project or a package.
+        Returns the paths of the files of the legacy generators, the ones of generate() are not
+        known
         """
         _receive_conf(conanfile)
+        written = []
 
         for generator_name in set(conanfile.generators):
             generator_class = self._new_generator(generator_name, output)
@@ -184,7 +148,7 @@ class GeneratorManager(object):
                                                                               str(e)))
 
             try:
-                generator_class = self._generators[generator_name]
+                generator_class = self[generator_name]
             except KeyError:
                 available = list(self._generators.keys()) + self._new_generators
                 raise ConanException("Invalid generator '%s'. Available types: %s" %
@@ -214,16 +178,19 @@ class GeneratorManager(object):
                             v = normalize(v)
                         output.info("Generator %s created %s" % (generator_name, k))
                         save(join(old_gen_folder, k), v, only_if_modified=True)
+                        written.append(join(old_gen_folder, k))
                 else:
                     content = normalize(content)
                     output.info("Generator %s created %s" % (generator_name, generator.filename))
                     save(join(old_gen_folder, generator.filename), content, only_if_modified=True)
+                    written.append(join(old_gen_folder, generator.filename))
             except Exception as e:
                 if get_env("CONAN_VERBOSE_TRACEBACK", False):
                     output.error(traceback.format_exc())
                 output.error("Generator %s(file:%s) failed\n%s"
                              % (generator_name, generator.filename, str(e)))
                 raise ConanException(e)
+        return written
 
 
 def _receive_conf(conanfile):
@@ -265,6 +232,7 @@ def write_toolchain(conanfile, path, output):
                 env = VirtualBuildEnv(conanfile)
                 env.generate()
             if conanfile.virtualrunenv:
+                from conan.tools.env.virtualrunenv import VirtualRunEnv
                 env = VirtualRunEnv(conanfile)
                 env.generate()
 
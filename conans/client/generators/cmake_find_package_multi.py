@@ -3,7 +3,7 @@ import textwrap
 
 from jinja2 import Template
 
-from conans.client.generators import CMakeFindPackageGenerator
+from conans.client.generators.cmake_find_package import CMakeFindPackageGenerator
 from conans.client.generators.cmake import DepsCppCmake
 from conans.client.generators.cmake_find_package_common import (find_transitive_dependencies,
                                                                 target_template,
@@ -1,7 +1,7 @@
 import os
 from xml.dom import minidom
 
-from conans.client.generators import VisualStudioGenerator
+from conans.client.generators.visualstudio import VisualStudioGenerator
 from conans.errors import ConanException
 from conans.model import Generator
 from conans.util.files import load
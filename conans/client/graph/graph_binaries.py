@@ -5,7 +5,7 @@ from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLO
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL, BINARY_SKIP, BINARY_UNKNOWN,
                                        BINARY_INVALID)
 from conans.errors import NoRemoteAvailable, NotFoundException, conanfile_exception_formatter, \
-    ConanException, ConanInvalidConfiguration
+    ConanException, ConanInvalidConfiguration, PackageNotFoundException
 from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN, PACKAGE_ID_INVALID
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
@@ -20,6 +20,10 @@ class GraphBinariesAnalyzer(object):
         self._remote_manager = remote_manager
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
+        # Binaries info requested in batch to the remotes, before evaluating every level
+        self._remote_packages_info = {}  # {(remote name, pref): (ConanInfo, pref) or None}
+        # The package IDs of the binaries of the recipe revisions in the remotes
+        self._remote_package_ids = {}  # {(remote name, ref): set(package_id) or None}
         self._fixed_package_id = cache.config.full_transitive_package_id
         self._compatibility = BinaryCompatibility(self._cache)
 
@@ -104,7 +108,101 @@ class GraphBinariesAnalyzer(object):
             assert node.prev, "PREV for %s is None: %s" % (str(pref), metadata.dumps())
 
     def _get_package_info(self, node, pref, remote):
-        return self._remote_manager.get_package_info(pref, remote, info=node.conanfile.info)
+        try:
+            remote_info = self._remote_packages_info.pop((remote.name, pref))
+        except KeyError:
+            return self._remote_manager.get_package_info(pref, remote, info=node.conanfile.info)
+        if remote_info is None:
+            raise PackageNotFoundException(pref)
+        return remote_info
+
+    def _prefetch_packages_info(self, nodes, build_mode, remotes):
+        """ Requests in one call per remote the latest PREV and conaninfo of the binaries of
+        these nodes that are not in the cache, instead of two calls per node later in
+        _get_package_info(). Remotes not supporting it will be requested package by package
+        """
+        if build_mode.all or not self._cache.config.revisions_enabled:
+            return
+        prefs_by_remote = {}
+        for node in nodes:
+            locked = node.graph_lock_node
+            if locked and locked.package_id and locked.package_id != PACKAGE_ID_UNKNOWN:
+                continue
+            if node.package_id == PACKAGE_ID_INVALID:
+                continue
+            pref = PackageReference(node.ref, node.package_id)
+            if pref in self._evaluated:
+                continue
+            package_layout = self._cache.package_layout(pref.ref,
+                                                        short_paths=node.conanfile.short_paths)
+            metadata = package_layout.load_metadata()
+            if pref.id in metadata.packages:  # In the cache, or it will be removed if corrupted
+                continue
+            remote = remotes.selected or remotes.get(metadata.recipe.remote)
+            if remote is None or remote.disabled:
+                continue
+            prefs_by_remote.setdefault(remote, set()).add(pref)
+
+        for remote, prefs in prefs_by_remote.items():
+            if len(prefs) < 2:  # Nothing to batch, the regular requests are done
+                continue
+            try:
+                packages_info = self._remote_manager.get_packages_info(sorted(prefs), remote)
+            except ConanException:
+                continue  # The error will be raised, if it has to, by the individual requests
+            for pref, remote_info in (packages_info or {}).items():
+                self._remote_packages_info[(remote.name, pref)] = remote_info
+
+    def _prefetch_compatible_packages(self, node, package_ids, remotes):
+        """ Requests in one call to the remote of the node the binaries of its compatible
+        packages that are not in the cache, instead of one call per compatible package later in
+        _get_package_info(): the latest PREV and conaninfo of all of them if the remote supports
+        it, otherwise, with "core.package_id:compatible_packages_listing", the list of binaries
+        of the recipe revision, so only the compatible packages in it are requested
+        """
+        package_layout = self._cache.package_layout(node.ref,
+                                                    short_paths=node.conanfile.short_paths)
+        metadata = package_layout.load_metadata()
+        remote = remotes.selected or remotes.get(metadata.recipe.remote)
+        if remote is None or remote.disabled:
+            return
+        prefs = []
+        for package_id in package_ids:
+            pref = PackageReference(node.ref, package_id)
+            if (package_id == node.package_id or package_id == PACKAGE_ID_INVALID or
+                    package_id in metadata.packages or pref in self._evaluated or
+                    (remote.name, pref) in self._remote_packages_info or pref in prefs):
+                continue
+            prefs.append(pref)
+        if len(prefs) < 2:  # Nothing to batch, the regular requests are done
+            return
+
+        if self._cache.config.revisions_enabled:
+            try:
+                packages_info = self._remote_manager.get_packages_info(prefs, remote)
+            except ConanException:
+                packages_info = None
+            if packages_info is not None:
+                for pref, remote_info in packages_info.items():
+                    self._remote_packages_info[(remote.name, pref)] = remote_info
+                return
+
+        if not self._cache.new_config.get("core.package_id:compatible_packages_listing",
+                                          check_type=bool):
+            return
+        key = remote.name, node.ref
+        if key not in self._remote_package_ids:
+            try:
+                packages = self._remote_manager.search_packages(remote, node.ref, None)
+            except ConanException:
+                packages = None  # The error will be raised, if it has to, by the requests
+            self._remote_package_ids[key] = set(packages) if packages is not None else None
+        remote_package_ids = self._remote_package_ids[key]
+        if remote_package_ids is None:
+            return
+        for pref in prefs:
+            if pref.id not in remote_package_ids:
+                self._remote_packages_info[(remote.name, pref)] = None
 
     def _evaluate_remote_pkg(self, node, pref, remote, remotes, remote_selected):
         remote_info = None
@@ -214,8 +312,10 @@ class GraphBinariesAnalyzer(object):
                 self._compatibility.compatibles(conanfile)
                 if node.conanfile.compatible_packages:
                     compatible_build_mode = BuildMode(None, self._out)
-                    for compatible_package in node.conanfile.compatible_packages:
-                        package_id = compatible_package.package_id()
+                    compatibles = [(c, c.package_id()) for c in conanfile.compatible_packages]
+                    self._prefetch_compatible_packages(node, [p for _, p in compatibles],
+                                                       remotes)
+                    for compatible_package, package_id in compatibles:
                         if package_id == node.package_id:
                             node.conanfile.output.info("Compatible package ID %s equal to the "
                                                        "default package ID" % package_id)
@@ -432,32 +532,41 @@ class GraphBinariesAnalyzer(object):
     def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
         default_python_requires_id_mode = self._cache.config.default_python_requires_id_mode
-        for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
-            self._propagate_options(node)
-
-            # Make sure that locked options match
-            if (node.graph_lock_node is not None and
-                    node.graph_lock_node.options is not None and
-                    node.conanfile.options.values != node.graph_lock_node.options):
-                raise ConanException("{}: Locked options do not match computed options\n"
-                                     "Locked options:\n{}\n"
-                                     "Computed options:\n{}".format(node.ref,
-                                                                    node.graph_lock_node.options,
-                                                                    node.conanfile.options.values))
-
-            self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                continue
-            if node.recipe == RECIPE_EDITABLE:
-                node.binary = BINARY_EDITABLE
-                continue
-            if node.package_id == PACKAGE_ID_UNKNOWN:
-                assert node.binary is None, "Node.binary should be None"
-                node.binary = BINARY_UNKNOWN
-                # annotate pattern, so unused patterns in --build are not displayed as errors
-                build_mode.forced(node.conanfile, node.ref)
-                continue
-            self._evaluate_node(node, build_mode, update, remotes)
+        for level in deps_graph.by_levels(nodes_subset):
+            to_evaluate = []
+            for node in level:
+                self._propagate_options(node)
+
+                # Make sure that locked options match
+                if (node.graph_lock_node is not None and
+                        node.graph_lock_node.options is not None and
+                        node.conanfile.options.values != node.graph_lock_node.options):
+                    raise ConanException("{}: Locked options do not match computed options\n"
+                                         "Locked options:\n{}\n"
+                                         "Computed options:\n{}"
+                                         .format(node.ref, node.graph_lock_node.options,
+                                                 node.conanfile.options.values))
+
+                self._compute_package_id(node, default_package_id_mode,
+                                         default_python_requires_id_mode)
+                if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                    continue
+                if node.recipe == RECIPE_EDITABLE:
+                    node.binary = BINARY_EDITABLE
+                    continue
+                if node.package_id == PACKAGE_ID_UNKNOWN:
+                    assert node.binary is None, "Node.binary should be None"
+                    node.binary = BINARY_UNKNOWN
+                    # annotate pattern, so unused patterns in --build are not displayed as errors
+                    build_mode.forced(node.conanfile, node.ref)
+                    continue
+                to_evaluate.append(node)
+
+            # The package IDs of a level only depend on the previous levels, so all the binaries
+            # of the level can be requested to the remotes at once
+            self._prefetch_packages_info(to_evaluate, build_mode, remotes)
+            for node in to_evaluate:
+                self._evaluate_node(node, build_mode, update, remotes)
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
     def reevaluate_node(self, node, remotes, build_mode, update):
@@ -40,6 +40,7 @@ class ConanProxy(object):
             if status not in (RECIPE_DOWNLOADED, RECIPE_UPDATED):
                 log_recipe_got_from_local_cache(new_ref)
                 recorder.recipe_fetched_from_cache(new_ref)
+            layout.record_recipe_access()
 
         return conanfile_path, status, remote, new_ref
 
@@ -1,4 +1,5 @@
 import re
+from functools import cmp_to_key, lru_cache
 
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
@@ -51,34 +52,75 @@ def _parse_versionexpr(versionexpr, result):
     return version_range, loose, include_prerelease
 
 
+@lru_cache(maxsize=1024)
+def _parse_versionexpr_cached(versionexpr):
+    """ (version_range, loose, include_prerelease), warnings
+    """
+    warnings = []
+    parsed = _parse_versionexpr(versionexpr, warnings)
+    return parsed, tuple(warnings)
+
+
+@lru_cache(maxsize=1024)
+def _version_range(version_range, loose):
+    """ the semver.Range of the expression, compiled once per process
+    """
+    from semver import Range
+    try:
+        return Range(version_range, loose)
+    except ValueError:
+        raise ConanException("version range expression '%s' is not valid" % version_range)
+
+
+@lru_cache(maxsize=16384)
+def _semver(version, loose):
+    """ the SemVer of the version, parsed once per process, None if it is not semver
+    """
+    from semver import SemVer
+    try:
+        return SemVer(version, loose=loose)
+    except (ValueError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _versions_index(versions, loose):
+    """ the (SemVer, position) of the semver versions, from the highest to the lowest (the first
+    one of the equal ones first, like semver.max_satisfying()), and the versions not semver
+    """
+    parsed = [(_semver(v, loose), i) for i, v in enumerate(versions)]
+    not_semver = tuple(versions[i] for ver, i in parsed if ver is None)
+    index = [item for item in parsed if item[0] is not None]
+    index.sort(key=cmp_to_key(lambda a, b: b[0].compare(a[0])))  # stable, descending
+    return tuple(index), not_semver
+
+
 def satisfying(list_versions, versionexpr, result):
     """ returns the maximum version that satisfies the expression
     if some version cannot be converted to loose SemVer, it is discarded with a msg
     This provides some workaround for failing comparisons like "2.1" not matching "<=2.1"
+    The parsed expressions and versions, and the sorted lists of versions are cached, so the
+    maximum is the first version of the index that satisfies the range
     """
-    from semver import SemVer, Range, max_satisfying
-    version_range, loose, include_prerelease = _parse_versionexpr(versionexpr, result)
+    (version_range, loose, include_prerelease), warnings = _parse_versionexpr_cached(versionexpr)
+    for warning in warnings:
+        result.append(warning)
 
     # Check version range expression
-    try:
-        act_range = Range(version_range, loose)
-    except ValueError:
-        raise ConanException("version range expression '%s' is not valid" % version_range)
+    act_range = _version_range(version_range, loose)
 
     # Validate all versions
-    candidates = {}
-    for v in list_versions:
-        try:
-            ver = SemVer(v, loose=loose)
-            candidates[ver] = v
-        except (ValueError, AttributeError):
-            result.append("WARN: Version '%s' is not semver, cannot be compared with a range"
-                          % str(v))
+    versions = tuple(list_versions)
+    index, not_semver = _versions_index(tuple(str(v) for v in versions), loose)
+    for v in not_semver:
+        result.append("WARN: Version '%s' is not semver, cannot be compared with a range"
+                      % str(v))
 
     # Search best matching version in range
-    result = max_satisfying(candidates, act_range, loose=loose,
-                            include_prerelease=include_prerelease)
-    return candidates.get(result)
+    for ver, position in index:
+        if act_range.test(ver, include_prerelease=include_prerelease):
+            return versions[position]
+    return None
 
 
 class RangeResolver(object):
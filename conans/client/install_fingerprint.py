@@ -0,0 +1,160 @@
+""" The fingerprint of a "conan install" of a consumer conanfile, saved in the install folder.
+It is the hash of the inputs of the install (conanfile, profiles, lockfile, generators,
+arguments), the stamps of the folders and files of the cache with the recipes and packages
+of the resolved graph, and the stamps of the files the install wrote (generated and imported).
+If nothing changed, the install can be skipped
+"""
+import json
+import os
+import time
+
+from conans import __version__ as client_version
+from conans.client.cache.editable import EDITABLE_PACKAGES_FILE
+from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_EDITABLE, RECIPE_VIRTUAL
+from conans.paths import DATA_YML
+from conans.util.files import load, save
+from conans.util.sha import sha1
+
+INSTALL_FINGERPRINT = "conaninstall.json"
+# Other build modes (forced builds) build every time, they are never skipped
+_UNCHANGED_BUILD_MODES = ("missing", "never", "outdated")
+# The files of the output folders modified since the install started are outputs of the install,
+# with a margin for the filesystems with coarse timestamps
+_MTIME_MARGIN_NS = 2 * 10 ** 9
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _file_sha(path):
+    try:
+        return sha1(load(path, binary=True))
+    except (IOError, OSError):
+        return None
+
+
+class InstallFingerprint(object):
+
+    def __init__(self, cache, install_folder):
+        self._cache = cache
+        self._path = os.path.join(install_folder, INSTALL_FINGERPRINT)
+        self._inputs = None
+        self._stamps = None
+        self._started = int(time.time() * 10 ** 9)
+
+    def compute_inputs(self, conanfile_path, graph_info, lockfile, arguments):
+        """
+        :param arguments: list with the other arguments of the install that change its result
+        """
+        cache = self._cache
+        editable_path = os.path.join(cache.cache_folder, EDITABLE_PACKAGES_FILE)
+        inputs = {"version": client_version,
+                  "arguments": arguments,
+                  "conanfile": [conanfile_path, _file_sha(conanfile_path)],
+                  "conandata": _file_sha(os.path.join(os.path.dirname(conanfile_path), DATA_YML)),
+                  "profile_host": graph_info.profile_host.dumps(),
+                  "profile_build": (graph_info.profile_build.dumps()
+                                    if graph_info.profile_build else None),
+                  "lockfile": _file_sha(lockfile) if lockfile else None,
+                  "cache": [_stamp(p) for p in (cache.conan_conf_path, cache.new_config_path,
+                                                cache.settings_path, cache.generators_path,
+                                                editable_path)]}
+        self._inputs = sha1(json.dumps(inputs, sort_keys=True).encode())
+
+    @staticmethod
+    def enabled(cache, update, build_modes, manifests, lockfile_out):
+        if not cache.new_config.get("core.install:incremental", check_type=bool):
+            return False
+        if update or manifests or lockfile_out:
+            return False
+        return not build_modes or all(b in _UNCHANGED_BUILD_MODES for b in build_modes)
+
+    def load(self):
+        """ the result of the previous install, if it is the same one, otherwise None
+        """
+        try:
+            fingerprint = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            return None
+        if fingerprint.get("inputs") != self._inputs:
+            return None
+        stamps = fingerprint.get("stamps") or []
+        if any(_stamp(path) != stamp for path, stamp in stamps):
+            return None
+        return fingerprint.get("result")
+
+    def record(self, deps_graph, output_folders=(), output_files=()):
+        """ the stamps of the cache folders that would change if the graph resolved differently:
+        new versions or revisions of the recipes, and new, updated or removed packages. Also the
+        stamps of the files written by the install, a modified or removed one is a change
+        :param output_folders: the folders of the generated files, their files written by this
+        install are recorded (the generate() files are not known)
+        :param output_files: the other files written by the install (legacy generators, imports)
+        """
+        stamps = {}
+
+        def add_recipe(ref):
+            layout = self._cache.package_layout(ref)
+            folder = self._cache.store
+            for token in ref.dir_repr().split("/"):
+                folder = os.path.join(folder, token)
+                stamps[folder] = _stamp(folder)
+            metadata = layout.package_metadata()
+            stamps[metadata] = _stamp(metadata)
+            return layout
+
+        for node in deps_graph.nodes:
+            if node.recipe == RECIPE_EDITABLE:
+                # The editable packages can change at any time, this install can't be recorded
+                self._stamps = None
+                return
+            python_requires = getattr(node.conanfile, "python_requires", None)
+            if python_requires:
+                if isinstance(python_requires, dict):  # Legacy python-requires
+                    py_refs = [py_require.ref for py_require in python_requires.values()]
+                else:
+                    py_refs = python_requires.all_refs()
+                for py_ref in py_refs:
+                    add_recipe(py_ref)
+            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                continue
+            layout = add_recipe(node.ref)
+            if node.pref is not None:
+                package_folder = layout.package(node.pref)
+                stamps[package_folder] = _stamp(package_folder)
+
+        for path in output_files:
+            stamps[path] = _stamp(path)
+        for folder in output_folders:
+            if not folder or not os.path.isdir(folder):
+                continue
+            for entry in os.scandir(folder):
+                if entry.name == INSTALL_FINGERPRINT or not entry.is_file():
+                    continue
+                st = entry.stat()
+                if st.st_mtime_ns >= self._started - _MTIME_MARGIN_NS:
+                    stamps[entry.path] = [st.st_mtime_ns, st.st_size]
+        self._stamps = sorted(stamps.items())
+
+    def save(self, result):
+        if self._inputs is None or self._stamps is None:
+            return
+        fingerprint = {"inputs": self._inputs,
+                       "stamps": self._stamps,
+                       "result": result}
+
+        def date_handler(obj):
+            if hasattr(obj, 'isoformat'):
+                return obj.isoformat()
+            raise TypeError("Unserializable object {} of type {}".format(obj, type(obj)))
+
+        save(self._path, json.dumps(fingerprint, default=date_handler))
+
+    def remove(self):
+        if os.path.exists(self._path):
+            os.remove(self._path)
@@ -8,7 +8,8 @@ from conans.client import tools
 from conans.client.conanfile.build import run_build_method
 from conans.client.conanfile.package import run_package_method
 from conans.client.file_copier import report_copied_files
-from conans.client.generators import TXTGenerator, write_toolchain
+from conans.client.generators import write_toolchain
+from conans.client.generators.text import TXTGenerator
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
     BINARY_MISSING, BINARY_SKIP, BINARY_UPDATE, BINARY_UNKNOWN, CONTEXT_HOST, BINARY_INVALID
 from conans.client.importer import remove_imports, run_imports
@@ -16,6 +17,7 @@ from conans.client.packager import update_package_metadata
 from conans.client.recorder.action_recorder import INSTALL_ERROR_BUILDING, INSTALL_ERROR_MISSING, \
     INSTALL_ERROR_MISSING_BUILD_FOLDER
 from conans.client.source import retrieve_exports_sources, config_source
+from conans.client.source_staging import STAGING_COPY, STAGING_COW, STAGING_MODES, stage_sources
 from conans.client.tools.env import pythonpath
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
                            conanfile_exception_formatter, ConanInvalidConfiguration)
@@ -32,7 +34,8 @@ from conans.model.user_info import DepsUserInfo
 from conans.model.user_info import UserInfo
 from conans.paths import BUILD_INFO, CONANINFO, RUN_LOG_NAME
 from conans.util.env_reader import get_env
-from conans.util.files import clean_dirty, is_dirty, make_read_only, mkdir, rmdir, save, set_dirty
+from conans.util.files import clean_dirty, is_dirty, make_read_only, mkdir, rmdir, save, set_dirty, \
+    staged_hardlinks
 from conans.util.log import logger
 from conans.util.tracer import log_package_built, log_package_got_from_local_cache
 
@@ -112,21 +115,45 @@ class _PackageBuilder(object):
                       conanfile, self._output, conanfile_path, pref.ref,
                       self._hook_manager, self._cache)
 
-    @staticmethod
-    def _copy_sources(conanfile, source_folder, build_folder):
-        # Copies the sources to the build-folder, unless no_copy_source is defined
+    def _copy_sources(self, conanfile, source_folder, build_folder):
+        """ Copies the sources to the build-folder, unless no_copy_source is defined
+        returns the StagedSources if they were staged with copy-on-write
+        """
         _remove_folder_raising(build_folder)
-        if not getattr(conanfile, 'no_copy_source', False):
-            conanfile.output.info('Copying sources to build folder')
-            try:
+        if getattr(conanfile, 'no_copy_source', False):
+            return None
+        staging = self._cache.new_config["core.build:sources_staging"] or STAGING_COPY
+        if staging not in STAGING_MODES:
+            raise ConanException("Invalid 'core.build:sources_staging' value '{}', "
+                                 "possible values: {}".format(staging, ", ".join(STAGING_MODES)))
+        staged = None
+        try:
+            if staging == STAGING_COW:
+                conanfile.output.info('Staging sources in build folder')
+                read_only = getattr(conanfile, "read_only_sources", None)
+                if isinstance(read_only, str):
+                    read_only = [read_only]
+                staged = stage_sources(source_folder, build_folder, read_only)
+                conanfile.output.info(staged.summary())
+            else:
+                conanfile.output.info('Copying sources to build folder')
                 shutil.copytree(source_folder, build_folder, symlinks=True)
-            except Exception as e:
-                msg = str(e)
-                if "206" in msg:  # System error shutil.Error 206: Filename or extension too long
-                    msg += "\nUse short_paths=True if paths too long"
-                raise ConanException("%s\nError copying sources to build folder" % msg)
-            logger.debug("BUILD: Copied to %s", build_folder)
-            logger.debug("BUILD: Files copied %s", ",".join(os.listdir(build_folder)))
+        except Exception as e:
+            msg = str(e)
+            if "206" in msg:  # System error shutil.Error 206: Filename or extension too long
+                msg += "\nUse short_paths=True if paths too long"
+            raise ConanException("%s\nError copying sources to build folder" % msg)
+        logger.debug("BUILD: Copied to %s", build_folder)
+        logger.debug("BUILD: Files copied %s", ",".join(os.listdir(build_folder)))
+        return staged
+
+    def _check_staged_sources(self, staged, source_folder):
+        # Hardlinked sources modified in place by the build are not valid for other builds
+        modified = staged.modified_sources() if staged is not None else None
+        if modified and not is_dirty(source_folder):
+            self._output.warn("The build modified %d files shared with the source folder, "
+                              "it will be retrieved again for the next builds" % len(modified))
+            set_dirty(source_folder)
 
     def _build(self, conanfile, pref):
         # Read generators from conanfile and generate the needed files
@@ -200,11 +227,12 @@ class _PackageBuilder(object):
         base_build, skip_build = self._get_build_folder(conanfile, package_layout,
                                                                pref, keep_build, recorder)
         # PREPARE SOURCES
+        staged = None
         if not skip_build:
             with package_layout.conanfile_write_lock(self._output):
                 set_dirty(base_build)
                 self._prepare_sources(conanfile, pref, package_layout, remotes)
-                self._copy_sources(conanfile, base_source, base_build)
+                staged = self._copy_sources(conanfile, base_source, base_build)
 
         # BUILD & PACKAGE
         with package_layout.conanfile_read_lock(self._output):
@@ -221,13 +249,18 @@ class _PackageBuilder(object):
                 # In local cache, generators folder always in build_folder
                 conanfile.folders.set_base_generators(base_build)
 
-                if not skip_build:
-                    # In local cache, install folder always is build_folder
-                    conanfile.folders.set_base_install(base_build)
-                    self._build(conanfile, pref)
-                    clean_dirty(base_build)
+                linked_files = staged.linked_files if staged is not None else []
+                with staged_hardlinks(linked_files):
+                    if not skip_build:
+                        # In local cache, install folder always is build_folder
+                        conanfile.folders.set_base_install(base_build)
+                        try:
+                            self._build(conanfile, pref)
+                        finally:
+                            self._check_staged_sources(staged, base_source)
+                        clean_dirty(base_build)
 
-                prev = self._package(conanfile, pref, package_layout, conanfile_path)
+                    prev = self._package(conanfile, pref, package_layout, conanfile_path)
                 assert prev
                 node.prev = prev
                 log_file = os.path.join(base_build, RUN_LOG_NAME)
@@ -574,6 +607,7 @@ class BinaryInstaller(object):
                 # but it could be that another node with same PREF was built and obtained a new PREV
                 node.prev = processed_prev
 
+            layout.record_package_access(pref)
             package_folder = layout.package(pref)
             assert os.path.isdir(package_folder), ("Package '%s' folder must exist: %s\n"
                                                    % (str(pref), package_folder))
@@ -616,12 +650,13 @@ class BinaryInstaller(object):
         conan_file = node.conanfile
         # FIXME: Not the best place to assign the _conan_using_build_profile
         conan_file._conan_using_build_profile = using_build_profile
-        transitive = [it for it in node.transitive_closure.values()]
+        # Sets, they are checked for every node of the closure
+        transitive = set(node.transitive_closure.values())
 
-        br_host = []
+        br_host = set()
         for it in node.dependencies:
             if it.require.build_require_context == CONTEXT_HOST:
-                br_host.extend(it.dst.transitive_closure.values())
+                br_host.update(it.dst.transitive_closure.values())
 
         # Initialize some members if we are using different contexts
         if using_build_profile:
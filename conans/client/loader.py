@@ -10,9 +10,6 @@ import yaml
 
 from pathlib import Path
 
-from conan.tools.cmake import cmake_layout
-from conan.tools.google import bazel_layout
-from conan.tools.microsoft import vs_layout
 from conans.client.conf.required_version import validate_conan_version
 from conans.client.loader_txt import ConanFileTextLoader
 from conans.client.tools.files import chdir
@@ -315,6 +312,9 @@ class ConanFileLoader(object):
                 conanfile.build_requires = []
             conanfile.build_requires.append(build_reference)
         if parser.layout:
+            from conan.tools.cmake import cmake_layout
+            from conan.tools.google import bazel_layout
+            from conan.tools.microsoft import vs_layout
             layout_method = {"cmake_layout": cmake_layout,
                              "vs_layout": vs_layout,
                              "bazel_layout": bazel_layout}.get(parser.layout)
@@ -23,7 +23,7 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
                  manifest_interactive=False, generators=None, no_imports=False,
                  create_reference=None, keep_build=False, recorder=None, lockfile_node_id=None,
                  is_build_require=False, add_txt_generator=True, require_overrides=None,
-                 conanfile_path=None, test=None, output_folder=None):
+                 conanfile_path=None, test=None, output_folder=None, install_fingerprint=None):
 
     """ Fetch and build all dependencies for the given reference
     @param app: The ConanApp instance with all collaborators
@@ -38,6 +38,7 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
     @param generators: List of generators from command line.
     @param no_imports: Install specified packages but avoid running imports
     @param add_txt_generator: Add the txt to the list of generators
+    @param install_fingerprint: InstallFingerprint to record the resolved graph in
 
     """
 
@@ -114,6 +115,7 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
         msg += "Trying to install dependencies, but this configuration will fail to build a package"
         output.error(msg)
 
+    generated = []
     if install_folder:
         # Write generators
         tmp = list(conanfile.generators)  # Add the command line specified generators
@@ -122,9 +124,9 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
         if add_txt_generator:
             tmp.append("txt")
         conanfile.generators = tmp
-        app.generator_manager.write_generators(conanfile, install_folder,
-                                               conanfile.generators_folder,
-                                               output)
+        generated = app.generator_manager.write_generators(conanfile, install_folder,
+                                                           conanfile.generators_folder,
+                                                           output)
         write_toolchain(conanfile, conanfile.generators_folder, output)
 
         if not isinstance(ref_or_path, ConanFileReference):
@@ -137,7 +139,8 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
             graph_lock_file = GraphLockFile(profile_host, profile_build, graph_lock)
             graph_lock_file.save(os.path.join(install_folder, "conan.lock"))
         if not no_imports:
-            run_imports(conanfile)
+            imported = run_imports(conanfile)
+            generated.extend(os.path.join(conanfile.imports_folder, f) for f in imported)
         if type(conanfile).system_requirements != ConanFile.system_requirements:
             call_system_requirements(conanfile, conanfile.output)
 
@@ -148,4 +151,8 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
             if hasattr(deploy_conanfile, "deploy") and callable(deploy_conanfile.deploy):
                 run_deploy(deploy_conanfile, install_folder)
 
+    if install_fingerprint:
+        output_folders = [install_folder, conanfile.generators_folder] if install_folder else []
+        install_fingerprint.record(deps_graph, output_folders, generated)
+
     return install_folder, conanfile
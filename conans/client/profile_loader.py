@@ -2,8 +2,6 @@ import os
 import platform
 from collections import OrderedDict, defaultdict
 
-from jinja2 import Environment, FileSystemLoader
-
 from conan import conan_version
 from conan.tools.env.environment import ProfileEnvironment
 from conans.errors import ConanException, ConanV2Exception
@@ -122,6 +120,7 @@ def read_profile(profile_name, cwd, default_folder):
     text = load(profile_path)
 
     if profile_name.endswith(".jinja"):
+        from jinja2 import Environment, FileSystemLoader
         base_path = os.path.dirname(profile_path)
         context = {"platform": platform,
                    "os": os,
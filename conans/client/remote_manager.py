@@ -13,6 +13,7 @@ from conans.model.info import ConanInfo
 from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, rm_conandir
 from conans.search.search import filter_packages
 from conans.util import progress_bar
+from conans.util.archives import PACKAGE_ARCHIVE_NAMES, find_package_archive
 from conans.util.env_reader import get_env
 from conans.util.files import make_read_only, mkdir, tar_extract, touch_folder, md5sum, sha1sum
 from conans.util.log import logger
@@ -55,6 +56,9 @@ class RemoteManager(object):
     def check_credentials(self, remote):
         self._call_remote(remote, "check_credentials")
 
+    def server_capable(self, remote, capability):
+        return self._call_remote(remote, "server_capable", capability)
+
     def get_recipe_snapshot(self, ref, remote):
         assert ref.revision, "get_recipe_snapshot requires revision"
         return self._call_remote(remote, "get_recipe_snapshot", ref)
@@ -64,6 +68,16 @@ class RemoteManager(object):
         assert pref.revision, "get_package_snapshot requires PREV"
         return self._call_remote(remote, "get_package_snapshot", pref)
 
+    def get_snapshots(self, refs, prefs, remote):
+        """ The snapshots and manifests of many recipe and package revisions in one request:
+        {ref or pref: (snapshot, FileTreeManifest or None)}. The ones not in the result have to
+        be requested one by one. Returns None if the remote doesn't support it
+        """
+        assert all(ref.revision for ref in refs), "get_snapshots requires RREV"
+        assert all(pref.ref.revision and pref.revision for pref in prefs), \
+            "get_snapshots requires RREV and PREV"
+        return self._call_remote(remote, "get_snapshots", refs, prefs)
+
     def upload_recipe(self, ref, files_to_upload, deleted, remote, retry, retry_wait):
         assert ref.revision, "upload_recipe requires RREV"
         self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
@@ -91,6 +105,14 @@ class RemoteManager(object):
         # FIXME Conan 2.0: With revisions, it is not needed to pass headers to this second function
         return self._call_remote(remote, "get_package_info", pref, headers=headers), pref
 
+    def get_packages_info(self, prefs, remote):
+        """ Read the latest revision and ConanInfo of many packages (without PREV) in one
+        request: {pref: (ConanInfo, pref with PREV) or None if it doesn't exist}. The packages
+        not in the result have to be requested with get_package_info(). Returns None if the
+        remote doesn't support it
+        """
+        return self._call_remote(remote, "get_packages_info", prefs)
+
     def get_recipe(self, ref, remote):
         """
         Read the conans from remotes
@@ -195,7 +217,8 @@ class RemoteManager(object):
             duration = time.time() - t1
             log_package_download(pref, duration, remote, zipped_files)
 
-            tgz_file = zipped_files.pop(PACKAGE_TGZ_NAME, None)
+            archive_name = find_package_archive(zipped_files)
+            tgz_file = zipped_files.pop(archive_name, None)
             check_compressed_files(PACKAGE_TGZ_NAME, zipped_files)
             package_folder = layout.package(pref)
             if tgz_file:  # This must happen always, but just in case
@@ -316,8 +339,9 @@ def is_package_snapshot_complete(snapshot):
 
 def check_compressed_files(tgz_name, files):
     bare_name = os.path.splitext(tgz_name)[0]
+    accepted = PACKAGE_ARCHIVE_NAMES if tgz_name == PACKAGE_TGZ_NAME else (tgz_name, )
     for f in files:
-        if f == tgz_name:
+        if f in accepted:
             continue
         if bare_name == os.path.splitext(f)[0]:
             raise ConanException("This Conan version is not prepared to handle '%s' file format. "
@@ -27,6 +27,9 @@ class ConanApiAuthManager(object):
         self._user_io = user_io
         self._rest_client_factory = rest_client_factory
         self._localdb = localdb
+        # The client of every remote, used by all the calls and threads while the login of the
+        # remote doesn't change
+        self._rest_clients = {}  # {remote: (login, RestApiClient)}
 
     def call_rest_api_method(self, remote, method_name, *args, **kwargs):
         """Handles AuthenticationException and request user to input a user and a password"""
@@ -84,10 +87,16 @@ class ConanApiAuthManager(object):
         raise AuthenticationException("Too many failed login attempts, bye!")
 
     def _get_rest_client(self, remote):
-        username, token, refresh_token = self._localdb.get_login(remote.url)
+        login = self._localdb.get_login(remote.url)
+        cached = self._rest_clients.get(remote)
+        if cached is not None and cached[0] == login:
+            return cached[1]
+        username, token, refresh_token = login
         custom_headers = {'X-Client-Anonymous-Id': self._get_mac_digest(),
                           'X-Client-Id': str(username or "")}
-        return self._rest_client_factory.new(remote, token, refresh_token, custom_headers)
+        rest_client = self._rest_client_factory.new(remote, token, refresh_token, custom_headers)
+        self._rest_clients[remote] = login, rest_client
+        return rest_client
 
     def _clear_user_tokens_in_db(self, user, remote):
         try:
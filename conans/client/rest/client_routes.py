@@ -102,6 +102,11 @@ class ClientV1Router(ClientCommonRouter):
         """Removes files from the recipe"""
         return self.base_url + _format_ref(self.routes.v1_remove_recipe_files, ref.copy_clear_rev())
 
+    def remove_package_files(self, pref):
+        """Removes files from the package"""
+        return self.base_url + _format_pref(self.routes.v1_remove_package_files,
+                                            pref.copy_clear_revs())
+
     def remove_packages(self, ref):
         """Remove files from a package"""
         return self.base_url + _format_ref(self.routes.v1_remove_packages, ref.copy_clear_rev())
@@ -198,6 +203,14 @@ class ClientV2Router(ClientCommonRouter):
         """Get the url for getting a conaninfo.txt from a package"""
         return self.base_url + self._for_package_file(pref, CONANINFO, matrix_params=None)
 
+    def packages_info(self):
+        """Get the latest revision and conaninfo.txt of many packages at once"""
+        return self.base_url + self.routes.packages_info
+
+    def snapshots(self):
+        """Get the files and the manifest of many recipe and package revisions at once"""
+        return self.base_url + self.routes.snapshots
+
     def recipe_snapshot(self, ref):
         """get recipe manifest url"""
         return self.base_url + self._for_recipe_files(ref)
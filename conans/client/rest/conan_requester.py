@@ -7,9 +7,10 @@ import warnings
 
 import urllib3
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
 
 from conans import __version__ as client_version
+from conans.client.tools.oss import cpu_count
 from conans.util.files import save
 from conans.util.tracer import log_client_rest_api_call
 
@@ -20,16 +21,30 @@ logging.captureWarnings(True)
 
 
 class ConanRequester(object):
+    # The sessions by (retry, pool size) reused by the next commands of the process, with their
+    # keep-alive connections, if not None (the conan daemon)
+    sessions = None
 
     def __init__(self, config, http_requester=None):
         if http_requester:
             self._http_requester = http_requester
         else:
-            self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=self._get_retries(config.retry))
-
-            self._http_requester.mount("http://", adapter)
-            self._http_requester.mount("https://", adapter)
+            # One pool per remote (host), with as many keep-alive connections as threads can
+            # be using it concurrently, otherwise they are discarded and re-handshaked
+            pool_size = self._get_pool_size(config)
+            key = config.retry, pool_size
+            session = self.sessions.get(key) if self.sessions is not None else None
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(max_retries=self._get_retries(config.retry),
+                                      pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                if self.sessions is not None:
+                    self.sessions[key] = session
+            else:
+                session.cookies.clear()  # Nothing from the previous command
+            self._http_requester = session
 
         self._timeout_seconds = config.request_timeout
         self.proxies = config.proxies or {}
@@ -63,6 +78,29 @@ class ConanRequester(object):
             else:
                 self._client_certificates = self._client_cert_path
 
+    @staticmethod
+    def _get_pool_size(config):
+        """ enough connections per remote for the parallel downloads and parallel uploads
+        (one thread per cpu)
+        """
+        parallel_download = config.parallel_download or 0
+        return max(DEFAULT_POOLSIZE, parallel_download, cpu_count())
+
+    def connections_stats(self):
+        """ {host: (opened connections, requests)} of the current session, requests - opened
+        is the number of times a keep-alive connection has been reused
+        """
+        result = {}
+        for adapter in set(getattr(self._http_requester, "adapters", {}).values()):
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+            for key in poolmanager.pools.keys():
+                pool = poolmanager.pools.get(key)
+                if pool is not None:
+                    result[pool.host] = (pool.num_connections, pool.num_requests)
+        return result
+
     def _get_retries(self, retry):
         retry = retry if retry is not None else 2
         if retry == 0:
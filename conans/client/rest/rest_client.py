@@ -1,4 +1,5 @@
-from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS
+from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS, \
+    BATCH_PACKAGES_INFO, BATCH_SNAPSHOTS
 from conans.client.rest.rest_client_v1 import RestV1Methods
 from conans.client.rest.rest_client_v2 import RestV2Methods
 from conans.errors import OnlyV2Available, AuthenticationException
@@ -46,6 +47,7 @@ class RestApiClient(object):
 
         # This dict is shared for all the instances of RestApiClient
         self._cached_capabilities = cached_capabilities
+        self._api = None
 
     def _capable(self, capability, user=None, password=None):
         capabilities = self._cached_capabilities.get(self._remote_url)
@@ -61,6 +63,11 @@ class RestApiClient(object):
         return capability in capabilities
 
     def _get_api(self):
+        if self._api is None:
+            self._api = self._new_api()
+        return self._api
+
+    def _new_api(self):
         revisions = self._capable(REVISIONS)
         matrix_params = self._capable(MATRIX_PARAMS)
         if self._revisions_enabled and revisions:
@@ -82,6 +89,22 @@ class RestApiClient(object):
     def get_package_info(self, pref, headers):
         return self._get_api().get_package_info(pref, headers=headers)
 
+    def get_packages_info(self, prefs):
+        """ None if the server cannot return many packages info in one request
+        """
+        if not (self._revisions_enabled and self._capable(REVISIONS) and
+                self._capable(BATCH_PACKAGES_INFO)):
+            return None
+        return self._get_api().get_packages_info(prefs)
+
+    def get_snapshots(self, refs, prefs):
+        """ None if the server cannot return many snapshots in one request
+        """
+        if not (self._revisions_enabled and self._capable(REVISIONS) and
+                self._capable(BATCH_SNAPSHOTS)):
+            return None
+        return self._get_api().get_snapshots(refs, prefs)
+
     def get_recipe(self, ref, dest_folder):
         return self._get_api().get_recipe(ref, dest_folder)
 
@@ -150,6 +173,9 @@ class RestApiClient(object):
     def server_capabilities(self):
         return self._get_api().server_capabilities()
 
+    def server_capable(self, capability):
+        return self._capable(capability)
+
     def get_recipe_revisions(self, ref):
         return self._get_api().get_recipe_revisions(ref)
 
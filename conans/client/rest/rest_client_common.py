@@ -7,6 +7,7 @@ from conans.errors import (EXCEPTION_CODE_MAPPING, ConanException,
                            AuthenticationException, RecipeNotFoundException,
                            PackageNotFoundException)
 from conans.model.ref import ConanFileReference, get_reference_fields
+from conans.util.archives import PACKAGE_ARCHIVE_NAMES
 from conans.util.files import decode_text
 from conans.util.log import logger
 
@@ -229,12 +230,16 @@ class RestCommonMethods(object):
         return snap
 
     def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait):
+        if deleted:
+            if not set(deleted).issubset(PACKAGE_ARCHIVE_NAMES):
+                raise Exception("This shouldn't be happening, deleted files "
+                                "in local package present in remote: %s.\n Please, report it at "
+                                "https://github.com/conan-io/conan/issues " % str(deleted))
         if files_to_upload:
             self._upload_package(pref, files_to_upload, retry, retry_wait)
         if deleted:
-            raise Exception("This shouldn't be happening, deleted files "
-                            "in local package present in remote: %s.\n Please, report it at "
-                            "https://github.com/conan-io/conan/issues " % str(deleted))
+            # The package archive of other format, removed once the new one is in the remote
+            self._remove_package_files(pref, deleted)
 
     def search(self, pattern=None, ignorecase=True):
         """
@@ -17,6 +17,7 @@ from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.paths import CONANINFO, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
     PACKAGE_TGZ_NAME
+from conans.util.archives import find_package_archive
 from conans.util.files import decode_text
 from conans.util.log import logger
 
@@ -49,6 +50,7 @@ class RestV1Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         for filename, resource_url in sorted(file_urls.items(), reverse=True):
             auth, _ = self._file_server_capabilities(resource_url)
             md5 = snapshot_md5.get(filename, None) if snapshot_md5 else None
@@ -56,6 +58,7 @@ class RestV1Methods(RestCommonMethods):
                 "if download_cache is set, we need the file checksums"
             contents = run_downloader(self.requester, None, self.verify_ssl, retry=retry,
                                       retry_wait=retry_wait, download_cache=download_cache,
+                                      download_cache_max_size=max_size,
                                       url=resource_url, auth=auth, md5=md5)
             yield os.path.normpath(filename), contents
 
@@ -193,6 +196,7 @@ class RestV1Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         for filename, resource_url in sorted(file_urls.items(), reverse=True):
             if self._output and not self._output.is_terminal:
                 self._output.writeln("Downloading %s" % filename)
@@ -203,6 +207,7 @@ class RestV1Methods(RestCommonMethods):
                 "if download_cache is set, we need the file checksums"
             run_downloader(self.requester, self._output, self.verify_ssl, retry=retry,
                            retry_wait=retry_wait, download_cache=download_cache,
+                           download_cache_max_size=max_size,
                            url=resource_url, file_path=abs_path, auth=auth, md5=md5)
             ret[filename] = abs_path
         return ret
@@ -236,9 +241,9 @@ class RestV1Methods(RestCommonMethods):
 
     def get_package(self, pref, dest_folder):
         urls = self._get_package_urls(pref)
-        accepted_files = ["conaninfo.txt", "conan_package.tgz", "conanmanifest.txt"]
-        urls = {f: url for f, url in urls.items() if any(f.startswith(m) for m in accepted_files)}
         check_compressed_files(PACKAGE_TGZ_NAME, urls)
+        accepted_files = ["conaninfo.txt", find_package_archive(urls), "conanmanifest.txt"]
+        urls = {f: url for f, url in urls.items() if f in accepted_files}
         md5s = self.get_package_snapshot(pref) if self._config.download_cache else None
         zipped_files = self._download_files_to_folder(urls, dest_folder, md5s)
         return zipped_files
@@ -306,6 +311,20 @@ class RestV1Methods(RestCommonMethods):
         url = self.router.remove_recipe_files(ref)
         return self._post_json(url, payload)
 
+    @handle_return_deserializer()
+    def _remove_package_files(self, pref, files):
+        self.check_credentials()
+        payload = {"files": [filename.replace("\\", "/") for filename in files]}
+        url = self.router.remove_package_files(pref)
+        return self._post_json(url, payload)
+
+    def _remove_package(self, pref):
+        # APIv1 has a single package revision
+        try:
+            self.remove_packages(pref.ref, [pref.id])
+        except NotFoundException:
+            pass
+
     @handle_return_deserializer()
     def remove_packages(self, ref, package_ids):
         """ Remove any packages specified by package_ids"""
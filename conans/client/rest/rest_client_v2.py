@@ -14,6 +14,7 @@ from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.util.archives import find_package_archive
 from conans.util.files import decode_text
 from conans.util.log import logger
 
@@ -43,9 +44,11 @@ class RestV2Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = False if not use_cache else self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         contents = run_downloader(self.requester, None, self.verify_ssl, retry=retry,
                                   retry_wait=retry_wait, download_cache=download_cache, url=url,
-                                  auth=self.auth, headers=headers)
+                                  auth=self.auth, headers=headers,
+                                  download_cache_max_size=max_size)
         return contents
 
     def _get_snapshot(self, url):
@@ -84,6 +87,49 @@ class RestV2Methods(RestCommonMethods):
         content = self._get_remote_file_contents(url, use_cache=cache, headers=headers)
         return ConanInfo.loads(decode_text(content))
 
+    def get_packages_info(self, prefs):
+        """ {pref: (ConanInfo, pref with PREV) or None if it doesn't exist}. The packages the
+        server didn't resolve (e.g. no permissions) are not in the result
+        """
+        url = self.router.packages_info()
+        data = self.get_json(url, data={"packages": [pref.full_str() for pref in prefs]})
+        packages = data["packages"]
+        ret = {}
+        for pref in prefs:
+            try:
+                package = packages[pref.full_str()]
+            except KeyError:
+                continue
+            if package is None:
+                ret[pref] = None
+            else:
+                info = ConanInfo.loads(package["conaninfo"])
+                ret[pref] = info, pref.copy_with_revs(pref.ref.revision, package["revision"])
+        return ret
+
+    def get_snapshots(self, refs, prefs):
+        """ {ref or pref: (snapshot, FileTreeManifest or None)}, the snapshot is empty for the
+        revisions that don't exist. The ones the server didn't resolve (e.g. no permissions) are
+        not in the result
+        """
+        url = self.router.snapshots()
+        data = self.get_json(url, data={"recipes": [ref.full_str() for ref in refs],
+                                        "packages": [pref.full_str() for pref in prefs]})
+        ret = {}
+        for refs_or_prefs, snapshots in ((refs, data["recipes"]), (prefs, data["packages"])):
+            for ref in refs_or_prefs:
+                try:
+                    snapshot = snapshots[ref.full_str()]
+                except KeyError:
+                    continue
+                if snapshot is None:
+                    ret[ref] = [], None
+                    continue
+                files = [os.path.normpath(filename) for filename in snapshot["files"]]
+                manifest = snapshot.get("manifest")
+                ret[ref] = files, FileTreeManifest.loads(manifest) if manifest else None
+        return ret
+
     def get_recipe(self, ref, dest_folder):
         url = self.router.recipe_snapshot(ref)
         data = self._get_file_list_json(url)
@@ -122,9 +168,9 @@ class RestV2Methods(RestCommonMethods):
         url = self.router.package_snapshot(pref)
         data = self._get_file_list_json(url)
         files = data["files"]
-        accepted_files = ["conaninfo.txt", "conan_package.tgz", "conanmanifest.txt"]
-        files = [f for f in files if any(f.startswith(m) for m in accepted_files)]
         check_compressed_files(PACKAGE_TGZ_NAME, files)
+        accepted_files = ["conaninfo.txt", find_package_archive(files), "conanmanifest.txt"]
+        files = [f for f in files if f in accepted_files]
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.package_file(pref, fn) for fn in files}
         cache = (pref.revision != DEFAULT_REVISION_V1)
@@ -224,6 +270,7 @@ class RestV2Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = False if not use_cache else self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         for filename in sorted(files, reverse=True):
             if self._output and not self._output.is_terminal:
                 self._output.writeln("Downloading %s" % filename)
@@ -231,12 +278,32 @@ class RestV2Methods(RestCommonMethods):
             abs_path = os.path.join(dest_folder, filename)
             run_downloader(self.requester, self._output, self.verify_ssl, retry=retry,
                            retry_wait=retry_wait, download_cache=download_cache,
+                           download_cache_max_size=max_size,
                            url=resource_url, file_path=abs_path, auth=self.auth)
 
     def _remove_conanfile_files(self, ref, files):
         # V2 === revisions, do not remove files, it will create a new revision if the files changed
         return
 
+    def _remove_package_files(self, pref, files):
+        self.check_credentials()
+        for filename in files:
+            url = self.router.package_file(pref, filename)
+            response = self.requester.delete(url, auth=self.auth, headers=self.custom_headers,
+                                             verify=self.verify_ssl)
+            if response.status_code not in (200, 404):
+                response.charset = "utf-8"
+                raise get_exception_from_error(response.status_code)(response.text)
+
+    def _remove_package(self, pref):
+        self.check_credentials()
+        url = self.router.remove_package(pref)
+        response = self.requester.delete(url, auth=self.auth, headers=self.custom_headers,
+                                         verify=self.verify_ssl)
+        if response.status_code not in (200, 404):
+            response.charset = "utf-8"  # To be able to access ret.text (ret.content are bytes)
+            raise get_exception_from_error(response.status_code)(response.text)
+
     def remove_packages(self, ref, package_ids):
         """ Remove any packages specified by package_ids"""
         self.check_credentials()
@@ -1,15 +1,25 @@
+import codecs
 import io
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
 from subprocess import PIPE, Popen, STDOUT
 
 import six
+from six.moves import queue
 
 from conans.client.tools import environment_append
 from conans.errors import ConanException
 from conans.util.files import decode_text
 from conans.util.runners import pyinstaller_bundle_env_cleaned
 
+_CHUNK_SIZE = 64 * 1024
+_BOMS = [(codecs.BOM_UTF32_BE, "utf_32_be"), (codecs.BOM_UTF32_LE, "utf_32_le"),
+         (codecs.BOM_UTF8, "utf_8"), (codecs.BOM_UTF16_BE, "utf_16_be"),
+         (codecs.BOM_UTF16_LE, "utf_16_le")]
+
 
 class _UnbufferedWrite(object):
     def __init__(self, stream):
@@ -20,14 +30,124 @@ class _UnbufferedWrite(object):
         self._stream.flush()
 
 
+class _StreamDecoder(object):
+    """ Decodes the output of a process read in chunks. The encoding is detected once, from the
+    BOM, otherwise the text is decoded as UTF-8 incrementally. The chunks that are not valid UTF-8
+    are decoded line by line with decode_text(), each line could have a different encoding
+    """
+    _MAX_PENDING = _CHUNK_SIZE  # A not decodable line is not kept forever waiting for its end
+
+    def __init__(self):
+        self._decoder = None
+        self._pending = b""  # Start of a not valid UTF-8 line, until its end is read
+
+    def decode(self, data, final=False):
+        if self._decoder is None:
+            encoding, errors = "utf_8", "strict"
+            for bom, bom_encoding in _BOMS:
+                if data.startswith(bom):
+                    encoding, errors = bom_encoding, "replace"
+                    data = data[len(bom):]
+                    break
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        data = self._pending + data
+        self._pending = b""
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError:
+            # The decoder did not consume anything, its buffer is the start of the data
+            data = self._decoder.getstate()[0] + data
+            self._decoder.reset()
+        end = len(data) if final or len(data) > self._MAX_PENDING else data.rfind(b"\n") + 1
+        self._pending = data[end:]
+        return "".join(decode_text(line) for line in data[:end].splitlines(True))
+
+
+class _AsyncWriter(object):
+    """ Writes to a file in a thread, so the process output is not waiting for the disk
+    """
+    def __init__(self, handler):
+        self._handler = handler
+        self._queue = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            text = self._queue.get()
+            if text is None:
+                break
+            try:
+                self._handler.write(text)
+            except Exception as e:  # Reported when closed, the process output is not stopped
+                self._error = self._error or e
+
+    def write(self, text):
+        self._queue.put(text)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+class _RateLimitedWrite(object):
+    """ Writes at most max_lines per second to the stream. The lines over the limit are not
+    written, every second a message tells how many were skipped, followed by the last ones
+    """
+    _TAIL_LINES = 10
+
+    def __init__(self, stream, max_lines, clock=time.time):
+        self._stream = stream
+        self._max_lines = max_lines
+        self._clock = clock
+        self._second = None
+        self._lines = 0
+        self._skipped = 0
+        self._tail = deque(maxlen=self._TAIL_LINES)
+
+    def _flush_skipped(self):
+        if self._skipped:
+            self._stream.write("[... {} lines skipped, last {}:]\n"
+                               .format(self._skipped, len(self._tail)) + "".join(self._tail))
+            self._skipped = 0
+            self._tail.clear()
+
+    def write(self, text):
+        now = int(self._clock())
+        if now != self._second:
+            self._second = now
+            self._lines = 0
+            self._flush_skipped()
+        lines = text.splitlines(True)
+        allowed = max(self._max_lines - self._lines, 0)
+        self._lines += len(lines)
+        if allowed:
+            self._stream.write("".join(lines[:allowed]))
+        if len(lines) > allowed:
+            self._skipped += len(lines) - allowed
+            self._tail.extend(lines[allowed:])
+
+    def close(self):
+        self._flush_skipped()
+
+
 class ConanRunner(object):
 
     def __init__(self, print_commands_to_output=False, generate_run_log_file=False,
-                 log_run_to_output=True, output=None):
+                 log_run_to_output=True, output=None, output_max_rate=None):
+        """
+        @param output_max_rate: max lines per second of the output of the commands written to the
+                                Conan output (not to a user given output), None for all
+        """
         self._print_commands_to_output = print_commands_to_output
         self._generate_run_log_file = generate_run_log_file
         self._log_run_to_output = log_run_to_output
         self._output = output
+        self._output_max_rate = output_max_rate
 
     def __call__(self, command, output=True, log_filepath=None, cwd=None, subprocess=False):
         """
@@ -90,23 +210,32 @@ class ConanRunner(object):
             raise ConanException("Error while executing '%s'\n\t%s" % (command, str(e)))
 
         def get_stream_lines(the_stream):
-            while True:
-                line = the_stream.readline()
-                if not line:
-                    break
-                decoded_line = decode_text(line)
-                if stream_output and self._log_run_to_output:
-                    try:
-                        stream_output.write(decoded_line)
-                    except UnicodeEncodeError:  # be aggressive on text encoding
-                        decoded_line = decoded_line.encode("latin-1", "ignore").decode("latin-1",
-                                                                                       "ignore")
-                        stream_output.write(decoded_line)
-
-                if log_handler:
-                    # Write decoded in PY2 causes some ASCII encoding problems
-                    # tried to open the log_handler binary but same result.
-                    log_handler.write(line if six.PY2 else decoded_line)
+            # Read in chunks, the available output, written with one write (and flush) per chunk
+            read = getattr(the_stream, "read1", the_stream.readline)
+            decoder = _StreamDecoder()
+            writer = stream_output if stream_output and self._log_run_to_output else None
+            if writer and self._output_max_rate and not user_output:
+                writer = _RateLimitedWrite(writer, self._output_max_rate)
+            log_writer = _AsyncWriter(log_handler) if log_handler else None
+            try:
+                while True:
+                    data = read(_CHUNK_SIZE)
+                    text = decoder.decode(data, final=not data)
+                    if text and writer:
+                        try:
+                            writer.write(text)
+                        except UnicodeEncodeError:  # be aggressive on text encoding
+                            text = text.encode("latin-1", "ignore").decode("latin-1", "ignore")
+                            writer.write(text)
+                    if text and log_writer:
+                        log_writer.write(text)
+                    if not data:
+                        break
+            finally:
+                if isinstance(writer, _RateLimitedWrite):
+                    writer.close()
+                if log_writer:
+                    log_writer.close()
 
         if capture_output:
             get_stream_lines(proc.stdout)
@@ -4,6 +4,7 @@ import shutil
 import six
 
 from conans.client import tools
+from conans.client.cache.git_mirrors import GitMirrors
 from conans.client.cmd.export import export_recipe, export_source
 from conans.errors import ConanException, ConanExceptionInUserConanfileMethod, \
     conanfile_exception_formatter
@@ -109,7 +110,7 @@ def config_source(export_folder, export_source_folder, scm_sources_folder, conan
 
             def get_sources_from_exports():
                 # First of all get the exported scm sources (if auto) or clone (if fixed)
-                _run_cache_scm(conanfile, scm_sources_folder, output)
+                _run_cache_scm(conanfile, scm_sources_folder, output, cache)
                 if not hasattr(conanfile, "layout"):
                     # so self exported files have precedence over python_requires ones
                     merge_directories(export_folder, conanfile.folders.base_source)
@@ -178,12 +179,13 @@ def _clean_source_folder(folder):
         pass
 
 
-def _run_cache_scm(conanfile, scm_sources_folder, output):
+def _run_cache_scm(conanfile, scm_sources_folder, output, cache=None):
     """
     :param conanfile: recipe
     :param src_folder: sources folder in the cache, (Destination dir)
     :param scm_sources_folder: scm sources folder in the cache, where the scm sources were exported
     :param output: output
+    :param cache: ClientCache, for the git mirrors
     :return:
     """
     scm_data = get_scm_data(conanfile)
@@ -200,7 +202,11 @@ def _run_cache_scm(conanfile, scm_sources_folder, output):
     else:
         output.info("SCM: Getting sources from url: '%s'" % scm_data.url)
         try:
-            scm = SCM(scm_data, dest_dir, output)
+            git_mirrors = None
+            if (cache is not None and scm_data.type == "git" and
+                    cache.new_config.get("core.scm:git_mirrors", check_type=bool)):
+                git_mirrors = GitMirrors(cache.git_mirrors_folder, output)
+            scm = SCM(scm_data, dest_dir, output, git_mirrors)
             scm.checkout()
         except Exception as e:
             raise ConanException("Couldn't checkout SCM: %s" % str(e))
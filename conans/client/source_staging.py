@@ -0,0 +1,136 @@
+import ctypes
+import errno
+import fnmatch
+import os
+import platform
+import shutil
+import time
+
+from conans.util.files import human_size
+
+STAGING_COPY = "copy"
+STAGING_COW = "cow"
+STAGING_MODES = (STAGING_COPY, STAGING_COW)
+
+_FICLONE = 0x40049409  # Linux ioctl, _IOW(0x94, 9, int)
+
+
+def _reflink(src, dst):
+    """ Clones src into dst sharing the data blocks until one of them is modified (btrfs, xfs,
+    apfs...). Raises OSError if the platform or the file system does not support it
+    """
+    system = platform.system()
+    if system == "Linux":
+        import fcntl
+        try:
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except (IOError, OSError):
+            if os.path.exists(dst):
+                os.remove(dst)
+            raise
+    elif system == "Darwin":
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(src.encode("utf-8"), dst.encode("utf-8"), 0) != 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+    else:
+        raise OSError(errno.EOPNOTSUPP, "File clones not supported in {}".format(system))
+    shutil.copystat(src, dst)
+
+
+class StagedSources(object):
+    """ Result of stage_sources(): how the files were staged and the state of the files shared
+    with the source folder, to check that the build did not modify them
+    """
+    def __init__(self):
+        self.cloned = 0
+        self.linked = 0
+        self.copied = 0
+        self.shared_bytes = 0
+        self.elapsed = 0
+        self._linked_stats = {}  # {source file: (size, mtime_ns)}
+        self.linked_files = []  # The hardlinks created in the build folder
+
+    def summary(self):
+        return ("Sources staged in {:.2f}s: {} files cloned, {} linked, {} copied, {} not copied"
+                .format(self.elapsed, self.cloned, self.linked, self.copied,
+                        human_size(self.shared_bytes)))
+
+    def modified_sources(self):
+        """ the linked source files that the build modified in place, instead of replacing them
+        """
+        modified = []
+        for path, (size, mtime) in self._linked_stats.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                modified.append(path)
+                continue
+            if st.st_size != size or st.st_mtime_ns != mtime:
+                modified.append(path)
+        return modified
+
+
+def _matches(path, patterns):
+    path = path.replace("\\", "/")
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+
+
+def stage_sources(src, dst, read_only=None):
+    """ Populates the dst folder (not existing) with the src tree, without copying the file
+    contents when possible:
+      - Files are cloned (reflinks) if the file system supports it, they behave as copies
+      - Otherwise the files matching the read_only patterns (the recipe declares that the
+        build doesn't modify them) are hardlinked. The source files are not made read-only,
+        Conan save() writes a copy while the build runs in staged_hardlinks(linked_files), and
+        the shared files modified in place are detected after the build (modified_sources())
+      - Otherwise copied
+    Symlinks are copied as symlinks, like shutil.copytree(symlinks=True)
+    """
+    start = time.time()
+    staged = StagedSources()
+    can_clone, can_link = True, True
+    folders = []
+    for root, subfolders, files in os.walk(src):
+        relative = os.path.relpath(root, src)
+        dst_root = os.path.normpath(os.path.join(dst, relative))
+        os.makedirs(dst_root)
+        folders.append((root, dst_root))
+        for name in subfolders:  # Symlinked folders are not walked, they are symlinks
+            src_path = os.path.join(root, name)
+            if os.path.islink(src_path):
+                os.symlink(os.readlink(src_path), os.path.join(dst_root, name))
+        for name in files:
+            src_path = os.path.join(root, name)
+            dst_path = os.path.join(dst_root, name)
+            if os.path.islink(src_path):
+                os.symlink(os.readlink(src_path), dst_path)
+                continue
+            if can_clone:
+                try:
+                    _reflink(src_path, dst_path)
+                    staged.cloned += 1
+                    staged.shared_bytes += os.path.getsize(src_path)
+                    continue
+                except (IOError, OSError):
+                    can_clone = False  # Same file system for all, do not try again
+            if can_link and read_only and _matches(os.path.relpath(src_path, src), read_only):
+                try:
+                    os.link(src_path, dst_path)
+                    st = os.stat(src_path)
+                    staged._linked_stats[src_path] = (st.st_size, st.st_mtime_ns)
+                    staged.linked_files.append(dst_path)
+                    staged.linked += 1
+                    staged.shared_bytes += st.st_size
+                    continue
+                except (IOError, OSError) as e:
+                    if e.errno != errno.EMLINK:  # too many links to this file, not to others
+                        can_link = False
+            shutil.copy2(src_path, dst_path)
+            staged.copied += 1
+    # As shutil.copytree(), the folders stats once their contents are copied
+    for src_folder, dst_folder in reversed(folders):
+        shutil.copystat(src_folder, dst_folder)
+    staged.elapsed = time.time() - start
+    return staged
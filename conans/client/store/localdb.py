@@ -1,5 +1,6 @@
 import os
 import sqlite3
+import struct
 from contextlib import contextmanager
 from sqlite3 import OperationalError
 
@@ -7,6 +8,8 @@ from conans.errors import ConanException
 from conans.util import encrypt
 
 REMOTES_USER_TABLE = "users_remotes"
+# https://www.sqlite.org/fileformat.html#file_change_counter, 4 bytes big-endian
+_CHANGE_COUNTER_OFFSET = 24
 
 
 class LocalDB(object):
@@ -14,6 +17,24 @@ class LocalDB(object):
     def __init__(self, dbfile, encryption_key):
         self.dbfile = dbfile
         self.encryption_key = encryption_key
+        # The logins read or stored, not read again while the database file doesn't change
+        self._logins = {}  # {remote_url: (user, token, refresh_token)}
+        self._logins_stamp = None
+
+    def _stamp(self):
+        """ The file change counter of the database header, incremented by SQLite in every
+        transaction that modifies it, also the ones updating a row in place, that usually don't
+        change the file size and can keep its mtime within the file system time resolution
+        """
+        try:
+            with open(self.dbfile, "rb") as f:
+                header = f.read(_CHANGE_COUNTER_OFFSET + 4)
+                inode = os.fstat(f.fileno()).st_ino
+        except (IOError, OSError):
+            return None
+        if len(header) < _CHANGE_COUNTER_OFFSET + 4:  # Empty, not initialized yet
+            return inode, None
+        return inode, struct.unpack(">I", header[_CHANGE_COUNTER_OFFSET:])[0]
 
     def _encode(self, value):
         if value and self.encryption_key:
@@ -26,6 +47,7 @@ class LocalDB(object):
         return value
 
     def clean(self):
+        self._logins.clear()
         with self._connect() as connection:
             try:
                 cursor = connection.cursor()
@@ -73,6 +95,13 @@ class LocalDB(object):
 
     def get_login(self, remote_url):
         """ Returns login credentials. This method is also in charge of expiring them. """
+        stamp = self._stamp()
+        if stamp != self._logins_stamp:  # Written by other LocalDB or process
+            self._logins = {}
+            self._logins_stamp = stamp
+        login = self._logins.get(remote_url)
+        if login is not None:
+            return login
         with self._connect() as connection:
             try:
                 statement = connection.cursor()
@@ -80,28 +109,32 @@ class LocalDB(object):
                                   % (REMOTES_USER_TABLE, remote_url))
                 rs = statement.fetchone()
                 if not rs:
-                    return None, None, None
-                name = rs[0]
-                token = self._decode(rs[1])
-                refresh_token = self._decode(rs[2])
-                return name, token, refresh_token
+                    login = None, None, None
+                else:
+                    login = rs[0], self._decode(rs[1]), self._decode(rs[2])
             except Exception:
                 raise ConanException("Couldn't read login\n Try removing '%s' file" % self.dbfile)
+        self._logins[remote_url] = login
+        return login
 
     def get_username(self, remote_url):
         return self.get_login(remote_url)[0]
 
     def store(self, user, token, refresh_token, remote_url):
         """ Login is a tuple of (user, token) """
+        self._logins.pop(remote_url, None)
+        stamp = self._stamp()
         with self._connect() as connection:
             try:
-                token = self._encode(token)
-                refresh_token = self._encode(refresh_token)
                 statement = connection.cursor()
                 statement.execute("INSERT OR REPLACE INTO %s (remote_url, user, token, "
                                   "refresh_token) "
                                   "VALUES (?, ?, ?, ?)" % REMOTES_USER_TABLE,
-                                  (remote_url, user, token, refresh_token))
+                                  (remote_url, user, self._encode(token),
+                                   self._encode(refresh_token)))
                 connection.commit()
             except Exception as e:
                 raise ConanException("Could not store credentials %s" % str(e))
+        if self._logins_stamp == stamp:
+            self._logins_stamp = self._stamp()
+            self._logins[remote_url] = user, token, refresh_token
@@ -176,7 +176,7 @@ class Git(SCMBase):
             output += self.run("checkout -t origin/%s" % branch)
         return output
 
-    def clone(self, url, branch=None, args="", shallow=False):
+    def clone(self, url, branch=None, args="", shallow=False, mirrors=None):
         """
         :param url: repository remote URL to clone from (e.g. https, git or local)
         :param branch: actually, can be any valid git ref expression like,
@@ -187,6 +187,7 @@ class Git(SCMBase):
         - expression like HEAD~1
         :param args: additional arguments to be passed to the git command (e.g. config args)
         :param shallow:
+        :param mirrors: GitMirrors, clone from the local mirror of the url, updating it first
         :return: output of the clone command
         """
         # TODO: rename "branch" -> "element" in Conan 2.0
@@ -194,6 +195,8 @@ class Git(SCMBase):
         if os.path.exists(url):
             url = url.replace("\\", "/")  # Windows local directory
         mkdir(self.folder)  # might not exist in case of shallow clone
+        if mirrors is not None:
+            return self._clone_mirror(url, branch, args, mirrors)
         if os.listdir(self.folder):
             return self._fetch(url, branch, shallow)
         if shallow and branch:
@@ -204,6 +207,18 @@ class Git(SCMBase):
 
         return output
 
+    def _clone_mirror(self, url, branch, args, mirrors):
+        # A local clone is cheap, it is never shallow. The origin is the url, as cloning from it
+        mirror = mirrors.update(url, branch, verify_ssl=self._verify_ssl).replace("\\", "/")
+        if os.listdir(self.folder):
+            output = self._fetch(mirror, branch, shallow=False)
+        else:
+            output = self.run('clone "%s" . %s' % (mirror, args))
+            if branch:
+                output += self.run('checkout "%s"' % branch)
+        output += self.run('remote set-url origin "%s"' % url)
+        return output
+
     def checkout(self, element, submodule=None):
         # Element can be a tag, branch or commit
         self.check_repo()
@@ -7,13 +7,23 @@ if platform.system() == "Darwin":
     from multiprocessing import freeze_support
     freeze_support() # fixing tqdm on macos
 
-if os.getenv("CONAN_V2_CLI"):
-    from conans.cli.cli import main
-else:
-    from conans.client.command import main
+
+def main(args):
+    if os.getenv("CONAN_V2_CLI"):
+        from conans.cli.cli import main as cli_main
+    else:
+        from conans.client.command import main as cli_main
+    cli_main(args)
 
 
 def run():
+    # The command runs in the conan daemon if there is one, without importing the client here
+    socket_path = os.getenv("CONAN_DAEMON_SOCKET")
+    if socket_path and not os.getenv("CONAN_V2_CLI"):
+        from conans.client.daemon.client import run_in_daemon
+        exit_code = run_in_daemon(socket_path, sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
     main(sys.argv[1:])
 
 
@@ -0,0 +1,24 @@
+import argparse
+import signal
+
+from conans.client.daemon.server import ConanDaemon
+from conans.util.env_reader import get_env
+
+
+def run():
+    parser = argparse.ArgumentParser(description='Launch the conan daemon, which runs the '
+                                                 'commands of the conan invocations with '
+                                                 'CONAN_DAEMON_SOCKET defined')
+    parser.add_argument('--socket', '-s', default=None,
+                        help='Unix domain socket to listen in (CONAN_DAEMON_SOCKET by default)')
+    args = parser.parse_args()
+    socket_path = args.socket or get_env("CONAN_DAEMON_SOCKET")
+    if not socket_path:
+        parser.error("Specify the socket with --socket or CONAN_DAEMON_SOCKET")
+    daemon = ConanDaemon(socket_path)
+    signal.signal(signal.SIGTERM, lambda _, __: daemon.stop())
+    daemon.serve_forever()
+
+
+if __name__ == '__main__':
+    run()
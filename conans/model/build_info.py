@@ -441,7 +441,10 @@ class _BaseDepsCppInfo(_CppInfo):
 
     def update(self, dep_cpp_info):
         def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
+            if not seq2:
+                return list(seq1)
+            seq2_set = set(seq2)
+            return [s for s in seq1 if s not in seq2_set] + seq2
 
         self.system_libs = merge_lists(self.system_libs, dep_cpp_info.system_libs)
         self.includedirs = merge_lists(self.includedirs, dep_cpp_info.include_paths)
@@ -8,9 +8,14 @@ from conans.errors import ConanException
 
 BUILT_IN_CONFS = {
     "core:required_conan_version": "Raise if current version does not match the defined range",
+    "core.install:incremental": "(boolean) Skip the 'conan install' of a consumer conanfile if nothing changed since the previous install in the same install folder: conanfile, profiles, lockfile, arguments and the recipes and packages in the cache (False by default)",
+    "core.package_id:compatible_packages_listing": "(boolean) Look for the compatible packages in the list of binaries of the recipe revision in the remote, instead of requesting them one by one, if the remote cannot return many packages in one request (False by default)",
     "core.package_id:msvc_visual_incompatible": "Allows opting-out the fallback from the new msvc compiler to the Visual Studio compiler existing binaries",
     "core:default_profile": "Defines the default host profile ('default' by default)",
     "core:default_build_profile": "Defines the default build profile (None by default)",
+    "core.upload:compression_format": "Format of the uploaded package archives: 'gzip' (default), 'xz' or 'none' (uncompressed tar), if the remote supports it",
+    "core.build:sources_staging": "How the sources are copied to the build folder: 'copy' (default) or 'cow' (clone the files if the file system supports it, otherwise hardlink the files matching the 'read_only_sources' patterns of the recipe and copy the others)",
+    "core.scm:git_mirrors": "(boolean) Clone the 'scm' git repositories from local mirrors in the cache, fetching only the missing commits (False by default)",
     "tools.android:ndk_path": "Argument for the CMAKE_ANDROID_NDK",
     "tools.build:skip_test": "Do not execute CMake.test() and Meson.test() when enabled",
     "tools.build:jobs": "Default compile jobs number -jX Ninja, Make, /MP VS (default: max CPUs)",
@@ -64,6 +69,8 @@ BUILT_IN_CONFS = {
     "tools.meson.mesontoolchain:backend": "Set the Meson backend. Possible values: 'ninja', 'vs', 'vs2010', 'vs2015', 'vs2017', 'vs2019', 'xcode'",
     "tools.meson.mesontoolchain:extra_machine_files": "List of paths for any additional native/cross file references to be appended to the existing Conan ones",
     "tools.files.download:download_cache": "Location for the download cache",
+    "tools.files.download:download_cache_max_size": "Maximum size of the download cache, like '10GB', least recently used files are evicted",
+    "tools.scm:git_mirrors_folder": "Folder of local git mirrors, the clones of conan.tools.scm.Git clone from them, fetching only the missing commits",
     "tools.build.cross_building:can_run": "Set the return value for the 'conan.tools.build.can_run()' tool",
 }
 
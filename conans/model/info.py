@@ -20,6 +20,8 @@ PACKAGE_ID_INVALID = "INVALID"
 class RequirementInfo(object):
 
     def __init__(self, pref, default_package_id_mode, indirect=False):
+        self._parent = None  # The RequirementsInfo, its memoized sha depends on this one
+        self._cache = {}  # Memoized sha, reset when any of the fields change
         self.package = pref
         self.full_name = pref.ref.name
         self.full_version = pref.ref.version
@@ -37,15 +39,19 @@ class RequirementInfo(object):
         else:
             func_package_id_mode()
 
+    def __setattr__(self, attr, value):
+        fields = self.__dict__
+        fields[attr] = value
+        if attr[0] != "_":
+            fields["_cache"] = {}
+            if fields["_parent"] is not None:
+                fields["_parent"]._cache = {}
+
     def copy(self):
         # Useful for build_id()
-        result = RequirementInfo(self.package, "unrelated_mode")
-        for f in ("name", "version", "user", "channel", "recipe_revision", "package_id",
-                  "package_revision"):
-
-            setattr(result, f, getattr(self, f))
-            f = "full_%s" % f
-            setattr(result, f, getattr(self, f))
+        result = RequirementInfo.__new__(RequirementInfo)
+        result.__dict__.update(self.__dict__)
+        result.__dict__.update(_parent=None, _cache=self._cache.copy(), _indirect=False)
         return result
 
     def dumps(self):
@@ -64,6 +70,11 @@ class RequirementInfo(object):
 
     @property
     def sha(self):
+        if "sha" not in self._cache:
+            self._cache["sha"] = self._sha()
+        return self._cache["sha"]
+
+    def _sha(self):
         if self.package_id == PACKAGE_ID_UNKNOWN or self.package_revision == PREV_UNKNOWN:
             return None
         if self.package_id == PACKAGE_ID_INVALID:
@@ -165,29 +176,39 @@ class RequirementsInfo(object):
 
     def __init__(self, prefs, default_package_id_mode):
         # {PackageReference: RequirementInfo}
-        self._data = {pref: RequirementInfo(pref, default_package_id_mode=default_package_id_mode)
-                      for pref in prefs}
+        self._data = {}
+        self._cache = {}  # Memoized sha, reset when a requirement is added, removed or changed
+        for pref in prefs:
+            self._set(pref, RequirementInfo(pref, default_package_id_mode=default_package_id_mode))
+
+    def _set(self, pref, req_info):
+        req_info._parent = self
+        self._data[pref] = req_info
+        self._cache = {}
 
     def copy(self):
         # For build_id() implementation
         result = RequirementsInfo([], None)
-        result._data = {pref: req_info.copy() for pref, req_info in self._data.items()}
+        for pref, req_info in self._data.items():
+            result._set(pref, req_info.copy())
         return result
 
     def clear(self):
         self._data = {}
+        self._cache = {}
 
     def remove(self, *args):
         for name in args:
             del self._data[self._get_key(name)]
+        self._cache = {}
 
     def add(self, prefs_indirect, default_package_id_mode):
         """ necessary to propagate from upstream the real
         package requirements
         """
         for r in prefs_indirect:
-            self._data[r] = RequirementInfo(r, indirect=True,
-                                            default_package_id_mode=default_package_id_mode)
+            self._set(r, RequirementInfo(r, indirect=True,
+                                         default_package_id_mode=default_package_id_mode))
 
     def refs(self):
         """ used for updating downstream requirements with this
@@ -214,6 +235,11 @@ class RequirementsInfo(object):
 
     @property
     def sha(self):
+        if "sha" not in self._cache:
+            self._cache["sha"] = self._sha()
+        return self._cache["sha"]
+
+    def _sha(self):
         result = []
         # Remove requirements without a name, i.e. indirect transitive requirements
         data = {k: v for k, v in self._data.items() if v.name}
@@ -514,7 +540,8 @@ class ConanInfo(object):
         q = self.copy()
         q.full_settings = self.full_settings.copy()
         q.full_options = self.full_options.copy()
-        q.full_requires = _PackageReferenceList.loads(self.full_requires.dumps())
+        # The PackageReferences are immutable, they can be shared, no need to parse them again
+        q.full_requires = _PackageReferenceList(self.full_requires)
         return q
 
     def __eq__(self, other):
@@ -51,6 +51,8 @@ class LockBundle(object):
             return r
 
         result = LockBundle()
+        pid_nodes = {}  # {(ref, package_id): package node}, the packages lists are not searched
+        requires_sets = {}  # {ref: set(requires)}
         for lockfile_name in lockfiles:
             lockfile_abs = os.path.normpath(os.path.join(cwd, lockfile_name))
             lockfile = GraphLockFile.load(lockfile_abs, revisions_enabled)
@@ -61,14 +63,10 @@ class LockBundle(object):
                 ref_str = ref_convert(ref_str)
                 ref_node = result._nodes.setdefault(ref_str, {})
                 packages_node = ref_node.setdefault("packages", [])
-                # Find existing package_id in the list of packages
-                # This is the equivalent of a setdefault over a dict, but on a list
-                for pkg in packages_node:
-                    if pkg["package_id"] == node.package_id:
-                        pid_node = pkg
-                        break
-                else:
+                pid_node = pid_nodes.get((ref_str, node.package_id))
+                if pid_node is None:
                     pid_node = {"package_id": node.package_id}
+                    pid_nodes[(ref_str, node.package_id)] = pid_node
                     packages_node.append(pid_node)
                 ids = pid_node.setdefault("lockfiles", {})
                 # TODO: Add check that this prev is always the same
@@ -81,7 +79,9 @@ class LockBundle(object):
                     ref = require_node.ref.full_str()
                     ref = ref_convert(ref)
                     requires = ref_node.setdefault("requires", [])
-                    if ref not in requires:
+                    requires_set = requires_sets.setdefault(ref_str, set())
+                    if ref not in requires_set:
+                        requires_set.add(ref)
                         requires.append(ref)
 
         return result
@@ -95,28 +95,46 @@ class LockBundle(object):
 
     def build_order(self):
         # First do a topological order by levels, the ids of the nodes are stored
-        levels = []
-        opened = list(self._nodes.keys())
-        while opened:
-            current_level = []
-            closed = []
-            for o in opened:
-                node = self._nodes[o]
-                requires = node.get("requires", [])
-                if not any(n in opened for n in requires):  # Doesn't have an open requires
-                    # iterate all packages to see if some has prev=null
-                    if any(pkg["prev"] is None for pkg in node["packages"]):
-                        current_level.append(o)
-                    closed.append(o)
+        dependants = {}  # {ref: [refs requiring it]}
+        pending = {}  # {ref: number of its requires not closed yet}
+        for ref, node in self._nodes.items():
+            requires = set(r for r in node.get("requires", []) if r in self._nodes)
+            pending[ref] = len(requires)
+            for require in requires:
+                dependants.setdefault(require, []).append(ref)
 
+        levels = []
+        closed = [ref for ref, count in pending.items() if not count]
+        while closed:
+            # iterate all packages to see if some has prev=null
+            current_level = sorted(ref for ref in closed
+                                   if any(pkg["prev"] is None
+                                          for pkg in self._nodes[ref]["packages"]))
             if current_level:
-                current_level.sort()
                 levels.append(current_level)
-            # now initialize new level
-            opened = set(opened).difference(closed)
+            # now initialize new level, with the nodes whose requires are all closed
+            next_closed = []
+            for ref in closed:
+                for dependant in dependants.get(ref, []):
+                    pending[dependant] -= 1
+                    if not pending[dependant]:
+                        next_closed.append(dependant)
+            closed = next_closed
 
         return levels
 
+    @staticmethod
+    def _load_lockfiles(bundle, revisions_enabled):
+        """ every lockfile of the bundle loaded once: {lockfile path: GraphLockFile}
+        """
+        graph_locks = {}
+        for node in bundle._nodes.values():
+            for pkg in node["packages"]:
+                for lockfile in pkg["lockfiles"]:
+                    if lockfile not in graph_locks:
+                        graph_locks[lockfile] = GraphLockFile.load(lockfile, revisions_enabled)
+        return graph_locks
+
     @staticmethod
     def update_bundle(bundle_path, revisions_enabled):
         """ Update both the bundle information as well as every individual lockfile, from the
@@ -125,6 +143,8 @@ class LockBundle(object):
         """
         bundle = LockBundle()
         bundle.loads(load(bundle_path))
+        graph_locks = LockBundle._load_lockfiles(bundle, revisions_enabled)
+        modified_lockfiles = set()
         for node in bundle._nodes.values():
             # Each node in bundle belongs to a "ref", and contains lockinfo for every package_id
             for pkg in node["packages"]:
@@ -133,8 +153,7 @@ class LockBundle(object):
                 # First, compute the modified PREV from all lockfiles
                 prev = modified = prev_lockfile = None
                 for lockfile, nodes_ids in pkg["lockfiles"].items():
-                    graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
-                    graph_lock = graph_lock_conf.graph_lock
+                    graph_lock = graph_locks[lockfile].graph_lock
 
                     for node_id in nodes_ids:
                         # Make sure the PREV from lockfiles is consistent, it cannot be different
@@ -153,13 +172,15 @@ class LockBundle(object):
 
                 # Then, update all prev of all config lockfiles
                 for lockfile, nodes_ids in pkg["lockfiles"].items():
-                    graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
-                    graph_lock = graph_lock_conf.graph_lock
+                    graph_lock = graph_locks[lockfile].graph_lock
                     for node_id in nodes_ids:
-                        if graph_lock.nodes[node_id].prev is None:
+                        if graph_lock.nodes[node_id].prev is None and prev is not None:
                             graph_lock.nodes[node_id].prev = prev
-                    graph_lock_conf.save(lockfile)
+                            modified_lockfiles.add(lockfile)
 
+        # Each lockfile is written once, after all of them are consistent
+        for lockfile in sorted(modified_lockfiles):
+            graph_locks[lockfile].save(lockfile)
         save(bundle_path, bundle.dumps())
 
     @staticmethod
@@ -170,9 +191,9 @@ class LockBundle(object):
             for pkg in node["packages"]:
                 pkg["modified"] = None
 
-                for lockfile, nodes_ids in pkg["lockfiles"].items():
-                    graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
-                    graph_lock_conf.graph_lock.clean_modified()
-                    graph_lock_conf.save(lockfile)
+        for lockfile, graph_lock_conf in LockBundle._load_lockfiles(bundle,
+                                                                    revisions_enabled).items():
+            graph_lock_conf.graph_lock.clean_modified()
+            graph_lock_conf.save(lockfile)
 
         save(bundle_path, bundle.dumps())
@@ -60,6 +60,7 @@ class PackageOptionValues(object):
         self._dict = {}  # {option_name: PackageOptionValue}
         self._modified = {}
         self._freeze = False
+        self._sha = None  # Memoized, reset when the values change
 
     def __bool__(self):
         return bool(self._dict)
@@ -79,9 +80,11 @@ class PackageOptionValues(object):
         if attr not in self._dict:
             return
         del self._dict[attr]
+        self._sha = None
 
     def clear(self):
         self._dict.clear()
+        self._sha = None
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -93,11 +96,13 @@ class PackageOptionValues(object):
         if attr[0] == "_":
             return super(PackageOptionValues, self).__setattr__(attr, value)
         self._dict[attr] = PackageOptionValue(value)
+        self._sha = None
 
     def copy(self):
         result = PackageOptionValues()
         for k, v in self._dict.items():
             result._dict[k] = v
+        result._sha = self._sha
         return result
 
     @property
@@ -114,16 +119,20 @@ class PackageOptionValues(object):
         assert isinstance(option_text, six.string_types)
         name, value = option_text.split("=")
         self._dict[name.strip()] = PackageOptionValue(value.strip())
+        self._sha = None
 
     def add_option(self, option_name, option_value):
         self._dict[option_name] = PackageOptionValue(option_value)
+        self._sha = None
 
     def update(self, other):
         assert isinstance(other, PackageOptionValues)
         self._dict.update(other._dict)
+        self._sha = None
 
     def remove(self, option_name):
         del self._dict[option_name]
+        self._sha = None
 
     def freeze(self):
         self._freeze = True
@@ -152,20 +161,23 @@ class PackageOptionValues(object):
             else:
                 self._modified[name] = (value, down_ref)
                 self._dict[name] = value
+                self._sha = None
 
     def serialize(self):
         return self.items()
 
     @property
     def sha(self):
-        result = []
-        for name, value in self.items():
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value:
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            for name, value in self.items():
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value:
+                    result.append("%s=%s" % (name, value))
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
 
 
 class OptionsValues(object):
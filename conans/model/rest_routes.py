@@ -4,6 +4,8 @@ class RestRoutes(object):
     common_authenticate = "users/authenticate"
     oauth_authenticate = "users/token"
     common_check_credentials = "users/check_credentials"
+    packages_info = "conans/packages/info"
+    snapshots = "conans/snapshots"
 
     def __init__(self, matrix_params=False):
         if matrix_params:
@@ -111,6 +113,10 @@ class RestRoutes(object):
     def v1_remove_recipe_files(self):
         return "%s/remove_files" % self.recipe
 
+    @property
+    def v1_remove_package_files(self):
+        return "%s/remove_files" % self.package
+
     @property
     def v1_remove_packages(self):
         return "%s/packages/delete" % self.recipe
@@ -91,9 +91,10 @@ class SCMData(object):
 class SCM(object):
     availables = {'git': Git, 'svn': SVN}
 
-    def __init__(self, data, repo_folder, output):
+    def __init__(self, data, repo_folder, output, git_mirrors=None):
         self._data = data
         self._output = output
+        self._git_mirrors = git_mirrors  # GitMirrors to clone git repositories from
         self.repo_folder = repo_folder
         # Finally instance a repo
         self.repo = self._get_repo()
@@ -125,7 +126,11 @@ class SCM(object):
         output = ""
         if self._data.type == "git":
             def use_not_shallow():
-                out = self.repo.clone(url=self._data.url, shallow=False)
+                # A mirror that already has the commit is not updated, a plain clone cannot use
+                # a commit as its branch, it checks it out afterwards
+                branch = self._data.revision if self._git_mirrors is not None else None
+                out = self.repo.clone(url=self._data.url, branch=branch, shallow=False,
+                                      mirrors=self._git_mirrors)
                 out += self.repo.checkout(element=self._data.revision,
                                           submodule=self._data.submodule)
                 return out
@@ -133,7 +138,7 @@ class SCM(object):
             def use_shallow():
                 try:
                     out = self.repo.clone(url=self._data.url, branch=self._data.revision,
-                                          shallow=True)
+                                          shallow=True, mirrors=self._git_mirrors)
                 except subprocess.CalledProcessError:
                     # remove the .git directory, otherwise, fallback clone cannot be successful
                     # it's completely safe to do here, as clone without branch expects
@@ -1,9 +1,20 @@
+import copy
+from functools import lru_cache
+
 import yaml
 
 from conans.errors import ConanException
 from conans.model.values import Values
 
 
+@lru_cache(maxsize=8)
+def _parse_settings_yml(text):
+    """ the same settings.yml is loaded many times per command (and per process, the conan
+    daemon), the Settings are built from a copy of the parsed one
+    """
+    return yaml.safe_load(text) or {}
+
+
 def bad_value_msg(name, value, value_range):
     tip = ""
     if "settings" in name:
@@ -247,7 +258,7 @@ class Settings(object):
     @staticmethod
     def loads(text):
         try:
-            return Settings(yaml.safe_load(text) or {})
+            return Settings(copy.deepcopy(_parse_settings_yml(text)))
         except (yaml.YAMLError, AttributeError) as ye:
             raise ConanException("Invalid settings.yml format: {}".format(ye))
 
@@ -7,6 +7,15 @@ class Values(object):
         self._value = str(value)
         self._dict = {}  # {key: Values()}
         self._modified = {}  # {"compiler.version.arch": (old_value, old_reference)}
+        self._parent = None
+        # Memoized as_list() and sha, reset when this value or any of its children change
+        self._cache = {}
+
+    def _changed(self):
+        node = self
+        while node is not None:
+            node._cache = {}
+            node = node._parent
 
     def get_safe(self, attr):
         values = [v[1] for v in self.as_list() if v[0] == attr]
@@ -21,23 +30,30 @@ class Values(object):
         if attr not in self._dict:
             return
         del self._dict[attr]
+        self._changed()
 
     def clear(self):
         # TODO: Test. DO not delete, might be used by package_id() to clear settings values
         self._dict.clear()
         self._value = ""
+        self._changed()
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(Values, self).__setattr__(attr, value)
-        self._dict[attr] = Values(value)
+        child = Values(value)
+        child._parent = self
+        self._dict[attr] = child
+        self._changed()
 
-    def copy(self):
-        """ deepcopy, recursive
+    def copy(self, _parent=None):
+        """ deepcopy, recursive. The memoized as_list() and sha are kept, they are the same
         """
-        result = Values(self._value)
-        for k, v in self._dict.items():
-            result._dict[k] = v.copy()
+        # Filling the __dict__ directly, this is called for every node of every info.clone()
+        result = Values.__new__(Values)
+        result.__dict__.update(_value=self._value, _modified={}, _parent=_parent,
+                               _cache=self._cache.copy())
+        result.__dict__["_dict"] = {k: v.copy(result) for k, v in self._dict.items()}
         return result
 
     @property
@@ -84,15 +100,18 @@ class Values(object):
             setattr(attr, list_settings[-1], value)
 
     def as_list(self, list_all=True):
-        result = []
-        for field in self.fields:
-            value = getattr(self, field)
-            if value or list_all:
-                result.append((field, str(value)))
-                child_lines = value.as_list()
-                for (child_name, child_value) in child_lines:
-                    result.append(("%s.%s" % (field, child_name), child_value))
-        return result
+        result = self._cache.get(("as_list", list_all))
+        if result is None:
+            result = []
+            for field in self.fields:
+                value = getattr(self, field)
+                if value or list_all:
+                    result.append((field, str(value)))
+                    child_lines = value.as_list()
+                    for (child_name, child_value) in child_lines:
+                        result.append(("%s.%s" % (field, child_name), child_value))
+            self._cache[("as_list", list_all)] = result
+        return list(result)
 
     @classmethod
     def from_list(cls, data):
@@ -122,11 +141,14 @@ class Values(object):
 
     @property
     def sha(self):
-        result = []
-        for (name, value) in self.as_list(list_all=False):
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value != "None":
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        sha = self._cache.get("sha")
+        if sha is None:
+            result = []
+            for (name, value) in self.as_list(list_all=False):
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value != "None":
+                    result.append("%s=%s" % (name, value))
+            sha = self._cache["sha"] = sha1('\n'.join(result).encode())
+        return sha
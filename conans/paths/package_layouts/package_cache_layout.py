@@ -23,6 +23,19 @@ from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
 from conans.util.log import logger
 
 
+ACCESS_FOLDER = ".access"
+
+
+def _touch_access(path):
+    try:
+        os.utime(path, None)
+    except OSError:  # First time this item is accessed, or the folder was removed
+        try:
+            save(path, "")
+        except (IOError, OSError):
+            pass  # Never fail because of tracking, this is just for garbage collection
+
+
 def short_path(func):
     if platform.system() == "Windows" or OSInfo().is_cygwin:  # Not for other subsystems
         from conans.util.windows import path_shortener
@@ -150,6 +163,9 @@ class PackageCacheLayout(object):
                                  "Close any app using it, and retry" % (pkg_folder, str(e)))
         if is_dirty(pkg_folder):
             clean_dirty(pkg_folder)
+        access_file = self._access_file(pref.id)
+        if os.path.exists(access_file):
+            os.remove(access_file)
         # FIXME: This fails at the moment, but should be fixed
         # with self.update_metadata() as metadata:
         #    metadata.clear_package(pref.id)
@@ -264,6 +280,37 @@ class PackageCacheLayout(object):
             finally:
                 thread_lock.release()
 
+    # Access tracking, to garbage collect least recently used items
+    def _access_file(self, package_id=None):
+        return os.path.join(self._base_folder, ACCESS_FOLDER, package_id or "recipe")
+
+    def record_recipe_access(self):
+        _touch_access(self._access_file())
+
+    def record_package_access(self, pref):
+        assert isinstance(pref, PackageReference)
+        _touch_access(self._access_file(pref.id))
+
+    def recipe_last_access(self):
+        """ timestamp of the last time this recipe was used, or the export time if it was never
+        used since access tracking exists
+        """
+        for path in (self._access_file(), self.export()):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                pass
+        return None
+
+    def package_last_access(self, pref):
+        assert isinstance(pref, PackageReference)
+        for path in (self._access_file(pref.id), self.package(pref)):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                pass
+        return None
+
     # Locks
     def conanfile_read_lock(self, output):
         if self._no_lock:
@@ -5,7 +5,7 @@ import os
 from bottle import request
 
 from conans import DEFAULT_REVISION_V1
-from conans.model.ref import ConanFileReference
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.server.rest.bottle_routes import BottleRoutes
 from conans.server.service.v1.service import ConanService
 
@@ -46,3 +46,14 @@ class DeleteController(object):
             payload = json.load(reader(request.body))
             files = [os.path.normpath(filename) for filename in payload["files"]]
             conan_service.remove_conanfile_files(ref, files)
+
+        @app.route('%s/remove_files' % r.package, method="POST")
+        def remove_package_files(name, version, username, channel, package_id, auth_user):
+            # Also part of the upload process, when the package archive changes its format
+            ref = ConanFileReference(name, version, username, channel, DEFAULT_REVISION_V1)
+            pref = PackageReference(ref, package_id, DEFAULT_REVISION_V1)
+            conan_service = ConanService(app.authorizer, app.server_store, auth_user)
+            reader = codecs.getreader("utf-8")
+            payload = json.load(reader(request.body))
+            files = [os.path.normpath(filename) for filename in payload["files"]]
+            conan_service.remove_package_files(pref, files)
@@ -4,6 +4,7 @@ from conans.errors import NotFoundException
 from conans.model.ref import ConanFileReference
 from conans.server.rest.bottle_routes import BottleRoutes
 from conans.server.rest.controller.v2 import get_package_ref
+from conans.server.service.file_transfer import StreamedUpload
 from conans.server.service.v2.service_v2 import ConanServiceV2
 
 
@@ -39,8 +40,8 @@ class ConanControllerV2(object):
                 raise NotFoundException("Non checksum storage")
             pref = get_package_ref(name, version, username, channel, package_id,
                                    revision, p_revision)
-            conan_service.upload_package_file(request.body, request.headers, pref,
-                                              the_path, auth_user)
+            conan_service.upload_package_file(StreamedUpload.from_request(), pref, the_path,
+                                              auth_user)
 
         @app.route(r.recipe_revision_files, method=["GET"])
         def get_recipe_file_list(name, version, username, channel, auth_user, revision):
@@ -59,5 +60,6 @@ class ConanControllerV2(object):
             if "X-Checksum-Deploy" in request.headers:
                 raise NotFoundException("Not a checksum storage")
             ref = ConanFileReference(name, version, username, channel, revision)
-            conan_service.upload_recipe_file(request.body, request.headers, ref, the_path, auth_user)
+            conan_service.upload_recipe_file(StreamedUpload.from_request(), ref, the_path,
+                                             auth_user)
 
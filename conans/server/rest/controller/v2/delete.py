@@ -38,6 +38,16 @@ class DeleteControllerV2(object):
             conan_service = ConanService(app.authorizer, app.server_store, auth_user)
             conan_service.remove_package(pref)
 
+        @app.route(r.package_revision_file, method="DELETE")
+        def remove_package_file(name, version, username, channel, package_id, revision,
+                                p_revision, the_path, auth_user):
+            """ Remove a single file of a package revision, like a package archive replaced by
+            one of other format"""
+            pref = get_package_ref(name, version, username, channel, package_id,
+                                   revision, p_revision)
+            conan_service = ConanService(app.authorizer, app.server_store, auth_user)
+            conan_service.remove_package_files(pref, [the_path])
+
         @app.route(r.packages_revision, method="DELETE")
         def remove_all_packages(name, version, username, channel, auth_user, revision=None):
             """ Remove all packages from a RREV"""
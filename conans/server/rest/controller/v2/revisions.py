@@ -1,4 +1,10 @@
-from conans.model.ref import ConanFileReference
+import codecs
+import json
+
+from bottle import request
+
+from conans.errors import RequestErrorException
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.server.rest.bottle_routes import BottleRoutes
 from conans.server.rest.controller.v2 import get_package_ref
 from conans.server.service.v2.service_v2 import ConanServiceV2
@@ -52,6 +58,41 @@ class RevisionsController(object):
             rev = conan_service.get_latest_package_revision(package_reference, auth_user)
             return _format_rev_return(rev)
 
+        @app.route(r.packages_info, method="POST")
+        def get_packages_info(auth_user):
+            """ Gets a JSON with the latest revision and the conaninfo.txt of many packages,
+            the body is {"packages": [pref full_str, ...]}
+            """
+            reader = codecs.getreader("utf-8")
+            try:
+                payload = json.load(reader(request.body))
+                prefs = [PackageReference.loads(p) for p in payload["packages"]]
+            except Exception as e:
+                raise RequestErrorException("Invalid packages info request: {}".format(e))
+            conan_service = ConanServiceV2(app.authorizer, app.server_store)
+            infos = conan_service.get_packages_info(prefs, auth_user)
+            return {"packages": {pref.full_str(): info for pref, info in infos.items()}}
+
+        @app.route(r.snapshots, method="POST")
+        def get_snapshots(auth_user):
+            """ Gets a JSON with the files and the conanmanifest.txt of many recipe and package
+            revisions, the body is {"recipes": [ref full_str, ...], "packages": [pref full_str]}
+            """
+            reader = codecs.getreader("utf-8")
+            try:
+                payload = json.load(reader(request.body))
+                refs = [ConanFileReference.loads(r) for r in payload.get("recipes", [])]
+                prefs = [PackageReference.loads(p) for p in payload.get("packages", [])]
+            except Exception as e:
+                raise RequestErrorException("Invalid snapshots request: {}".format(e))
+            if any(ref.revision is None for ref in refs) or \
+                    any(pref.ref.revision is None or pref.revision is None for pref in prefs):
+                raise RequestErrorException("Invalid snapshots request: revisions are required")
+            conan_service = ConanServiceV2(app.authorizer, app.server_store)
+            recipes, packages = conan_service.get_snapshots(refs, prefs, auth_user)
+            return {"recipes": {ref.full_str(): snap for ref, snap in recipes.items()},
+                    "packages": {pref.full_str(): snap for pref, snap in packages.items()}}
+
 
 def _format_rev_return(rev):
     return {"revision": rev[0],
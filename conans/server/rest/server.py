@@ -1,9 +1,64 @@
+import os
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler
+
 import bottle
 
 from conans.server.rest.api_v1 import ApiV1
 from conans.server.rest.api_v2 import ApiV2
 
 
+class _SendfileServerHandler(ServerHandler):
+    """ Sends the files returned with the wsgi.file_wrapper (the downloads) with os.sendfile(),
+    from the file to the socket, without reading them in python
+    """
+    def sendfile(self):
+        sock = getattr(self.request_handler, "connection", None)
+        content_length = self.headers.get("Content-Length")
+        if sock is None or content_length is None or not hasattr(os, "sendfile"):
+            return False
+        try:
+            fileno = self.result.filelike.fileno()
+            offset = self.result.filelike.tell()  # The start of the range if it is a FileRange
+        except (AttributeError, OSError, ValueError):
+            return False
+        if not self.headers_sent:
+            self.send_headers()
+        self._flush()
+        count = int(content_length)
+        sent = 0
+        while sent < count:
+            chunk = os.sendfile(sock.fileno(), fileno, offset + sent, count - sent)
+            if not chunk:  # The file is shorter, the client will detect it
+                break
+            sent += chunk
+        self.bytes_sent += sent
+        return True
+
+
+class _SendfileRequestHandler(WSGIRequestHandler):
+    """ The request handler of the bottle "wsgiref" server, with the _SendfileServerHandler
+    """
+    def address_string(self):  # No reverse DNS lookups, like bottle
+        return self.client_address[0]
+
+    def handle(self):
+        """ Like WSGIRequestHandler.handle()
+        """
+        self.raw_requestline = self.rfile.readline(65537)
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            return
+        if not self.parse_request():
+            return
+        handler = _SendfileServerHandler(self.rfile, self.wfile, self.get_stderr(),
+                                         self.get_environ(), multithread=False)
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+
 class ConanServer(object):
     """
         Server class. Instances api_v1 application and run it.
@@ -43,4 +98,5 @@ class ConanServer(object):
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
         bottle.Bottle.run(self.root_app, host=host,
-                          port=port, debug=debug_set, reloader=False)
+                          port=port, debug=debug_set, reloader=False,
+                          handler_class=_SendfileRequestHandler)
@@ -56,5 +56,9 @@ class CommonService(object):
         self._authorizer.check_delete_conan(self._auth_user, ref)
         self._server_store.remove_conanfile_files(ref, files)
 
+    def remove_package_files(self, pref, files):
+        self._authorizer.check_delete_package(self._auth_user, pref)
+        self._server_store.remove_package_files(pref, files)
+
     def remove_conanfile_file(self, ref, path):
         self.remove_conanfile_files(ref, [path])
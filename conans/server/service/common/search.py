@@ -12,6 +12,57 @@ from conans.util.files import list_folder_subdirs
 from conans.util.log import logger
 
 
+def _get_package_info_min(server_store, ref, package_id):
+    """ The search info of the latest revision of the package, None if it has no conaninfo.txt
+    """
+    pref = PackageReference(ref, package_id)
+    # Read conaninfo
+    try:
+        revision_entry = server_store.get_last_package_revision(pref)
+        if not revision_entry:
+            raise NotFoundException("")
+        pref = PackageReference(ref, package_id, revision_entry.revision)
+        info_path = os.path.join(server_store.package(pref), CONANINFO)
+        if not os.path.exists(info_path):
+            raise NotFoundException("")
+        content = load(info_path)
+        info = ConanInfo.loads(content)
+        # From Conan 1.48 the conaninfo.txt is sent raw.
+        result = {"content": content}
+        # FIXME: This could be removed in the conan_server, Artifactory should keep it
+        #        to guarantee compatibility with old conan clients.
+        conan_vars_info = info.serialize_min()
+        result.update(conan_vars_info)
+        return result
+    except Exception as exc:  # FIXME: Too wide
+        logger.error("Package %s has no ConanInfo file" % str(pref))
+        if str(exc):
+            logger.error(str(exc))
+        return None
+
+
+def _get_rrev_infos_min(server_store, ref):
+    """ The search info of the packages of the recipe revision, from its search index. The
+    index is computed the first time, and its invalidated entries (the packages uploaded or
+    removed since then) are computed again
+    """
+    index = server_store.load_search_index(ref)
+    if index is None or any(info is None for info in index.values()):
+        def _update(index):
+            if index is None:
+                package_ids = list_folder_subdirs(server_store.packages(ref), level=1)
+                index = {package_id: None for package_id in package_ids}
+            for package_id in [p for p, info in index.items() if info is None]:
+                info = _get_package_info_min(server_store, ref, package_id)
+                if info is None:
+                    index.pop(package_id)
+                else:
+                    index[package_id] = info
+            return index
+        index = server_store.update_search_index(ref, _update)
+    return index
+
+
 def _get_local_infos_min(server_store, ref, look_in_all_rrevs):
 
     result = {}
@@ -19,33 +70,8 @@ def _get_local_infos_min(server_store, ref, look_in_all_rrevs):
 
     for rrev in rrevs:
         new_ref = ref.copy_with_rev(rrev.revision) if rrev else ref
-        subdirs = list_folder_subdirs(server_store.packages(new_ref), level=1)
-        for package_id in subdirs:
-            if package_id in result:
-                continue
-            # Read conaninfo
-            try:
-                pref = PackageReference(new_ref, package_id)
-                revision_entry = server_store.get_last_package_revision(pref)
-                if not revision_entry:
-                    raise NotFoundException("")
-                pref = PackageReference(new_ref, package_id, revision_entry.revision)
-                info_path = os.path.join(server_store.package(pref), CONANINFO)
-                if not os.path.exists(info_path):
-                    raise NotFoundException("")
-                content = load(info_path)
-                info = ConanInfo.loads(content)
-                # From Conan 1.48 the conaninfo.txt is sent raw.
-                result[package_id] = {"content": content}
-                # FIXME: This could be removed in the conan_server, Artifactory should keep it
-                #        to guarantee compatibility with old conan clients.
-                conan_vars_info = info.serialize_min()
-                result[package_id].update(conan_vars_info)
-
-            except Exception as exc:  # FIXME: Too wide
-                logger.error("Package %s has no ConanInfo file" % str(pref))
-                if str(exc):
-                    logger.error(str(exc))
+        for package_id, info in _get_rrev_infos_min(server_store, new_ref).items():
+            result.setdefault(package_id, info)
     return result
 
 
@@ -0,0 +1,165 @@
+""" Downloads and uploads of the files of the server store, without copying or buffering their
+contents in python more than necessary
+"""
+import hashlib
+import mimetypes
+import os
+import time
+import uuid
+
+from bottle import HTTPError, HTTPResponse, parse_date, parse_range_header, request
+
+from conans.errors import RequestErrorException
+from conans.server.store.disk_adapter import UPLOADING_EXTENSION
+from conans.util.files import mkdir
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class FileRange(object):
+    """ A part of a file as the body of a response. It keeps fileno() and tell() of the file,
+    so the WSGI servers implementing wsgi.file_wrapper with os.sendfile() send it without
+    copying it through python, and read() stops at the end of the range for the servers that
+    iterate it
+    """
+    def __init__(self, file_handler, offset, length):
+        file_handler.seek(offset)
+        self._file = file_handler
+        self._remaining = length
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def tell(self):
+        return self._file.tell()
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size) if size else b""
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        self._file.close()
+
+
+def serve_file(path, mimetype="auto"):
+    """ Like bottle.static_file(), the HTTPResponse with the file (or 304, 403, 404, 416) with
+    support for If-Modified-Since, Range and HEAD, but the body is the file object also for
+    the ranges, so it is always sent with the wsgi.file_wrapper of the server
+    """
+    if not os.path.isfile(path):
+        return HTTPError(404, "File does not exist.")
+    if not os.access(path, os.R_OK):
+        return HTTPError(403, "You do not have permission to access this file.")
+
+    headers = {}
+    if mimetype == "auto":
+        mimetype, encoding = mimetypes.guess_type(path)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+    if mimetype:
+        if mimetype[:5] == "text/" and "charset" not in mimetype:
+            mimetype += "; charset=UTF-8"
+        headers["Content-Type"] = mimetype
+
+    stats = os.stat(path)
+    headers["Content-Length"] = size = stats.st_size
+    headers["Last-Modified"] = time.strftime("%a, %d %b %Y %H:%M:%S GMT",
+                                             time.gmtime(stats.st_mtime))
+    headers["Accept-Ranges"] = "bytes"
+
+    modified_since = request.environ.get("HTTP_IF_MODIFIED_SINCE")
+    if modified_since:
+        modified_since = parse_date(modified_since.split(";")[0].strip())
+    if modified_since is not None and modified_since >= int(stats.st_mtime):
+        headers["Date"] = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime())
+        return HTTPResponse(status=304, **headers)
+
+    status = 200
+    offset, length = 0, size
+    if "HTTP_RANGE" in request.environ:
+        ranges = list(parse_range_header(request.environ["HTTP_RANGE"], size))
+        if not ranges:
+            return HTTPError(416, "Requested Range Not Satisfiable")
+        offset, end = ranges[0]  # Only the first one, like bottle
+        length = end - offset
+        status = 206
+        headers["Content-Range"] = "bytes %d-%d/%d" % (offset, end - 1, size)
+        headers["Content-Length"] = str(length)
+
+    if request.method == "HEAD":
+        return HTTPResponse("", status=status, **headers)
+    body = open(path, "rb")
+    if status == 206:
+        body = FileRange(body, offset, length)
+    return HTTPResponse(body, status=status, **headers)
+
+
+class StreamedUpload(object):
+    """ The body of an upload request, saved reading it in chunks into a temporary file next to
+    the destination, which is renamed to it when complete, so the downloads never get a partial
+    file. The sha1 is computed while saving it, and checked if the client sent it
+    """
+    def __init__(self, body, filename=None, size=None, sha1=None):
+        self.filename = filename
+        self.sha1 = None
+        self._body = body
+        self._size = size
+        self._expected_sha1 = sha1.lower() if sha1 else None
+
+    @staticmethod
+    def from_request(filename=None):
+        """ The upload of the current request. The body is read from the wsgi.input, not from
+        the copy that bottle stores in memory or in a temporary file, if it wasn't read yet
+        """
+        if "bottle.request.body" in request.environ or request.chunked or \
+                request.content_length < 0:
+            body, size = request.body, None
+        else:
+            body, size = request.environ["wsgi.input"], request.content_length
+        return StreamedUpload(body, filename, size, request.headers.get("X-Checksum-Sha1"))
+
+    def save(self, folder):
+        """ like bottle.FileUpload.save() to a folder, with the filename of the upload
+        """
+        return self.save_as(os.path.join(folder, self.filename))
+
+    def save_as(self, path):
+        folder, filename = os.path.split(path)
+        mkdir(folder)
+        tmp_path = os.path.join(folder, "%s.%s%s" % (filename, uuid.uuid4().hex,
+                                                     UPLOADING_EXTENSION))
+        # Not mkstemp(), the permissions of the file are the default ones (umask)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+                     0o666)
+        try:
+            checksum = hashlib.sha1()
+            remaining = self._size
+            with os.fdopen(fd, "wb") as f:
+                while remaining is None or remaining > 0:
+                    chunk_size = _CHUNK_SIZE if remaining is None else min(_CHUNK_SIZE, remaining)
+                    chunk = self._body.read(chunk_size)
+                    if not chunk:
+                        break
+                    checksum.update(chunk)
+                    f.write(chunk)
+                    if remaining is not None:
+                        remaining -= len(chunk)
+            if remaining:
+                raise RequestErrorException("Incomplete upload of '%s', %d bytes missing"
+                                            % (filename, remaining))
+            sha1 = checksum.hexdigest()
+            if self._expected_sha1 and self._expected_sha1 != sha1:
+                raise RequestErrorException("Bad checksum of '%s': sha1 %s, expected %s"
+                                            % (filename, sha1, self._expected_sha1))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.sha1 = sha1
+        return path
@@ -4,7 +4,6 @@ import jwt
 
 from conans.errors import NotFoundException, RequestErrorException
 from conans.util.log import logger
-from conans.util.files import mkdir
 
 
 class FileUploadDownloadService(object):
@@ -41,9 +40,7 @@ class FileUploadDownloadService(object):
             if not self._valid_path(abs_filepath, abs_encoded_path):
                 raise NotFoundException("File not found")
             logger.debug("Put file: %s: %s" % (user, abs_filepath))
-            mkdir(os.path.dirname(abs_filepath))
-            if os.path.exists(abs_filepath):
-                os.remove(abs_filepath)
+            # The file is replaced when the upload is complete
             file_saver.save(os.path.dirname(abs_filepath))
 
         except (jwt.ExpiredSignatureError, jwt.DecodeError, AttributeError):
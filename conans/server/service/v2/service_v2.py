@@ -1,12 +1,13 @@
 import os
 
-from bottle import FileUpload, static_file
-
-from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
+from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException, \
+    ForbiddenException, AuthenticationException
+from conans.paths import CONANINFO, CONAN_MANIFEST
 from conans.server.service.common.common import CommonService
+from conans.server.service.file_transfer import serve_file
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
+from conans.util.files import load
 
 
 class ConanServiceV2(CommonService):
@@ -32,14 +33,15 @@ class ConanServiceV2(CommonService):
     def get_conanfile_file(self, reference, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, reference)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return serve_file(path, mimetype=get_mime_type(path))
 
-    def upload_recipe_file(self, body, headers, reference, filename, auth_user):
+    def upload_recipe_file(self, upload, reference, filename, auth_user):
+        """ upload: the StreamedUpload of the file
+        """
         self._authorizer.check_write_conan(auth_user, reference)
         # FIXME: Check that reference contains revision (MANDATORY TO UPLOAD)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        self._upload_to_path(body, headers, path)
+        upload.save_as(path)
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_revision(reference)
@@ -74,6 +76,64 @@ class ConanServiceV2(CommonService):
             raise PackageNotFoundException(pref, print_rev=True)
         return tmp
 
+    def get_packages_info(self, prefs, auth_user):
+        """ The latest revision and conaninfo.txt of many packages, None for the ones that do
+        not exist. The packages the user cannot read are not returned, so the client requests
+        them individually and goes through the authentication
+        """
+        ret = {}
+        for pref in prefs:
+            try:
+                self._authorizer.check_read_conan(auth_user, pref.ref)
+            except (ForbiddenException, AuthenticationException):
+                continue
+            latest = self._server_store.get_last_package_revision(pref)
+            if not latest:
+                ret[pref] = None
+                continue
+            prev, prev_time = latest
+            latest_pref = pref.copy_with_revs(pref.ref.revision, prev)
+            path = self._server_store.get_package_file_path(latest_pref, CONANINFO)
+            if not os.path.exists(path):
+                ret[pref] = None
+                continue
+            ret[pref] = {"revision": prev,
+                         "time": prev_time,
+                         "conaninfo": load(path)}
+        return ret
+
+    def get_snapshots(self, refs, prefs, auth_user):
+        """ The file list and the conanmanifest.txt of many recipe and package revisions,
+        returns ({ref: snapshot}, {pref: snapshot}), the snapshot is None for the ones that do
+        not exist. The ones the user cannot read are not returned, so the client requests
+        them individually and goes through the authentication
+        """
+        def readable(ref):
+            try:
+                self._authorizer.check_read_conan(auth_user, ref)
+            except (ForbiddenException, AuthenticationException):
+                return False
+            return True
+
+        def snapshot(file_list, folder):
+            if not file_list:
+                return None
+            ret = {"files": {key: {} for key in file_list}}
+            if CONAN_MANIFEST in file_list:
+                try:
+                    ret["manifest"] = load(os.path.join(folder, CONAN_MANIFEST))
+                except (IOError, OSError):  # Removed meanwhile
+                    return None
+            return ret
+
+        recipes = {ref: snapshot(self._server_store.get_recipe_file_list_cached(ref),
+                                 self._server_store.export(ref))
+                   for ref in refs if readable(ref)}
+        packages = {pref: snapshot(self._server_store.get_package_file_list_cached(pref),
+                                   self._server_store.package(pref))
+                    for pref in prefs if readable(pref.ref)}
+        return recipes, packages
+
     # PACKAGE METHODS
     def get_package_file_list(self, pref, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
@@ -86,10 +146,11 @@ class ConanServiceV2(CommonService):
     def get_package_file(self, pref, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return serve_file(path, mimetype=get_mime_type(path))
 
-    def upload_package_file(self, body, headers, pref, filename, auth_user):
+    def upload_package_file(self, upload, pref, filename, auth_user):
+        """ upload: the StreamedUpload of the file
+        """
         self._authorizer.check_write_conan(auth_user, pref.ref)
         # FIXME: Check that reference contains revisions (MANDATORY TO UPLOAD)
 
@@ -98,19 +159,7 @@ class ConanServiceV2(CommonService):
         if not os.path.exists(recipe_path):
             raise RecipeNotFoundException(pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        self._upload_to_path(body, headers, path)
+        upload.save_as(path)
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_package_revision(pref)
-
-    # Misc
-    @staticmethod
-    def _upload_to_path(body, headers, path):
-        file_saver = FileUpload(body, None,
-                                filename=os.path.basename(path),
-                                headers=headers)
-        if os.path.exists(path):
-            os.unlink(path)
-        if not os.path.exists(os.path.dirname(path)):
-            mkdir(os.path.dirname(path))
-        file_saver.save(os.path.dirname(path))
@@ -6,6 +6,9 @@ from conans.client.tools.env import no_op
 from conans.errors import NotFoundException
 from conans.util.files import md5sum, path_exists, relative_dirs, rmdir
 
+# The uploads are saved to "<file>.<random>.uploading" and renamed when complete
+UPLOADING_EXTENSION = ".uploading"
+
 
 class ServerDiskAdapter(object):
     """Manage access to disk files with common methods required
@@ -59,7 +62,7 @@ class ServerDiskAdapter(object):
     def _get_paths(self, absolute_path, files_subset):
         if not path_exists(absolute_path, self._store_folder):
             raise NotFoundException("")
-        paths = relative_dirs(absolute_path)
+        paths = [p for p in relative_dirs(absolute_path) if not p.endswith(UPLOADING_EXTENSION)]
         if files_subset is not None:
             paths = set(paths).intersection(set(files_subset))
         abs_paths = [os.path.join(absolute_path, relpath) for relpath in paths]
@@ -99,5 +102,25 @@ class ServerDiskAdapter(object):
             with open(path, "w") as f:
                 f.write(contents)
 
+    def append_file(self, path, contents, lock_file):
+        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+            with open(path, "a") as f:
+                f.write(contents)
+
+    def update_file(self, path, update, lock_file):
+        """ Writes update(contents) to the file, contents is None if it doesn't exist, holding the
+        lock while reading and writing it. Nothing is written if update() returns None
+        """
+        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+            try:
+                with open(path) as f:
+                    contents = f.read()
+            except (IOError, OSError):
+                contents = None
+            new_contents = update(contents)
+            if new_contents is not None:
+                with open(path, "w") as f:
+                    f.write(new_contents)
+
     def base_storage_folder(self):
         return self._store_folder
@@ -1,20 +1,35 @@
+import json
 import os
+import threading
+from collections import OrderedDict
 from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
-from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
+from conans.errors import ConanException, NotFoundException, PackageNotFoundException, \
+    RecipeNotFoundException
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
 from conans.server.revision_list import RevisionList
 
 REVISIONS_FILE = "revisions.txt"
+# In the packages folder of every recipe revision: {package_id: search info or None}
+SEARCH_INDEX_FILE = "search_index.json"
+# Next to it, the package_ids that changed since it was saved, appended one per line
+SEARCH_INDEX_INVALIDATED_FILE = "search_index.invalidated"
 
 
 class ServerStore(object):
 
+    _MAX_CACHED_FILE_LISTS = 20000
+
     def __init__(self, storage_adapter):
         self._storage_adapter = storage_adapter
         self._store_folder = storage_adapter._store_folder
+        # {revision folder: (folder mtime, file list)}, for the batch snapshots
+        self._file_lists = OrderedDict()
+        # {recipe revision folder: set(cached folders of the recipe revision and its packages)}
+        self._file_lists_by_rrev = {}
+        self._file_lists_lock = threading.Lock()
 
     @property
     def store(self):
@@ -94,6 +109,74 @@ class ServerStore(object):
         file_list = [relpath(old_key, relative_path) for old_key in file_list]
         return file_list
 
+    # ############ CACHED FILE LISTS (APIv2 batch snapshots)
+    def get_recipe_file_list_cached(self, ref):
+        """Returns the file list of the recipe revision, [] if it doesn't exist"""
+        assert isinstance(ref, ConanFileReference)
+        return self._get_file_list_cached(self.export(ref))
+
+    def get_package_file_list_cached(self, pref):
+        """Returns the file list of the package revision, [] if it doesn't exist"""
+        assert isinstance(pref, PackageReference)
+        return self._get_file_list_cached(self.package(pref))
+
+    def _get_file_list_cached(self, folder):
+        # The files of a revision folder are uploaded once (v2 folders are flat), adding or
+        # removing one changes the folder mtime, also when other server process did it
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            return []
+        with self._file_lists_lock:
+            cached = self._file_lists.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            file_list = self._get_file_list(folder)
+        except NotFoundException:
+            return []
+        with self._file_lists_lock:
+            self._file_lists.pop(folder, None)
+            self._file_lists[folder] = mtime, file_list
+            self._file_lists_by_rrev.setdefault(self._rrev_folder(folder), set()).add(folder)
+            while len(self._file_lists) > self._MAX_CACHED_FILE_LISTS:
+                evicted, _ = self._file_lists.popitem(last=False)
+                self._discard_file_list_folder(evicted)
+        return file_list
+
+    def _rrev_folder(self, folder):
+        """The recipe revision folder (name/version/user/channel/rrev) containing the folder,
+        None if the folder is not inside a recipe revision"""
+        parts = relpath(folder, self.store).split(os.sep)
+        return join(self.store, *parts[:5]) if len(parts) >= 5 else None
+
+    def _discard_file_list_folder(self, folder):
+        rrev_folder = self._rrev_folder(folder)
+        folders = self._file_lists_by_rrev.get(rrev_folder)
+        if folders is not None:
+            folders.discard(folder)
+            if not folders:
+                del self._file_lists_by_rrev[rrev_folder]
+
+    def _forget_file_lists(self, folder):
+        """Removes from the cache the file lists of the folder and its subfolders"""
+        prefix = join(folder, "")
+        rrev_folder = self._rrev_folder(folder)
+        with self._file_lists_lock:
+            if rrev_folder is None:  # All the revisions of a recipe
+                rrev_folders = [f for f in self._file_lists_by_rrev if f.startswith(prefix)]
+            elif rrev_folder == folder:  # The recipe revision, with its packages
+                rrev_folders = [folder] if folder in self._file_lists_by_rrev else []
+            else:
+                folders = self._file_lists_by_rrev.get(rrev_folder, ())
+                for cached in [f for f in folders if f == folder or f.startswith(prefix)]:
+                    del self._file_lists[cached]
+                    self._discard_file_list_folder(cached)
+                return
+            for f in rrev_folders:
+                for cached in self._file_lists_by_rrev.pop(f):
+                    del self._file_lists[cached]
+
     def _delete_empty_dirs(self, ref):
         lock_files = set([REVISIONS_FILE, "%s.lock" % REVISIONS_FILE])
 
@@ -112,12 +195,16 @@ class ServerStore(object):
             ref_path = os.path.dirname(ref_path)
 
     # ######### DELETE (APIv1 and APIv2)
+    def _delete_folder(self, folder):
+        self._storage_adapter.delete_folder(folder)
+        self._forget_file_lists(folder)
+
     def remove_conanfile(self, ref):
         assert isinstance(ref, ConanFileReference)
         if not ref.revision:
-            self._storage_adapter.delete_folder(self.conan_revisions_root(ref))
+            self._delete_folder(self.conan_revisions_root(ref))
         else:
-            self._storage_adapter.delete_folder(self.base_folder(ref))
+            self._delete_folder(self.base_folder(ref))
             self._remove_revision_from_index(ref)
         self._delete_empty_dirs(ref)
 
@@ -127,13 +214,14 @@ class ServerStore(object):
 
         if not package_ids_filter:  # Remove all packages
             packages_folder = self.packages(ref)
-            self._storage_adapter.delete_folder(packages_folder)
+            self._delete_folder(packages_folder)
         else:
             for package_id in package_ids_filter:
                 pref = PackageReference(ref, package_id)
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
-                self._storage_adapter.delete_folder(package_folder)
+                self._delete_folder(package_folder)
+                self.invalidate_search_index(pref)
         self._delete_empty_dirs(ref)
 
     def remove_package(self, pref):
@@ -141,26 +229,119 @@ class ServerStore(object):
         assert pref.revision is not None, "BUG: server store needs PREV remove_package"
         assert pref.ref.revision is not None, "BUG: server store needs RREV remove_package"
         package_folder = self.package(pref)
-        self._storage_adapter.delete_folder(package_folder)
+        self._delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
+        self.invalidate_search_index(pref)
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
-        self._storage_adapter.delete_folder(packages_folder)
+        self._delete_folder(packages_folder)
 
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
         for filepath in files:
             path = join(subpath, filepath)
             self._storage_adapter.delete_file(path)
+        self._forget_file_lists(subpath)
 
     def remove_package_files(self, pref, files):
         subpath = self.package(pref)
         for filepath in files:
             path = join(subpath, filepath)
             self._storage_adapter.delete_file(path)
+        self._forget_file_lists(subpath)
+        self.invalidate_search_index(pref)
+
+    # ######### PACKAGES SEARCH INDEX (APIv1 and APIv2)
+    def _search_index_file(self, ref):
+        return join(self.packages(ref), SEARCH_INDEX_FILE)
+
+    def _search_index_invalidated_file(self, ref):
+        return join(self.packages(ref), SEARCH_INDEX_INVALIDATED_FILE)
+
+    def _read_search_index_invalidated(self, ref):
+        path = self._search_index_invalidated_file(ref)
+        if not self._storage_adapter.path_exists(path):
+            return ""
+        try:
+            return self._storage_adapter.read_file(path, lock_file=path + ".lock")
+        except (IOError, OSError):
+            return ""
+
+    @staticmethod
+    def _invalidate_entries(index, invalidated):
+        for package_id in invalidated.split():
+            index[package_id] = None
+
+    def load_search_index(self, ref):
+        """ The {package_id: info} of the packages of the recipe revision, with None for the
+        packages that changed since it was computed. None if there is no index
+        """
+        path = self._search_index_file(ref)
+        if not self._storage_adapter.path_exists(path):
+            return None
+        try:
+            index = json.loads(self._storage_adapter.read_file(path, lock_file=path + ".lock"))
+        except (IOError, OSError, ValueError):
+            return None
+        self._invalidate_entries(index, self._read_search_index_invalidated(ref))
+        return index
+
+    def update_search_index(self, ref, update):
+        """ Saves update(index) as the new index of the recipe revision, the index is None if it
+        doesn't exist yet or it is not valid. The index is locked meanwhile, the invalidations
+        consumed by this update are removed after saving it, the ones appended by the packages
+        uploaded or removed by other requests meanwhile are kept for the next update.
+        Returns the updated index
+        """
+        path = self._search_index_file(ref)
+        if not self._storage_adapter.path_exists(os.path.dirname(path)):  # No packages
+            return update(None)
+        result = []
+
+        def _update(contents):
+            invalidated = self._read_search_index_invalidated(ref)
+            try:
+                index = json.loads(contents) if contents else None
+            except ValueError:
+                index = None
+            if index is not None:
+                self._invalidate_entries(index, invalidated)
+            index = update(index)
+            result.append((index, len(invalidated)))
+            return json.dumps(index) if index is not None else None
+
+        self._storage_adapter.update_file(path, _update, lock_file=path + ".lock")
+        index, consumed = result[0]
+        if consumed:
+            def _consume(contents):
+                return contents[consumed:] if contents else None
+
+            invalidated_path = self._search_index_invalidated_file(ref)
+            self._storage_adapter.update_file(invalidated_path, _consume,
+                                              lock_file=invalidated_path + ".lock")
+        return index
+
+    def invalidate_search_index(self, pref):
+        """ The search info of the package will be computed again in the next search. It is
+        appended to the invalidations file, instead of rewriting the whole index
+        """
+        path = self._search_index_invalidated_file(pref.ref)
+        if not self._storage_adapter.path_exists(os.path.dirname(path)):  # No packages
+            return
+        self._storage_adapter.append_file(path, pref.id + "\n", lock_file=path + ".lock")
+
+    def package_file_uploaded(self, path):
+        """ APIv1 updates the package revision before uploading the files, the package search
+        info is invalidated again after every file
+        """
+        parts = relpath(path, self.store).split(os.sep)
+        # name/version/user/channel/rrev/package/package_id/prev/file
+        if len(parts) == 9 and parts[5] == PACKAGES_FOLDER:
+            ref = ConanFileReference.loads("%s/%s@%s/%s#%s" % tuple(parts[:5]))
+            self.invalidate_search_index(PackageReference(ref, parts[6]))
 
     # ONLY APIv1 URLS
     # ############ DOWNLOAD URLS
@@ -247,11 +428,14 @@ class ServerStore(object):
         assert(isinstance(ref, ConanFileReference))
         rev_file_path = self._recipe_revisions_file(ref)
         self._update_last_revision(rev_file_path, ref)
+        self._forget_file_lists(self.export(ref))
 
     def update_last_package_revision(self, pref):
         assert(isinstance(pref, PackageReference))
         rev_file_path = self._package_revisions_file(pref)
         self._update_last_revision(rev_file_path, pref)
+        self._forget_file_lists(self.package(pref))
+        self.invalidate_search_index(pref)
 
     def _update_last_revision(self, rev_file_path, ref):
         if self._storage_adapter.path_exists(rev_file_path):
@@ -11,7 +11,7 @@ from conans.test.assets.sources import gen_function_cpp
 from conans.test.utils.scm import create_local_git_repo, git_add_changes_commit, git_create_bare_repo
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient
-from conans.util.files import rmdir, save_files
+from conans.util.files import rmdir, save, save_files
 
 
 @pytest.mark.skipif(six.PY2, reason="Only Py3")
@@ -258,6 +258,53 @@ class TestGitShallowClone:
         assert c.load("source/CMakeLists.txt") == "mycmake"
 
 
+@pytest.mark.skipif(six.PY2, reason="Only Py3")
+class TestGitCloneMirror:
+    """ Git cloning from the local mirrors of tools.scm:git_mirrors_folder
+    """
+    conanfile = textwrap.dedent("""
+        import os
+        from conan import ConanFile
+        from conan.tools.scm import Git
+        from conan.tools.files import load
+
+        class Pkg(ConanFile):
+            name = "pkg"
+            version = "0.1"
+
+            def layout(self):
+                self.folders.source = "source"
+
+            def source(self):
+                git = Git(self)
+                git.clone(url="{url}")
+                self.output.info("MYFILE: {{}}".format(load(self, "myrepo/src/myfile.h")))
+                git = Git(self, folder="myrepo")
+                self.output.info("ORIGIN: {{}}".format(git.get_remote_url()))
+        """)
+
+    def test_clone_mirror(self):
+        folder = os.path.join(temp_folder(), "myrepo")
+        url, _ = create_local_git_repo(files={"src/myfile.h": "myheader!"}, folder=folder)
+        mirrors_folder = temp_folder()
+
+        c = TestClient()
+        save(c.cache.new_config_path, "tools.scm:git_mirrors_folder={}".format(mirrors_folder))
+        c.save({"conanfile.py": self.conanfile.format(url=url)})
+        c.run("create .")
+        assert "Creating the local git mirror of" in c.out
+        assert "pkg/0.1: MYFILE: myheader!" in c.out
+        assert "pkg/0.1: ORIGIN: {}".format(url) in c.out
+
+        # The mirror is updated with the new commits before cloning
+        save_files(path=folder, files={"src/myfile.h": "my2header2!"})
+        git_add_changes_commit(folder=folder)
+        c.run("remove pkg/0.1 -f")
+        c.run("create .")
+        assert "Creating the local git mirror of" not in c.out
+        assert "pkg/0.1: MYFILE: my2header2!" in c.out
+
+
 class TestGitCloneWithArgs:
     """ Git cloning passing additional arguments
     """
@@ -0,0 +1,114 @@
+import os
+import time
+
+import mock
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID
+from conans.util.files import save
+
+
+def _age_package(client, ref, days):
+    layout = client.cache.package_layout(ref)
+    pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+    old = time.time() - days * 24 * 3600
+    os.utime(layout._access_file(), (old, old))
+    os.utime(layout._access_file(pref.id), (old, old))
+
+
+def _package_exists(client, ref):
+    layout = client.cache.package_layout(ref)
+    return layout.package_id_exists(NO_SETTINGS_PACKAGE_ID)
+
+
+def test_gc_max_age():
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile().with_package_file("file.txt", "content")})
+    client.run("create . pkga/0.1@")
+    client.run("create . pkgb/0.1@")
+    pkga = ConanFileReference.loads("pkga/0.1")
+    pkgb = ConanFileReference.loads("pkgb/0.1")
+    _age_package(client, pkga, days=10)
+    _age_package(client, pkgb, days=10)
+    client.run("install pkgb/0.1@")  # pkgb is used again
+
+    client.run("cache gc --max-age=1w --dry-run")
+    assert "Would remove pkga/0.1:%s package" % NO_SETTINGS_PACKAGE_ID in client.out
+    assert "pkgb/0.1" not in client.out
+    assert _package_exists(client, pkga)
+
+    client.run("cache gc --max-age=1w")
+    assert "Removed pkga/0.1:%s package" % NO_SETTINGS_PACKAGE_ID in client.out
+    assert "Removed pkga/0.1:%s build" % NO_SETTINGS_PACKAGE_ID in client.out
+    assert not _package_exists(client, pkga)
+    assert _package_exists(client, pkgb)
+    # The recipe is still there, the package can be built again
+    client.run("install pkga/0.1@", assert_error=True)
+    assert "Missing prebuilt package for 'pkga/0.1'" in client.out
+
+
+def test_gc_max_size():
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile().with_package_file("file.txt", "content")})
+    client.run("create . pkga/0.1@")
+    client.run("create . pkgb/0.1@")
+    pkga = ConanFileReference.loads("pkga/0.1")
+    pkgb = ConanFileReference.loads("pkgb/0.1")
+    _age_package(client, pkga, days=2)
+    _age_package(client, pkgb, days=1)
+
+    client.run("cache gc --max-size=0")
+    assert not _package_exists(client, pkga)
+    assert not _package_exists(client, pkgb)
+    # LRU order, the oldest first
+    output = str(client.out)
+    assert output.index("Removed pkga/0.1") < output.index("Removed pkgb/0.1")
+
+
+def test_gc_sources_single_item():
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile().with_package_file("file.txt", "content")})
+    client.run("create . pkga/0.1@")
+    layout = client.cache.package_layout(ConanFileReference.loads("pkga/0.1"))
+    save(os.path.join(layout.source(), "source.cpp"), "source")
+    save(os.path.join(layout.scm_sources(), "scm.cpp"), "scm")
+
+    client.run("cache gc --max-size=0")
+    assert str(client.out).count("Removed pkga/0.1 source") == 1
+    assert "in 3 items" in client.out  # package, build and sources
+    assert not os.path.exists(layout.source())
+    assert not os.path.exists(layout.scm_sources())
+
+
+def test_gc_skips_locked():
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile()})
+    client.run("create . pkga/0.1@")
+    pkga = ConanFileReference.loads("pkga/0.1")
+    layout = client.cache.package_layout(pkga)
+    with layout.conanfile_read_lock(client.out):
+        client.run("cache gc --max-size=0")
+    assert "Skipping pkga/0.1:%s package, it is being used" % NO_SETTINGS_PACKAGE_ID in client.out
+    assert _package_exists(client, pkga)
+
+
+def test_gc_remove_error():
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile()})
+    client.run("create . pkga/0.1@")
+    error = OSError("Permission denied")
+    with mock.patch("conans.client.cmd.cache.rm_conandir", side_effect=error):
+        client.run("cache gc --max-size=0")
+    assert "Skipping pkga/0.1:%s build, it couldn't be removed: Permission denied" \
+        % NO_SETTINGS_PACKAGE_ID in client.out
+    assert "it is being used" not in client.out
+    assert "Couldn't remove" not in client.out
+
+
+def test_gc_wrong_args():
+    client = TestClient()
+    client.run("cache gc", assert_error=True)
+    assert "Define a maximum size or a maximum age" in client.out
+    client.run("cache gc --max-size=2XB", assert_error=True)
+    assert "Invalid size '2XB'" in client.out
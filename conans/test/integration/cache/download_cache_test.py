@@ -5,10 +5,12 @@ import unittest
 from collections import Counter
 from threading import Thread
 
+import mock
 from bottle import static_file, request
 import pytest
 
-from conans.client.downloaders.cached_file_downloader import CachedFileDownloader
+from conans.client.downloaders.cached_file_downloader import CachedFileDownloader, \
+    DownloadCacheIndex
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, StoppableThreadBottle
@@ -39,8 +41,8 @@ class DownloadCacheTest(unittest.TestCase):
         client.run("install mypkg/0.1@user/testing")
         content = load(log_trace_file)
         self.assertEqual(6, content.count('"_action": "DOWNLOAD"'))
-        # 6 files cached, plus "locks" folder = 7
-        self.assertEqual(7, len(os.listdir(cache_folder)))
+        # 6 files cached, plus "locks" and "access" folders and index = 9
+        self.assertEqual(9, len(os.listdir(cache_folder)))
 
         os.remove(log_trace_file)
         client.run("remove * -f")
@@ -170,9 +172,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertTrue(os.path.exists(local_path2))
         self.assertEqual("some query", client.load("myfile2.txt"))
 
-        # 2 files cached, plus "locks" folder = 3
-        # "locks" folder + 2 files cached + .dirty file from previous failure
-        self.assertEqual(4, len(os.listdir(cache_folder)))
+        # "locks" and "access" folders + index + 2 files cached + .dirty file from previous failure
+        self.assertEqual(6, len(os.listdir(cache_folder)))
 
         # remove remote file
         os.remove(file_path)
@@ -247,9 +248,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertTrue(os.path.exists(local_path2))
         self.assertEqual("some query", client.load("myfile2.txt"))
 
-        # 2 files cached, plus "locks" folder = 3
-        # "locks" folder + 2 files cached + .dirty file from previous failure
-        self.assertEqual(4, len(os.listdir(cache_folder)))
+        # "locks" and "access" folders + index + 2 files cached + .dirty file from previous failure
+        self.assertEqual(6, len(os.listdir(cache_folder)))
 
         # remove remote file
         os.remove(file_path)
@@ -270,6 +270,38 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertIn("ERROR: conanfile.py: Error in source() method, line 8", client.out)
         self.assertIn("Not found: http://localhost", client.out)
 
+        save(client.cache.new_config_path,
+             "tools.files.download:download_cache=%s\n"
+             "tools.files.download:download_cache_max_size=2XB" % cache_folder)
+        client.run("source .", assert_error=True)
+        self.assertIn("Invalid 'tools.files.download:download_cache_max_size': "
+                      "Invalid size '2XB'", client.out)
+
+    def test_clean_downloads(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile().with_package_file("file.txt", "content")})
+        client.run("create . pkg/0.1@")
+        client.run("upload * --all -c")
+        client.run("cache clean-downloads", assert_error=True)
+        self.assertIn("There is no download cache defined", client.out)
+
+        cache_folder = temp_folder()
+        client.run('config set storage.download_cache="%s"' % cache_folder)
+        client.run("remove * -f")
+        client.run("install pkg/0.1@")
+        cached = [f for f in os.listdir(cache_folder) if len(f) == 64]
+        self.assertTrue(cached)
+
+        client.run("cache clean-downloads --max-size=1GB")
+        self.assertIn("Removed 0 files from the download cache, 0B freed", client.out)
+        client.run("cache clean-downloads")
+        self.assertIn("Removed %s files from the download cache" % len(cached), client.out)
+        self.assertEqual([], [f for f in os.listdir(cache_folder) if len(f) == 64])
+
+        client.run("remove * -f")
+        client.run("install pkg/0.1@")
+        self.assertIn("pkg/0.1: Downloaded package", client.out)
+
     @pytest.mark.skipif(get_env("TESTING_REVISIONS_ENABLED", False),
                         reason="Hybrid test with both v1 and v2")
     def test_revision0_v2_skip(self):
@@ -387,3 +419,55 @@ class CachedDownloaderUnitTest(unittest.TestCase):
         self.cached_downloader.download("testurl", file_path)
         self.assertEqual(self.file_downloader.calls["testurl"], 1)
         self.assertEqual("testurl", load(file_path))
+
+    def test_lru_eviction(self):
+        cache_folder = temp_folder()
+        cached_downloader = CachedFileDownloader(cache_folder, self.file_downloader,
+                                                 max_size=len("testurl1") * 2)
+        cached_downloader.download("testurl1")
+        cached_downloader.download("testurl2")
+        cached_downloader.download("testurl1")  # testurl2 is now the least recently used
+        cached_downloader.download("testurl3")
+        self.assertEqual(self.file_downloader.calls["testurl1"], 1)
+        self.assertEqual(self.file_downloader.calls["testurl2"], 1)
+        self.assertEqual(self.file_downloader.calls["testurl3"], 1)
+        entries = DownloadCacheIndex(cache_folder).entries()
+        self.assertEqual(2, len(entries))
+
+        cached_downloader.download("testurl2")  # evicted, needs to download again
+        self.assertEqual(self.file_downloader.calls["testurl2"], 2)
+        cached_downloader.download("testurl3")
+        self.assertEqual(self.file_downloader.calls["testurl3"], 1)
+
+    def test_eviction_skips_used_entries(self):
+        self.cached_downloader.download("testurl1")
+        self.cached_downloader.download("testurl2")
+        h = self.cached_downloader._get_hash("testurl1")
+        with self.cached_downloader._lock(h):
+            evicted, _ = self.cached_downloader.evict(0)
+        self.assertEqual(1, evicted)
+        self.cached_downloader.download("testurl1")
+        self.assertEqual(self.file_downloader.calls["testurl1"], 1)
+
+    def test_hits_do_not_rewrite_index(self):
+        self.cached_downloader.download("testurl1")
+        with mock.patch.object(DownloadCacheIndex, "_save") as save_index:
+            self.cached_downloader.download("testurl1")
+            self.cached_downloader.download("testurl1")
+        self.assertEqual(0, save_index.call_count)
+        self.cached_downloader.download("testurl2")  # testurl1 is the least recently used
+        self.cached_downloader.download("testurl1")
+        entries = DownloadCacheIndex(self.cached_downloader._cache_folder).entries()
+        h1 = self.cached_downloader._get_hash("testurl1")
+        h2 = self.cached_downloader._get_hash("testurl2")
+        self.assertGreaterEqual(entries[h1]["access"], entries[h2]["access"])
+
+    def test_stats(self):
+        stats = CachedFileDownloader.stats
+        stats.reset()
+        self.cached_downloader.download("testurl")
+        self.cached_downloader.download("testurl")
+        self.cached_downloader.download("testurl")
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(2, stats.hits)
+        self.assertEqual(2 * len("testurl"), stats.bytes_saved)
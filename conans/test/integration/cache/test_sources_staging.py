@@ -0,0 +1,44 @@
+import os
+import textwrap
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient
+from conans.util.files import load, save
+
+
+def test_sources_staging_cow():
+    client = TestClient()
+    save(client.cache.new_config_path, "core.build:sources_staging=cow")
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile, tools
+
+        class Pkg(ConanFile):
+            settings = "build_type"
+            exports_sources = "*.txt"
+            read_only_sources = "*.txt"
+
+            def build(self):
+                self.output.info("SOURCE: {}".format(tools.load("file.txt")))
+                tools.save("file.txt", "modified by {}".format(self.settings.build_type))
+        """)
+    client.save({"conanfile.py": conanfile, "file.txt": "original"})
+    client.run("create . pkg/0.1@ -s build_type=Release")
+    assert "pkg/0.1: Staging sources in build folder" in client.out
+    assert "Sources staged in" in client.out
+    # The sources are hardlinked, unless the file system can clone them
+    assert "1 linked" in client.out or "1 files cloned" in client.out
+    assert "pkg/0.1: SOURCE: original" in client.out
+    client.run("create . pkg/0.1@ -s build_type=Debug")
+    assert "pkg/0.1: SOURCE: original" in client.out
+    assert "The build modified" not in client.out
+
+    layout = client.cache.package_layout(ConanFileReference.loads("pkg/0.1"))
+    assert load(os.path.join(layout.source(), "file.txt")) == "original"
+
+
+def test_sources_staging_invalid():
+    client = TestClient()
+    save(client.cache.new_config_path, "core.build:sources_staging=magic")
+    client.save({"conanfile.py": "from conans import ConanFile\nclass Pkg(ConanFile): pass"})
+    client.run("create . pkg/0.1@", assert_error=True)
+    assert "Invalid 'core.build:sources_staging' value 'magic'" in client.out
@@ -0,0 +1,167 @@
+import os
+import shutil
+import socket
+import stat
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+
+import mock
+import pytest
+from six import StringIO
+
+from conans import __version__ as client_version
+from conans.client.daemon.client import receive_message, run_in_daemon, send_message
+from conans.client.daemon.server import ConanDaemon
+from conans.client.output import ConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+@pytest.fixture
+def daemon():
+    user_home = temp_folder()
+    # Short, the socket paths are limited to ~100 characters
+    socket_folder = tempfile.mkdtemp()
+    socket_path = os.path.join(socket_folder, "conan.sock")
+    with mock.patch.dict(os.environ, {"CONAN_USER_HOME": user_home}):
+        conan_daemon = ConanDaemon(socket_path, output=ConanOutput(StringIO()))
+        thread = threading.Thread(target=conan_daemon.serve_forever)
+        thread.daemon = True
+        thread.start()
+        for _ in range(200):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("The daemon didn't start")
+        yield socket_path, user_home
+    conan_daemon.stop()
+    thread.join()
+    shutil.rmtree(socket_folder)
+
+
+def _request(socket_path, args, cwd):
+    """ connected socket with the request sent. The client isn't used, in the tests it is in the
+    process of the daemon, and sys.stdout is the one of the command meanwhile
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path)
+    send_message(sock, {"args": args, "cwd": cwd, "env": dict(os.environ),
+                        "color": False, "isatty": False, "version": client_version})
+    return sock
+
+
+def _run(socket_path, args, cwd=None):
+    sock = _request(socket_path, args, cwd or temp_folder())
+    out, err = "", ""
+    try:
+        while True:
+            message = receive_message(sock)
+            out += message.get("out", "")
+            err += message.get("err", "")
+            if "exit" in message:
+                return message["exit"], out, err
+    finally:
+        sock.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_daemon(daemon):
+    socket_path, user_home = daemon
+    conanfile = textwrap.dedent("""
+        import os
+        from conans import ConanFile
+        class Pkg(ConanFile):
+            def build(self):
+                self.output.info("MYVAR=%s" % os.environ["MYVAR"])
+        """)
+    for value in ("value1", "value2"):
+        folder = temp_folder()
+        save(os.path.join(folder, "conanfile.py"), conanfile)
+        with mock.patch.dict(os.environ, {"MYVAR": value}):
+            assert _run(socket_path, ["install", "."], folder)[0] == 0
+            exit_code, out, _ = _run(socket_path, ["build", "."], folder)
+            assert exit_code == 0
+        assert os.path.isfile(os.path.join(folder, "conaninfo.txt"))
+        assert "conanfile.py: MYVAR=%s" % value in out
+    assert "MYVAR" not in os.environ
+
+    exit_code, _, err = _run(socket_path, ["install", "."])
+    assert exit_code == 1
+    assert "ERROR: Conanfile not found" in err
+    assert os.path.isfile(os.path.join(user_home, ".conan", "conan.conf"))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_daemon_fallback(daemon):
+    socket_path, _ = daemon
+    # Other cache, the command has to run in the invocation
+    with mock.patch.dict(os.environ, {"CONAN_USER_HOME": temp_folder()}):
+        assert run_in_daemon(socket_path, ["--version"]) is None
+    # No daemon
+    assert run_in_daemon(socket_path + "2", ["--version"]) is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_daemon_stdout(daemon):
+    socket_path, _ = daemon
+    # The argparse help and errors are written to sys.stdout and sys.stderr
+    exit_code, out, _ = _run(socket_path, ["search", "-h"])
+    assert exit_code == 0
+    assert "usage: conan search" in out
+    exit_code, _, err = _run(socket_path, ["search", "--unknown"])
+    assert exit_code == 2
+    assert "unrecognized arguments: --unknown" in err
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_daemon_client_gone(daemon):
+    socket_path, _ = daemon
+    conanfile = textwrap.dedent("""
+        import time
+        from conans import ConanFile
+        from conans.tools import save
+        class Pkg(ConanFile):
+            def build(self):
+                for _ in range(10):
+                    self.output.info("Building")
+                    time.sleep(0.1)
+                save("finished.txt", "")
+        """)
+    folder = temp_folder()
+    save(os.path.join(folder, "conanfile.py"), conanfile)
+    assert _run(socket_path, ["install", "."], folder)[0] == 0
+
+    # Like Ctrl+C in the client, the connection is closed while the command runs
+    sock = _request(socket_path, ["build", "."], folder)
+    while "Building" not in receive_message(sock).get("out", ""):
+        pass
+    sock.close()
+
+    # The command is not interrupted, it finishes without output, then the next one runs
+    exit_code, out, _ = _run(socket_path, ["--version"])
+    assert exit_code is False
+    assert "Conan version" in out
+    assert os.path.exists(os.path.join(folder, "finished.txt"))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_daemon_only_owner(daemon):
+    socket_path, _ = daemon
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    if not hasattr(socket, "SO_PEERCRED"):
+        return
+    # Other users' connections are closed without reading the request
+    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+        sock = None
+        try:
+            sock = _request(socket_path, ["--version"], temp_folder())
+            assert receive_message(sock) is None
+        except (OSError, socket.error):  # Closed (reset) with the request not read
+            pass
+        finally:
+            if sock is not None:
+                sock.close()
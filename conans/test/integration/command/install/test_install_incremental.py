@@ -0,0 +1,143 @@
+import json
+import os
+import textwrap
+
+import pytest
+
+from conans.client.install_fingerprint import INSTALL_FINGERPRINT
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import save
+
+SKIPPED = "Nothing changed since the previous install"
+
+
+@pytest.fixture()
+def client():
+    c = TestClient()
+    save(c.cache.new_config_path, "core.install:incremental=True")
+    c.save({"pkg/conanfile.py": GenConanfile().with_settings("build_type"),
+            "conanfile.txt": "[requires]\npkg/[>=0.1]\n[generators]\ncmake"})
+    c.run("create pkg pkg/0.1@")
+    return c
+
+
+def test_install_incremental(client):
+    client.run("install . --json=install.json")
+    assert SKIPPED not in client.out
+    assert os.path.isfile(os.path.join(client.current_folder, INSTALL_FINGERPRINT))
+    installed = json.loads(client.load("install.json"))["installed"]
+
+    client.run("install . --json=install.json")
+    assert SKIPPED in client.out
+    assert "pkg/0.1: Already installed!" not in client.out
+    assert json.loads(client.load("install.json"))["installed"] == installed
+
+    # Another configuration, the new generated files are not the ones recorded
+    client.run("install . -s build_type=Debug --build=missing")
+    assert SKIPPED not in client.out
+    assert "pkg/0.1: Created package" in client.out
+    client.run("install . -s build_type=Debug --build=missing")
+    assert SKIPPED in client.out
+    client.run("install .")
+    assert SKIPPED not in client.out
+
+    # Forced builds and updates are never skipped
+    client.run("install . --build=pkg")
+    assert "pkg/0.1: Forced build from source" in client.out
+    client.run("install . --build=pkg")
+    assert SKIPPED not in client.out
+    client.run("install .")
+    client.run("install . --update")
+    assert SKIPPED not in client.out
+
+    # Other generators or conanfile
+    client.run("install . -g txt")
+    assert SKIPPED not in client.out
+    client.run("install . -g txt")
+    assert SKIPPED in client.out
+    client.save({"conanfile.txt": "[requires]\npkg/[>=0.1]\n[generators]\ntxt"})
+    client.run("install . -g txt")
+    assert SKIPPED not in client.out
+
+
+def test_install_incremental_cache_changes(client):
+    client.run("install .")
+    client.run("install .")
+    assert SKIPPED in client.out
+
+    # A new version in the range
+    client.run("create pkg pkg/0.2@")
+    client.run("install .")
+    assert SKIPPED not in client.out
+    assert "pkg/0.2 from local cache - Cache" in client.out
+    client.run("install .")
+    assert SKIPPED in client.out
+
+    # The recipe is exported again
+    client.save({"pkg/conanfile.py": GenConanfile().with_settings("build_type")
+                                                   .with_class_attribute("a = 1")})
+    client.run("export pkg pkg/0.2@")
+    client.run("install . --build=outdated")
+    assert SKIPPED not in client.out
+    assert "pkg/0.2: Outdated package!" in client.out
+    client.run("install . --build=outdated")
+    assert SKIPPED in client.out
+
+    # The binary is removed
+    client.run("remove pkg/0.2 -p -f")
+    client.run("install .", assert_error=True)
+    assert SKIPPED not in client.out
+    assert "Missing prebuilt package for 'pkg/0.2'" in client.out
+
+
+def test_install_incremental_disabled(client):
+    client.run("install .")
+    client.run("install .")
+    assert SKIPPED in client.out
+
+    save(client.cache.new_config_path, "")
+    client.run("install .")
+    assert SKIPPED not in client.out
+    assert not os.path.exists(os.path.join(client.current_folder, INSTALL_FINGERPRINT))
+
+
+def test_install_incremental_editable(client):
+    client.save({"dep/conanfile.py": GenConanfile()})
+    client.run("editable add dep dep/0.1@")
+    conanfile = textwrap.dedent("""
+        [requires]
+        dep/0.1
+        """)
+    client.save({"conanfile.txt": conanfile})
+    client.run("install .")
+    client.run("install .")
+    assert SKIPPED not in client.out
+
+
+def test_install_incremental_outputs(client):
+    client.save({"pkg/conanfile.py": GenConanfile().with_package_file("bin/tool.exe", "tool")})
+    client.run("create pkg pkg/0.1@")
+    client.save({"conanfile.txt": "[requires]\npkg/0.1\n[generators]\ncmake\n"
+                                  "[imports]\nbin, *.exe -> ./bin"})
+    client.run("install . -if=build")
+    client.run("install . -if=build")
+    assert SKIPPED in client.out
+
+    # The generated and imported files are generated again if removed or modified
+    build_info = os.path.join(client.current_folder, "build", "conanbuildinfo.cmake")
+    os.remove(build_info)
+    client.run("install . -if=build")
+    assert SKIPPED not in client.out
+    assert os.path.isfile(build_info)
+    client.run("install . -if=build")
+    assert SKIPPED in client.out
+
+    tool = os.path.join(client.current_folder, "build", "bin", "tool.exe")
+    os.remove(tool)
+    client.run("install . -if=build")
+    assert SKIPPED not in client.out
+    assert os.path.isfile(tool)
+
+    os.remove(os.path.join(client.current_folder, "build", "conaninfo.txt"))
+    client.run("install . -if=build")
+    assert SKIPPED not in client.out
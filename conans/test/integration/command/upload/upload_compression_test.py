@@ -1,9 +1,11 @@
 import os
 
+from conans import ARCHIVE_XZ, COMPLEX_SEARCH_CAPABILITY, REVISIONS
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import uncompress_packaged_files
-from conans.test.utils.tools import TestClient
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import load, save
 
 
 def test_reuse_uploaded_tgz():
@@ -93,3 +95,110 @@ def test_upload_only_tgz_if_needed():
     folder = uncompress_packaged_files(server_paths, pref)
     libraries = os.listdir(os.path.join(folder, "lib"))
     assert len(libraries) == 1
+
+
+def _server_package_files(client, ref):
+    server_store = client.servers["default"].server_store
+    rev = server_store.get_last_revision(ref).revision
+    package_ids = client.cache.package_layout(ref).package_ids()
+    pref = PackageReference(ref.copy_with_rev(rev), package_ids[0])
+    prev = server_store.get_last_package_revision(pref).revision
+    return sorted(os.listdir(server_store.package(pref.copy_with_revs(rev, prev))))
+
+
+def test_upload_xz_compression_format():
+    client = TestClient(default_server_user=True)
+    save(client.cache.new_config_path, "core.upload:compression_format=xz")
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    conanfile = GenConanfile("pkg", "0.1").with_package_file("lib/file.lib", "File")
+    client.save({"conanfile.py": conanfile})
+    client.run("create . user/stable")
+    client.run("upload %s --all" % str(ref))
+    assert "Uploading conan_package.txz" in client.out
+    assert _server_package_files(client, ref) == ["conan_package.txz", "conaninfo.txt",
+                                                  "conanmanifest.txt"]
+
+    client.run("remove * -f")
+    client.run("install %s" % str(ref))
+    layout = client.cache.package_layout(ref)
+    package_folder = layout.package(PackageReference(ref, layout.package_ids()[0]))
+    assert load(os.path.join(package_folder, "lib", "file.lib")) == "File"
+
+    # Uploading again with gzip, same revision, the previous archive is removed
+    save(client.cache.new_config_path, "")
+    client.run("upload %s --all --force" % str(ref))
+    assert "Uploading conan_package.tgz" in client.out
+    assert _server_package_files(client, ref) == ["conan_package.tgz", "conaninfo.txt",
+                                                  "conanmanifest.txt"]
+
+
+def test_upload_overwrite_compression_format():
+    client = TestClient(default_server_user=True)
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1").with_package_file("lib/file.lib",
+                                                                              "File")})
+    client.run("create . user/stable")
+    client.run("upload %s --all" % str(ref))
+    assert _server_package_files(client, ref) == ["conan_package.tgz", "conaninfo.txt",
+                                                  "conanmanifest.txt"]
+
+    # The package is overwritten with xz, the stale gzip archive is not downloaded
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1").with_package_file("lib/file.lib",
+                                                                              "Other")})
+    client.run("create . user/stable")
+    save(client.cache.new_config_path, "core.upload:compression_format=xz")
+    client.run("upload %s --all --force" % str(ref))
+    assert "Uploading conan_package.txz" in client.out
+    assert _server_package_files(client, ref) == ["conan_package.txz", "conaninfo.txt",
+                                                  "conanmanifest.txt"]
+
+    client.run("remove * -f")
+    client.run("install %s" % str(ref))
+    layout = client.cache.package_layout(ref)
+    package_folder = layout.package(PackageReference(ref, layout.package_ids()[0]))
+    assert load(os.path.join(package_folder, "lib", "file.lib")) == "Other"
+
+
+def test_upload_compression_format_same_package():
+    # Same package revision, the stale archive is removed after uploading the new one
+    client = TestClient(default_server_user=True)
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create . user/stable")
+    client.run("upload %s --all" % str(ref))
+    save(client.cache.new_config_path, "core.upload:compression_format=xz")
+    client.run("upload %s --all --force" % str(ref))
+    assert "Uploading conan_package.txz" in client.out
+    assert _server_package_files(client, ref) == ["conan_package.txz", "conaninfo.txt",
+                                                  "conanmanifest.txt"]
+
+
+def test_upload_compression_format_not_removable():
+    # The remote can't remove the previous archive, the published one is kept
+    server = TestServer(users={"user": "password"},
+                        server_capabilities=[COMPLEX_SEARCH_CAPABILITY, REVISIONS, ARCHIVE_XZ])
+    client = TestClient(servers={"default": server}, users={"default": [("user", "password")]})
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1").with_package_file("lib/file.lib",
+                                                                              "File")})
+    client.run("create . user/stable")
+    client.run("upload %s --all" % str(ref))
+
+    save(client.cache.new_config_path, "core.upload:compression_format=xz")
+    client.run("upload %s --all --force" % str(ref), assert_error=True)
+    assert "Remote 'default' can't remove 'conan_package.tgz' of package" in client.out
+    assert "Uploading conan_package.txz" not in client.out
+    assert _server_package_files(client, ref) == ["conan_package.tgz", "conaninfo.txt",
+                                                  "conanmanifest.txt"]
+
+
+def test_upload_compression_format_not_supported():
+    server = TestServer(users={"user": "password"},
+                        server_capabilities=[COMPLEX_SEARCH_CAPABILITY, REVISIONS])
+    client = TestClient(servers={"default": server}, users={"default": [("user", "password")]})
+    save(client.cache.new_config_path, "core.upload:compression_format=none")
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create . user/stable")
+    client.run("upload pkg/0.1@user/stable --all")
+    assert "Remote 'default' doesn't support 'none' package archives, using 'gzip'" in client.out
+    assert "Uploading conan_package.tgz" in client.out
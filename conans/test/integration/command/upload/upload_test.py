@@ -76,7 +76,8 @@ class UploadTest(unittest.TestCase):
             client.run("upload * --all --confirm")
             self.assertNotIn("Uploading conan_package.tgz", client.out)
             self.assertIn("Package is up to date, upload skipped", client.out)
-            self.assertIn("Compressing package...", client.out)
+            # The remote is checked first, it is not compressed if it is not uploaded
+            self.assertNotIn("Compressing package...", client.out)
 
         client.run("upload * --all --confirm --force")
         self.assertIn("Uploading conanfile.py", client.out)
@@ -222,7 +223,7 @@ class UploadTest(unittest.TestCase):
 
         def gzopen_patched(name, mode="r", fileobj=None, **kwargs):
             raise ConanException("Error gzopen %s" % name)
-        with patch('conans.client.cmd.uploader.gzopen_without_timestamps', new=gzopen_patched):
+        with patch('conans.util.archives.gzopen_without_timestamps', new=gzopen_patched):
             client.run("upload * --confirm", assert_error=True)
             self.assertIn("ERROR: Hello0/1.2.1@user/testing: Upload recipe to 'default' failed: "
                           "Error gzopen conan_sources.tgz", client.out)
@@ -250,7 +251,7 @@ class UploadTest(unittest.TestCase):
             if name == PACKAGE_TGZ_NAME:
                 raise ConanException("Error gzopen %s" % name)
             return gzopen_without_timestamps(name, mode, fileobj, **kwargs)
-        with patch('conans.client.cmd.uploader.gzopen_without_timestamps', new=gzopen_patched):
+        with patch('conans.util.archives.gzopen_without_timestamps', new=gzopen_patched):
             client.run("upload * --confirm --all", assert_error=True)
             self.assertIn("ERROR: Hello0/1.2.1@user/testing:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9"
                           ": Upload package to 'default' failed: Error gzopen conan_package.tgz",
@@ -383,6 +384,51 @@ class UploadTest(unittest.TestCase):
         self.assertNotIn("Uploading conan_package.tgz", client2.out)
         self.assertIn("Package is up to date, upload skipped", client2.out)
 
+    def test_upload_unmodified_package_not_compressed(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": conanfile,
+                     "hello.cpp": ""})
+        client.run("create . frodo/stable")
+        client.run("upload Hello0/1.2.1@frodo/stable --all")
+
+        client2 = TestClient(servers=client.servers, users=client.users)
+        client2.save({"conanfile.py": conanfile,
+                      "hello.cpp": ""})
+        client2.run("create . frodo/stable")
+        client2.run("upload Hello0/1.2.1@frodo/stable --all")
+        self.assertIn("Package is up to date, upload skipped", client2.out)
+        self.assertNotIn("Compressing package...", client2.out)
+        layout = client2.cache.package_layout(ConanFileReference.loads("Hello0/1.2.1@frodo/stable"))
+        pref = PackageReference(layout.ref, NO_SETTINGS_PACKAGE_ID)
+        self.assertFalse(os.path.exists(os.path.join(layout.download_package(pref),
+                                                     PACKAGE_TGZ_NAME)))
+
+    def test_upload_dry_run(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": conanfile,
+                     "hello.cpp": "hello"})
+        client.run("create . frodo/stable")
+        client.run("upload Hello0/1.2.1@frodo/stable --all --dry-run")
+        self.assertIn("Upload plan to remote 'default':", client.out)
+        self.assertIn("Hello0/1.2.1@frodo/stable: Upload, ", client.out)
+        self.assertIn("Hello0/1.2.1@frodo/stable:%s: Upload, " % NO_SETTINGS_PACKAGE_ID,
+                      client.out)
+        self.assertIn("Would upload 1 recipes and 1 packages", client.out)
+        self.assertNotIn("Compressing", client.out)
+        client.run("search -r default")
+        self.assertNotIn("Hello0/1.2.1@frodo/stable", client.out)
+
+        client.run("upload Hello0/1.2.1@frodo/stable --all")
+        client.run("upload Hello0/1.2.1@frodo/stable --all --dry-run")
+        self.assertIn("Hello0/1.2.1@frodo/stable: Skip, up to date", client.out)
+        self.assertIn("Hello0/1.2.1@frodo/stable:%s: Skip, up to date" % NO_SETTINGS_PACKAGE_ID,
+                      client.out)
+        self.assertIn("Would upload 0 recipes and 0 packages, 0B", client.out)
+
+        client.run("upload Hello0/1.2.1@frodo/stable --dry-run --skip-upload", assert_error=True)
+        self.assertIn("'--dry-run' argument cannot be used together with '--skip-upload'",
+                      client.out)
+
     @pytest.mark.artifactory_ready
     def test_no_overwrite_argument_collision(self):
         client = TestClient(default_server_user=True)
@@ -879,3 +925,20 @@ class MyPkg(ConanFile):
             "pkg/1.0@user/channel#{}:{} --revisions  -r default".format(pref.ref.revision, pref.id))[
             0]
         self.assertIn(pref.revision, search_result["revision"])
+
+
+def test_upload_plan_parallel():
+    """ The remote states of the upload plan are requested concurrently only with --parallel
+    """
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile()})
+    client.run("create . pkg/0.1@")
+
+    def pool_sizes(command):
+        with patch.object(_PackagePreparator, "remote_states", side_effect=Exception("No batch")):
+            with patch("conans.client.cmd.uploader.ThreadPool") as pool:
+                client.run(command)
+        return [c[0][0] for c in pool.call_args_list]
+
+    assert pool_sizes("upload * --all --confirm --dry-run") == []
+    assert len(pool_sizes("upload * --all --confirm --parallel --dry-run")) == 1
@@ -126,7 +126,7 @@ class ConanTraceTest(unittest.TestCase):
             self.assertEqual(num_post, 2)  # 2 get urls
 
         num_get = len([it for it in actions if "REST_API_CALL" in it and "GET" in it])
-        self.assertEqual(num_get, 10)
+        self.assertEqual(num_get, 8)  # Remote state checked once, before compressing
 
         # Check masked signature
         for action in actions:
@@ -14,7 +14,7 @@ from conans.client.tools import environment_append
 from conans.client.tools.files import replace_in_file, save
 from conans.errors import ConanException
 from conans.paths import CACERT_FILE
-from conans.test.utils.tools import temp_folder
+from conans.test.utils.tools import temp_folder, StoppableThreadBottle
 from conans.test.utils.mocks import TestBufferConanOutput
 from conans.util.files import normalize
 
@@ -99,3 +99,31 @@ class ConanRequesterHeadersTests(unittest.TestCase):
         requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
         headers = mock_http_requester.get.call_args[1]["headers"]
         self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+
+class ConanRequesterPoolTests(unittest.TestCase):
+    def test_pool_size_parallel_download(self):
+        conan_conf = os.path.join(temp_folder(), "conan.conf")
+        save(conan_conf, normalize(get_default_client_conf()))
+        config = ConanClientConfigParser(conan_conf)
+        config.set_item("general.parallel_download", "64")
+        with environment_append({"CONAN_CPU_COUNT": "4"}):
+            requester = ConanRequester(config)
+        adapter = requester._http_requester.get_adapter("https://myremote.com")
+        self.assertEqual(64, adapter._pool_maxsize)
+
+    def test_connections_reused(self):
+        http_server = StoppableThreadBottle()
+
+        @http_server.server.get("/ping")
+        def ping():
+            return "pong"
+
+        http_server.run_server()
+        cache = ClientCache(temp_folder(), TestBufferConanOutput())
+        requester = ConanRequester(cache.config)
+        for _ in range(3):
+            response = requester.get("http://localhost:%s/ping" % http_server.port)
+            self.assertEqual("pong", response.text)
+        http_server.stop()
+        self.assertEqual({"localhost": (1, 3)}, requester.connections_stats())
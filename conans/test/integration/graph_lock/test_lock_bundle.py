@@ -1,6 +1,8 @@
 import json
 import os
 
+from mock import mock
+
 from conans.model.graph_lock import GraphLockFile
 from conans.test.utils.tools import TestClient, GenConanfile
 
@@ -262,3 +264,35 @@ def test_build_requires_error():
         ["pkga/0.1@#f096d7d54098b7ad7012f9435d9c33f3"],
         ["app1/0.1@#5af607abc205b47375f485a98abc3b38"]
     ]
+
+
+def test_update_loads_lockfiles_once():
+    client = TestClient()
+    client.run("config set general.revisions_enabled=1")
+    client.save({"pkga/conanfile.py": GenConanfile(),
+                 "app1/conanfile.py": GenConanfile().with_settings("os").with_requires("pkga/0.1")})
+    client.run("export pkga pkga/0.1@")
+    client.run("export app1 app1/0.1@")
+    client.run("lock create --ref=app1/0.1 -s os=Windows --lockfile-out=app1_windows.lock")
+    client.run("lock create --ref=app1/0.1 -s os=Linux --lockfile-out=app1_linux.lock")
+    client.run("lock bundle create app1_windows.lock app1_linux.lock --bundle-out=lock1.bundle")
+    client.run("install pkga/0.1@ --build=pkga --lockfile=app1_windows.lock "
+               "--lockfile-out=app1_windows.lock")
+    windows_lock = client.load("app1_windows.lock")
+
+    load = GraphLockFile.load
+    with mock.patch.object(GraphLockFile, "load", side_effect=load) as load_mock:
+        with mock.patch.object(GraphLockFile, "save", autospec=True,
+                               side_effect=GraphLockFile.save) as save_mock:
+            client.run("lock bundle update lock1.bundle")
+    assert sorted(c[0][0] for c in load_mock.call_args_list) == ["app1_linux.lock",
+                                                                 "app1_windows.lock"]
+    # Only the Linux lockfile gets the PREV of the pkga binary built with the Windows one
+    assert [c[0][1] for c in save_mock.call_args_list] == ["app1_linux.lock"]
+    assert client.load("app1_windows.lock") == windows_lock
+    linux_lock = GraphLockFile.load(os.path.join(client.current_folder, "app1_linux.lock"),
+                                    client.cache.config.revisions_enabled)
+    assert linux_lock.graph_lock.nodes["2"].prev is not None
+
+    client.run("lock bundle build-order lock1.bundle --json=bo.json")
+    assert json.loads(client.load("bo.json")) == [["app1/0.1@#5af607abc205b47375f485a98abc3b38"]]
@@ -68,7 +68,6 @@ class AuthorizeBearerTest(unittest.TestCase):
 
         if not client.cache.config.revisions_enabled:
             expected_calls = [('ping', None),
-                              ('get_recipe_manifest_url', None),
                               ('check_credentials', None),
                               ('authenticate', 'Basic'),
                               ('get_recipe_snapshot', 'Bearer'),
@@ -76,7 +75,6 @@ class AuthorizeBearerTest(unittest.TestCase):
                               ('put', None)]
         else:
             expected_calls = [('ping', None),
-                              ('get_recipe_file', None),
                               ('check_credentials', None),
                               ('authenticate', 'Basic'),
                               ('get_recipe_file_list', 'Bearer'),
@@ -106,7 +104,6 @@ class AuthorizeBearerTest(unittest.TestCase):
         self.assertTrue(errors)
 
         expected_calls = [('ping', None),
-                          ('get_recipe_manifest_url', None),
                           ('check_credentials', None),
                           ('authenticate', 'Basic'),
                           ('get_recipe_snapshot', 'Bearer'),
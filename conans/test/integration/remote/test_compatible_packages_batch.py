@@ -0,0 +1,68 @@
+import textwrap
+
+import mock
+
+from conans import COMPLEX_SEARCH_CAPABILITY, REVISIONS
+from conans.client.rest.rest_client_v2 import RestV2Methods
+from conans.test.utils.tools import TestClient, TestServer
+
+conanfile = textwrap.dedent("""
+    from conans import ConanFile
+    class Pkg(ConanFile):
+        name = "pkg"
+        version = "0.1"
+        settings = "os"
+        def package_id(self):
+            for os_ in ("FreeBSD", "Macos", "Linux"):
+                compatible = self.info.clone()
+                compatible.settings.os = os_
+                self.compatible_packages.append(compatible)
+    """)
+
+
+def _client(server):
+    client = TestClient(servers={"default": server}, users={"default": [("user", "password")]})
+    client.run("config set general.revisions_enabled=1")
+    return client
+
+
+def _install(server, conf=None):
+    client = _client(server)
+    client.save({"conanfile.py": conanfile})
+    client.run("create . -s os=Linux")
+    client.run("upload * --all -c -r default")
+
+    client = _client(server)
+    if conf:
+        client.save({"global.conf": conf}, path=client.cache.cache_folder)
+    with mock.patch.object(RestV2Methods, "get_packages_info", autospec=True,
+                           side_effect=RestV2Methods.get_packages_info) as batch:
+        with mock.patch.object(RestV2Methods, "get_latest_package_revision", autospec=True,
+                               side_effect=RestV2Methods.get_latest_package_revision) as latest:
+            with mock.patch.object(RestV2Methods, "search_packages", autospec=True,
+                                   side_effect=RestV2Methods.search_packages) as search:
+                client.run("install pkg/0.1@ -s os=Windows")
+    assert "Main binary package" in client.out
+    assert "Using compatible package" in client.out
+    assert "Downloading conan_package.tgz" in client.out
+    return batch.call_count, latest.call_count, search.call_count
+
+
+def test_compatible_packages_batch():
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")])
+    # The Windows binary, and then the 3 compatible ones in one request
+    assert _install(server) == (1, 1, 0)
+
+
+def test_compatible_packages_listing():
+    capabilities = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")],
+                        server_capabilities=capabilities)
+    # The Windows binary, and every compatible package until the Linux one is found
+    assert _install(server) == (0, 4, 0)
+
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")],
+                        server_capabilities=capabilities)
+    # The FreeBSD and Macos binaries are not in the listing, they are not requested
+    conf = "core.package_id:compatible_packages_listing=True"
+    assert _install(server, conf) == (0, 2, 1)
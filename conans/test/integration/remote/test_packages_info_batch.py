@@ -0,0 +1,58 @@
+import re
+
+import mock
+
+from conans import COMPLEX_SEARCH_CAPABILITY, REVISIONS
+from conans.client.rest.rest_client_v2 import RestV2Methods
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestServer, NO_SETTINGS_PACKAGE_ID
+
+
+def _client(server):
+    client = TestClient(servers={"default": server}, users={"default": [("user", "password")]})
+    client.run("config set general.revisions_enabled=1")
+    return client
+
+
+def _upload_packages(server):
+    client = _client(server)
+    client.save({"pkga/conanfile.py": GenConanfile("pkga", "0.1"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "0.1"),
+                 "pkgc/conanfile.py": GenConanfile("pkgc", "0.1").with_requires("pkga/0.1",
+                                                                                "pkgb/0.1")})
+    client.run("create pkga")
+    client.run("create pkgb")
+    client.run("export pkgc")  # pkgc binary is missing in the server
+    client.run("upload * --all -c -r default")
+
+
+def _check_install(client):
+    client.run("install pkgc/0.1@ --build=missing")
+    assert "pkga/0.1:{} - Download".format(NO_SETTINGS_PACKAGE_ID) in client.out
+    assert "pkgb/0.1:{} - Download".format(NO_SETTINGS_PACKAGE_ID) in client.out
+    assert re.search(r"pkgc/0.1:\w+ - Build", str(client.out))
+
+
+def test_packages_info_batch():
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")])
+    _upload_packages(server)
+
+    client = _client(server)
+    with mock.patch.object(RestV2Methods, "get_packages_info", autospec=True,
+                           side_effect=RestV2Methods.get_packages_info) as batch:
+        with mock.patch.object(RestV2Methods, "get_latest_package_revision", autospec=True,
+                               side_effect=RestV2Methods.get_latest_package_revision) as latest:
+            _check_install(client)
+    assert batch.call_count == 1  # pkga and pkgb in the same level, pkgc alone in its level
+    assert latest.call_count == 1  # only pkgc, not found
+
+
+def test_packages_info_batch_not_supported():
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")],
+                        server_capabilities=[COMPLEX_SEARCH_CAPABILITY, REVISIONS])
+    _upload_packages(server)
+
+    client = _client(server)
+    with mock.patch.object(RestV2Methods, "get_packages_info", autospec=True) as batch:
+        _check_install(client)
+    batch.assert_not_called()
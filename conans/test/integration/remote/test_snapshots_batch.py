@@ -0,0 +1,54 @@
+import mock
+
+from conans import COMPLEX_SEARCH_CAPABILITY, REVISIONS
+from conans.client.rest.rest_client_v2 import RestV2Methods
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestServer
+
+
+def _client(server):
+    client = TestClient(servers={"default": server}, users={"default": [("user", "password")]})
+    client.run("config set general.revisions_enabled=1")
+    client.save({"pkga/conanfile.py": GenConanfile("pkga", "0.1"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "0.1")})
+    client.run("create pkga")
+    client.run("create pkgb")
+    return client
+
+
+def _check_upload(client):
+    with mock.patch.object(RestV2Methods, "get_snapshots", autospec=True,
+                           side_effect=RestV2Methods.get_snapshots) as batch:
+        with mock.patch.object(RestV2Methods, "get_recipe_snapshot", autospec=True,
+                               side_effect=RestV2Methods.get_recipe_snapshot) as recipe:
+            with mock.patch.object(RestV2Methods, "get_package_snapshot", autospec=True,
+                                   side_effect=RestV2Methods.get_package_snapshot) as package:
+                client.run("upload * --all -c -r default")
+    return batch.call_count, recipe.call_count, package.call_count
+
+
+def test_snapshots_batch():
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")])
+    client = _client(server)
+    client.run("upload pkga/0.1@ --all -c -r default")
+
+    # One request for the 2 recipes and 2 packages, pkga is up to date in the remote
+    assert _check_upload(client) == (1, 0, 0)
+    assert "Recipe is up to date, upload skipped" in client.out
+    assert "Uploading conan_package.tgz" in client.out
+
+    client.run("upload * --all -c -r default --dry-run")
+    assert "Would upload 0 recipes and 0 packages" in client.out
+
+
+def test_snapshots_batch_not_supported():
+    server = TestServer(users={"user": "password"}, write_permissions=[("*/*@*/*", "*")],
+                        server_capabilities=[COMPLEX_SEARCH_CAPABILITY, REVISIONS])
+    client = _client(server)
+    client.run("upload pkga/0.1@ --all -c -r default")
+
+    # Every snapshot is requested by the plan of the upload
+    batch_calls, recipe_calls, package_calls = _check_upload(client)
+    assert batch_calls == 0
+    assert recipe_calls >= 2 and package_calls >= 2
+    assert "Recipe is up to date, upload skipped" in client.out
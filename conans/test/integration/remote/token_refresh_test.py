@@ -1,6 +1,7 @@
 import unittest
 from collections import namedtuple
 
+import mock
 from mock import Mock
 
 from conans.client.cache.remote_registry import Remote
@@ -109,3 +110,17 @@ class TestTokenRefresh(unittest.TestCase):
         self.assertEqual(self.localdb.user, "myuser")
         self.assertEqual(self.localdb.access_token, "refreshed_access_token")
         self.assertEqual(self.localdb.refresh_token, "refresh_token")
+
+    def test_rest_client_reused(self):
+        """The client of the remote is reused while the login doesn't change"""
+        self.localdb.access_token = "expired"
+        self.localdb.refresh_token = "refresh_token"
+        with mock.patch.object(self.rest_client_factory, "new",
+                               wraps=self.rest_client_factory.new) as new_client:
+            self.auth_manager.call_rest_api_method(self.remote, "get_recipe", self.ref, ".")
+            # The one with the expired token, which refreshes it, and the refreshed one
+            self.assertEqual(new_client.call_count, 2)
+            self.auth_manager.call_rest_api_method(self.remote, "get_recipe", self.ref, ".")
+            self.auth_manager.call_rest_api_method(self.remote, "get_recipe", self.ref, ".")
+            self.assertEqual(new_client.call_count, 2)
+        self.assertEqual(self.localdb.access_token, "refreshed_access_token")
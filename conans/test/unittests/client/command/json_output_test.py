@@ -0,0 +1,57 @@
+import datetime
+import json
+import os
+
+import pytest
+
+from conans.client.conan_command_output import CommandOutputer, _date_handler, _json_chunks
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+def test_json_chunks():
+    data = {"error": False,
+            "results": [{"items": [{"recipe": {"id": "pkg/0.1@user/channel"}, "packages": []}],
+                         "remote": None}],
+            "time": datetime.datetime(2021, 3, 4, 5, 6, 7)}
+    text = "".join(_json_chunks(data, default=_date_handler))
+    assert text == json.dumps(data, default=_date_handler)
+
+    items = [{"reference": "pkg/0.%d" % i, "requires": ["dep/0.1"]} for i in range(3)]
+    assert "".join(_json_chunks(item for item in items)) == json.dumps(items)
+    assert "".join(_json_chunks(item for item in [])) == "[]"
+
+
+def test_json_output_streamed():
+    def nodes():
+        for i in range(3):
+            yield {"reference": "pkg/0.%d" % i}
+
+    output = TestBufferConanOutput()
+    outputer = CommandOutputer(output, cache=None)
+    outputer._handle_json_output(nodes(), True, None)
+    assert json.loads(str(output)) == [{"reference": "pkg/0.%d" % i} for i in range(3)]
+
+    folder = temp_folder()
+    outputer._handle_json_output(nodes(), "info.json", folder)
+    assert json.loads(load(os.path.join(folder, "info.json"))) == \
+        [{"reference": "pkg/0.%d" % i} for i in range(3)]
+
+    outputer.json_output({"time": datetime.datetime(2021, 3, 4)}, "sub/search.json", folder)
+    assert json.loads(load(os.path.join(folder, "sub", "search.json"))) == \
+        {"time": "2021-03-04T00:00:00"}
+
+
+def test_json_output_not_truncated():
+    def nodes():
+        yield {"reference": "pkg/0.1"}
+        raise ValueError("Broken graph")
+
+    folder = temp_folder()
+    save(os.path.join(folder, "info.json"), "[]")
+    outputer = CommandOutputer(TestBufferConanOutput(), cache=None)
+    with pytest.raises(ValueError):
+        outputer._handle_json_output(nodes(), "info.json", folder)
+    assert load(os.path.join(folder, "info.json")) == "[]"
+    assert os.listdir(folder) == ["info.json"]
@@ -7,6 +7,7 @@ import pytest
 
 from conans.client.file_copier import FileCopier
 from conans.test.utils.test_files import temp_folder
+from conans.util import dir_snapshot
 from conans.util.files import load, save
 
 
@@ -270,3 +271,40 @@ class FileCopierTest(unittest.TestCase):
                          sorted(os.listdir(os.path.join(dst_folder, "include"))))
         self.assertEqual(sorted(["AttributeStorage.h", "file.h"]),
                          sorted(os.listdir(os.path.join(dst_folder, "include", "sub"))))
+
+    def test_source_listed_once(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include/header.h"), "")
+        save(os.path.join(src_folder, "lib/mylib.a"), "")
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        with mock.patch("conans.util.dir_snapshot._list_folder",
+                        wraps=dir_snapshot._list_folder) as list_folder:
+            copier("*.h")
+            listed = list_folder.call_count
+            copier("*.a")
+            # The snapshot is validated (racy folders listed again), not taken again
+            self.assertLessEqual(list_folder.call_count, 2 * listed)
+        self.assertTrue(os.path.exists(os.path.join(dst_folder, "include/header.h")))
+        self.assertTrue(os.path.exists(os.path.join(dst_folder, "lib/mylib.a")))
+
+        # New files are found after the source is modified
+        save(os.path.join(src_folder, "lib/other.a"), "")
+        copier("*.a")
+        self.assertTrue(os.path.exists(os.path.join(dst_folder, "lib/other.a")))
+
+    def test_up_to_date_files_not_copied(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "header.h"), "content")
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        copier("*.h")
+        with mock.patch("shutil.copy2") as copy2:
+            self.assertEqual([os.path.join(dst_folder, "header.h")], copier("*.h"))
+            self.assertFalse(copy2.called)
+
+        save(os.path.join(src_folder, "header.h"), "modified content")
+        copier("*.h")
+        self.assertEqual("modified content", load(os.path.join(dst_folder, "header.h")))
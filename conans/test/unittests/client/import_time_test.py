@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+import conans
+
+# The conan and conans modules imported by the command line, before running any command. The
+# generators, the new tools and the heavy third-party libraries are imported when used
+_MODULES_BUDGET = 210
+_LAZY_MODULES = ["jinja2", "conan.tools.cmake", "conan.tools.microsoft",
+                 "conans.client.generators.cmake", "conans.client.generators.markdown",
+                 "conans.client.generators.visualstudio"]
+
+
+def test_import_time():
+    code = "import sys, conans.client.command; print('\\n'.join(sys.modules))"
+    root = os.path.dirname(os.path.dirname(conans.__file__))
+    modules = subprocess.check_output([sys.executable, "-c", code], cwd=root).decode().split()
+    for module in _LAZY_MODULES:
+        assert module not in modules
+    conan_modules = [m for m in modules if m.split(".")[0] in ("conan", "conans")]
+    assert len(conan_modules) <= _MODULES_BUDGET, \
+        "Imported %d modules, budget %d" % (len(conan_modules), _MODULES_BUDGET)
+
+
+def test_generators_still_importable():
+    from conans.client.generators import CMakeGenerator, VirtualRunEnv
+    from conans.client.generators.cmake import CMakeGenerator as cmake_generator
+    from conan.tools.env import VirtualRunEnv as virtual_run_env
+    assert CMakeGenerator is cmake_generator
+    assert VirtualRunEnv is virtual_run_env
@@ -0,0 +1,68 @@
+# coding=utf-8
+import codecs
+import os
+import sys
+
+import six
+
+from conans.client.runner import ConanRunner, _RateLimitedWrite, _StreamDecoder
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+def _decode_chunks(chunks):
+    decoder = _StreamDecoder()
+    text = "".join(decoder.decode(chunk) for chunk in chunks)
+    return text + decoder.decode(b"", final=True)
+
+
+def test_stream_decoder_utf8_split_characters():
+    data = u"línea 1\nñandú 2\n€ 3".encode("utf-8")
+    chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+    assert _decode_chunks(chunks) == u"línea 1\nñandú 2\n€ 3"
+
+
+def test_stream_decoder_bom():
+    data = codecs.BOM_UTF16_LE + u"hello\r\nworld\r\n".encode("utf_16_le")
+    assert _decode_chunks([data[:5], data[5:]]) == u"hello\r\nworld\r\n"
+
+
+def test_stream_decoder_windows_1252_lines():
+    # Not valid UTF-8 lines are decoded one by one, as before
+    data = u"first\n".encode("utf-8") + u"café\n".encode("Windows-1252") + \
+        u"ñandú\nlast".encode("utf-8")
+    assert _decode_chunks([data[:9], data[9:]]) == u"first\ncafé\nñandú\nlast"
+
+
+def test_rate_limited_write():
+    stream = six.StringIO()
+    now = [100.0]
+    writer = _RateLimitedWrite(stream, max_lines=2, clock=lambda: now[0])
+    writer.write("".join("line{}\n".format(i) for i in range(15)))
+    assert stream.getvalue() == "line0\nline1\n"
+    now[0] = 101.2
+    writer.write("other\n")
+    assert stream.getvalue() == ("line0\nline1\n[... 13 lines skipped, last 10:]\n" +
+                                 "".join("line{}\n".format(i) for i in range(5, 15)) + "other\n")
+    writer.write("again\n")
+    writer.write("again2\n")
+    writer.close()
+    assert stream.getvalue().endswith("other\nagain\n[... 1 lines skipped, last 1:]\nagain2\n")
+
+
+def test_runner_log_file_and_output():
+    folder = temp_folder()
+    script = os.path.join(folder, "script.py")
+    save(script, "import sys\n"
+                 "for i in range(20000):\n"
+                 "    sys.stdout.write('line %d\\n' % i)\n")
+    log_file = os.path.join(folder, "log.txt")
+    output = six.StringIO()
+    runner = ConanRunner(generate_run_log_file=True, output_max_rate=10)
+    ret = runner('"{}" "{}"'.format(sys.executable, script), output=output,
+                 log_filepath=log_file)
+    assert ret == 0
+    expected = "".join("line %d\n" % i for i in range(20000))
+    # The user output and the log file get everything, the rate is only for the Conan output
+    assert output.getvalue().endswith(expected)
+    assert load(log_file) == expected
@@ -0,0 +1,79 @@
+import os
+import platform
+import stat
+
+import mock
+import pytest
+
+from conans.client import source_staging
+from conans.client.source_staging import stage_sources
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save, staged_hardlinks
+
+
+def _no_reflink(src, dst):
+    raise OSError("Not supported")
+
+
+@mock.patch.object(source_staging, "_reflink", side_effect=_no_reflink)
+def test_stage_sources_hardlinks(_):
+    src = temp_folder()
+    save(os.path.join(src, "CMakeLists.txt"), "project(hello)")
+    save(os.path.join(src, "src/hello.cpp"), "int main(){}")
+    save(os.path.join(src, "src/hello.h"), "void hello();")
+    dst = os.path.join(temp_folder(), "build")
+    mode = os.stat(os.path.join(src, "src/hello.cpp")).st_mode
+
+    # Only the files declared read-only are linked
+    staged = stage_sources(src, dst, read_only=["src/*"])
+    assert staged.linked == 2
+    assert staged.copied == 1
+    assert "2 linked" in staged.summary()
+    assert load(os.path.join(dst, "src/hello.cpp")) == "int main(){}"
+    assert os.stat(os.path.join(dst, "src/hello.cpp")).st_ino == \
+        os.stat(os.path.join(src, "src/hello.cpp")).st_ino
+    # The permissions of the source files don't change
+    assert os.stat(os.path.join(src, "src/hello.cpp")).st_mode == mode
+
+    # While building, Conan save() breaks the link instead of writing the shared file
+    assert sorted(staged.linked_files) == [os.path.join(dst, "src", "hello.cpp"),
+                                           os.path.join(dst, "src", "hello.h")]
+    with staged_hardlinks(staged.linked_files):
+        save(os.path.join(dst, "src/hello.h"), "void patched();")
+    assert load(os.path.join(dst, "src/hello.h")) == "void patched();"
+    assert load(os.path.join(src, "src/hello.h")) == "void hello();"
+    assert staged.modified_sources() == []
+    assert sorted(os.listdir(os.path.join(dst, "src"))) == ["hello.cpp", "hello.h"]
+    # Other hardlinks are written as always
+    os.link(os.path.join(src, "CMakeLists.txt"), os.path.join(dst, "other.txt"))
+    with staged_hardlinks(staged.linked_files):
+        save(os.path.join(dst, "other.txt"), "project(bye)")
+    assert load(os.path.join(src, "CMakeLists.txt")) == "project(bye)"
+
+    # Modifying the shared file in place is detected
+    with open(os.path.join(dst, "src/hello.cpp"), "a") as f:
+        f.write("// modified")
+    assert staged.modified_sources() == [os.path.join(src, "src", "hello.cpp")]
+
+    # Nothing is linked without read-only files
+    staged = stage_sources(src, os.path.join(temp_folder(), "build"))
+    assert staged.linked == 0
+    assert staged.copied == 3
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Needs symlinks")
+def test_stage_sources_fallback_copy():
+    src = temp_folder()
+    save(os.path.join(src, "src/hello.cpp"), "int main(){}")
+    os.symlink("src", os.path.join(src, "link_src"))
+    dst = os.path.join(temp_folder(), "build")
+
+    with mock.patch.object(source_staging, "_reflink", side_effect=_no_reflink):
+        with mock.patch("os.link", side_effect=OSError("Cross-device link")):
+            staged = stage_sources(src, dst)
+    assert staged.copied == 1
+    assert staged.shared_bytes == 0
+    assert os.readlink(os.path.join(dst, "link_src")) == "src"
+    assert load(os.path.join(dst, "link_src/hello.cpp")) == "int main(){}"
+    # Copies do not change the source files permissions
+    assert os.stat(os.path.join(src, "src/hello.cpp")).st_mode & stat.S_IWUSR
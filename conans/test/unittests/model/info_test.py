@@ -146,3 +146,32 @@ class ConanInfoTest(unittest.TestCase):
         info = ConanInfo.loads(info2)
         info.requires.package_revision_mode()
         self.assertEqual(info.requires.dumps(), "zlib/0.3@lasote/testing#RREV1:sha2#PREV1")
+
+    def test_package_id_changes(self):
+        # The shas are memoized, but the package_id changes with the info like in package_id()
+        loaded = ConanInfo.loads(info_text)
+        info = ConanInfo.create(loaded.full_settings, loaded.full_options, loaded.full_requires,
+                                [], "full_package_mode", None, "minor_mode")
+        package_id = info.package_id()
+        clone = info.clone()
+        self.assertEqual(clone.package_id(), package_id)
+        self.assertEqual(clone.full_requires.dumps(), info.full_requires.dumps())
+
+        info.settings.compiler.version = "6"
+        self.assertNotEqual(info.package_id(), package_id)
+        info.settings.compiler.version = "5.2"
+        self.assertEqual(info.package_id(), package_id)
+
+        info.options.shared = True
+        self.assertNotEqual(info.package_id(), package_id)
+        del info.options.shared
+        info.options.shared = False
+        self.assertEqual(info.package_id(), package_id)
+
+        info.requires["zlib"].package_id = None
+        self.assertNotEqual(info.package_id(), package_id)
+        info.requires.full_package_mode()
+        self.assertEqual(info.package_id(), package_id)
+        info.requires.remove("zlib")
+        self.assertNotEqual(info.package_id(), package_id)
+        self.assertEqual(clone.package_id(), package_id)
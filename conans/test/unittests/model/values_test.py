@@ -25,3 +25,24 @@ class ValuesTest(unittest.TestCase):
         v.compiler = None
         self.assertEqual(v.as_list(), [('compiler', 'None')])
         self.assertEqual(v.dumps(), "compiler=None")
+
+    def test_sha_changes(self):
+        # The sha and as_list() are memoized, but changing any value, also nested, resets them
+        v = Values.from_list([("compiler", "gcc"), ("compiler.version", "9"), ("os", "Linux")])
+        sha = v.sha
+        copied = v.copy()
+        self.assertEqual(copied.sha, sha)
+
+        compiler = v.compiler
+        compiler.version = "10"
+        self.assertNotEqual(v.sha, sha)
+        self.assertEqual(v.get_safe("compiler.version"), "10")
+        self.assertEqual(copied.sha, sha)
+        self.assertEqual(copied.get_safe("compiler.version"), "9")
+
+        copied.compiler.version = "10"
+        self.assertEqual(copied.sha, v.sha)
+        del copied.compiler.version
+        self.assertEqual(copied.as_list(), [('compiler', 'gcc'), ('os', 'Linux')])
+        copied.compiler.clear()
+        self.assertEqual(copied.as_list(), [('compiler', ''), ('os', 'Linux')])
@@ -2,6 +2,7 @@ import unittest
 
 from conans.client.graph.range_resolver import satisfying
 from conans.errors import ConanException
+from conans.model.version import Version
 from conans.test.utils.mocks import TestBufferConanOutput
 
 
@@ -115,3 +116,25 @@ class BasicMaxVersionTest(unittest.TestCase):
             satisfying(["2.1.1"], "2.3 3.2, include_prerelease=Ture, loose=False", output)
         with self.assertRaises(ConanException):
             satisfying(["2.1.1"], "~2.3, abc, loose=False", output)
+
+    def test_cached_versions(self):
+        """ the parsed and sorted versions are reused, the results are the same as searching
+        the maximum one of the versions
+        """
+        output = []
+        versions = ["1.2.3.4", "1.2.3.5", "2.0", "master", "1.3", "1.3.0"]
+        for _ in range(2):
+            # Equal versions for semver, the first one, like semver.max_satisfying()
+            self.assertEqual(satisfying(versions, "~1.2", output), "1.2.3.4")
+            self.assertEqual(satisfying(versions, "1.3", output), "1.3")
+            self.assertEqual(satisfying(list(reversed(versions)), "1.3", output), "1.3.0")
+            self.assertEqual(satisfying(versions, ">2", output), None)
+        self.assertEqual(output.count("WARN: Version 'master' is not semver, cannot be compared "
+                                      "with a range"), 8)
+        # The version objects of the list are returned
+        result = satisfying([Version("1.3"), Version("1.3.1")], "~1.3", output)
+        self.assertIsInstance(result, Version)
+        self.assertEqual(result, "1.3.1")
+        with self.assertRaises(ConanException):
+            satisfying(versions, "~2.3, abc, loose=False", output)
+
@@ -0,0 +1,88 @@
+import hashlib
+import io
+import os
+import threading
+from wsgiref.simple_server import WSGIServer, make_server
+
+import bottle
+import mock
+import pytest
+import requests
+
+from conans.errors import RequestErrorException
+from conans.server.rest.server import _SendfileRequestHandler
+from conans.server.service.file_transfer import StreamedUpload, serve_file
+from conans.server.service.mime import get_mime_type
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+@pytest.fixture
+def served_file():
+    folder = temp_folder()
+    path = os.path.join(folder, "conan_package.tgz")
+    content = bytes(bytearray(i % 256 for i in range(300000)))
+    with open(path, "wb") as f:
+        f.write(content)
+    app = bottle.Bottle()
+    app.route("/file", method=["GET", "HEAD"],
+              callback=lambda: serve_file(path, mimetype=get_mime_type(path)))
+    server = make_server("127.0.0.1", 0, app, WSGIServer, handler_class=_SendfileRequestHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield "http://127.0.0.1:{}/file".format(server.server_port), content
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="os.sendfile() not available")
+def test_serve_file(served_file):
+    url, content = served_file
+    with mock.patch("os.sendfile", wraps=os.sendfile) as sendfile:
+        response = requests.get(url)
+        assert response.status_code == 200
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.content == content
+
+        response = requests.get(url, headers={"Range": "bytes=1000-1999"})
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == "bytes 1000-1999/300000"
+        assert response.content == content[1000:2000]
+    assert sendfile.call_args_list[0][0][2:] == (0, 300000)
+    assert sendfile.call_args_list[-1][0][2:] == (1000, 1000)
+
+    response = requests.get(url, headers={"Range": "bytes=-10"})
+    assert response.status_code == 206
+    assert response.content == content[-10:]
+
+    response = requests.get(url, headers={"Range": "bytes=400000-"})
+    assert response.status_code == 416
+
+    response = requests.head(url)
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == "300000"
+    assert response.content == b""
+
+
+def test_streamed_upload():
+    folder = temp_folder()
+    path = os.path.join(folder, "conan_package.tgz")
+    save(path, "previous")
+    content = b"new contents" * 100000
+
+    upload = StreamedUpload(io.BytesIO(content + b"more"), size=len(content),
+                            sha1=hashlib.sha1(content).hexdigest().upper())
+    upload.save_as(path)
+    assert load(path, binary=True) == content
+    assert upload.sha1 == hashlib.sha1(content).hexdigest()
+
+    # The previous file is kept if the upload fails, and the temporary file removed
+    upload = StreamedUpload(io.BytesIO(b"other"), sha1=hashlib.sha1(content).hexdigest())
+    with pytest.raises(RequestErrorException, match="Bad checksum"):
+        upload.save_as(path)
+    upload = StreamedUpload(io.BytesIO(b"other"), size=100)
+    with pytest.raises(RequestErrorException, match="Incomplete upload"):
+        upload.save_as(path)
+    assert load(path, binary=True) == content
+    assert os.listdir(folder) == ["conan_package.tgz"]
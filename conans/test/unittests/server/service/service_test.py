@@ -13,8 +13,10 @@ from conans.server.service.authorize import BasicAuthorizer
 from conans.server.service.common.search import SearchService
 from conans.server.service.v1.service import ConanService
 from conans.server.service.v1.upload_download_service import FileUploadDownloadService
+from conans.server.service.v2.service_v2 import ConanServiceV2
 from conans.server.store.disk_adapter import ServerDiskAdapter
-from conans.server.store.server_store import ServerStore
+from conans.server.store.server_store import SEARCH_INDEX_FILE, SEARCH_INDEX_INVALIDATED_FILE, \
+    ServerStore
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, md5sum, mkdir, save, save_files
@@ -231,6 +233,85 @@ class ConanServiceTest(unittest.TestCase):
                                                 'settings': {}}
                                 })
 
+    def test_search_index(self):
+        ref = ConanFileReference.loads("zlib/1.2@lasote/stable#%s" % DEFAULT_REVISION_V1)
+        save_files(self.server_store.export(ref), {"conanfile.py": ""})
+        self.server_store.update_last_revision(ref)
+        pref1 = PackageReference(ref, "id1", DEFAULT_REVISION_V1)
+        pref2 = PackageReference(ref, "id2", DEFAULT_REVISION_V1)
+        info1_path = os.path.join(self.server_store.package(pref1), CONANINFO)
+        info2_path = os.path.join(self.server_store.package(pref2), CONANINFO)
+        save(info1_path, "[options]\n    shared=True\n")
+        self.server_store.update_last_package_revision(pref1)
+
+        def search():
+            info = self.search_service.search_packages(ref, None)
+            return {package_id: i["options"] for package_id, i in info.items()}
+
+        self.assertEqual(search(), {"id1": {"shared": "True"}})
+        index_path = os.path.join(self.server_store.packages(ref), SEARCH_INDEX_FILE)
+        self.assertTrue(os.path.exists(index_path))
+
+        # The search is answered from the index, until the package is uploaded again
+        save(info1_path, "[options]\n    shared=False\n")
+        self.assertEqual(search(), {"id1": {"shared": "True"}})
+        index = load(index_path)
+        self.server_store.update_last_package_revision(pref1)
+        # The invalidation is appended to its own file, the index is not rewritten
+        invalidated_path = os.path.join(self.server_store.packages(ref),
+                                        SEARCH_INDEX_INVALIDATED_FILE)
+        self.assertEqual(load(index_path), index)
+        self.assertEqual(load(invalidated_path), "id1\n")
+        self.assertEqual(search(), {"id1": {"shared": "False"}})
+        self.assertEqual(load(invalidated_path), "")
+
+        # APIv1 updates the revision before uploading the files
+        self.server_store.update_last_package_revision(pref2)
+        self.assertEqual(search(), {"id1": {"shared": "False"}})
+        save(info2_path, "[options]\n    shared=True\n")
+        self.server_store.package_file_uploaded(info2_path)
+        self.assertEqual(search(), {"id1": {"shared": "False"}, "id2": {"shared": "True"}})
+
+        self.service.remove_packages(ref, ["id1"])
+        self.assertEqual(search(), {"id2": {"shared": "True"}})
+
+        # A missing or corrupted index is computed again
+        save(index_path, "{corrupted")
+        self.assertEqual(search(), {"id2": {"shared": "True"}})
+        os.remove(index_path)
+        self.assertEqual(search(), {"id2": {"shared": "True"}})
+
+        self.service.remove_packages(ref, [])
+        self.assertEqual(search(), {})
+
+    def test_file_lists_forgotten(self):
+        ref = ConanFileReference.loads("zlib/1.2@lasote/stable#%s" % DEFAULT_REVISION_V1)
+        ref2 = ConanFileReference.loads("zlib/1.2@lasote/stable#rev2")
+        save_files(self.server_store.export(ref), {"conanfile.py": ""})
+        save_files(self.server_store.export(ref2), {"conanfile.py": ""})
+        self.server_store.update_last_revision(ref)
+        self.server_store.update_last_revision(ref2)
+        pref = PackageReference(ref, "id1", DEFAULT_REVISION_V1)
+        save_files(self.server_store.package(pref), {CONANINFO: ""})
+        for r in (ref, ref2):
+            self.assertEqual(["conanfile.py"], self.server_store.get_recipe_file_list_cached(r))
+        self.assertEqual([CONANINFO], self.server_store.get_package_file_list_cached(pref))
+
+        def cached():
+            return sorted(os.path.relpath(f, self.server_store.store).replace("\\", "/")
+                          for f in self.server_store._file_lists)
+
+        self.server_store.remove_package_files(pref, [CONANINFO])
+        self.assertEqual(cached(), ["zlib/1.2/lasote/stable/0/export",
+                                    "zlib/1.2/lasote/stable/rev2/export"])
+        self.assertEqual([], self.server_store.get_package_file_list_cached(pref))
+        self.server_store.remove_conanfile(ref2)
+        self.assertEqual(cached(), ["zlib/1.2/lasote/stable/0/export",
+                                    "zlib/1.2/lasote/stable/0/package/id1/0"])
+        self.server_store.remove_conanfile(ref.copy_clear_rev())
+        self.assertEqual(cached(), [])
+        self.assertEqual({}, self.server_store._file_lists_by_rrev)
+
     def test_remove(self):
         ref2 = ConanFileReference("OpenCV", "3.0", "lasote", "stable", DEFAULT_REVISION_V1)
         ref3 = ConanFileReference("Assimp", "1.10", "lasote", "stable", DEFAULT_REVISION_V1)
@@ -260,3 +341,34 @@ class ConanServiceTest(unittest.TestCase):
         self.assertRaises(NotFoundException,
                           self.service.remove_conanfile,
                           ConanFileReference("Fake", "1.0", "lasote", "stable"))
+
+    def test_get_snapshots(self):
+        service = ConanServiceV2(BasicAuthorizer([("*/*@*/*", "*")], []), self.server_store)
+        missing_ref = ConanFileReference.loads("zlib/1.2@lasote/testing#%s" % DEFAULT_REVISION_V1)
+        missing_pref = PackageReference(self.ref, "missing", DEFAULT_REVISION_V1)
+        recipes, packages = service.get_snapshots([self.ref, missing_ref],
+                                                  [self.pref, missing_pref], "lasote")
+        manifest = load(os.path.join(self.server_store.export(self.ref), CONAN_MANIFEST))
+        self.assertEqual(recipes, {self.ref: {"files": {"conanfile.py": {},
+                                                        CONAN_MANIFEST: {}},
+                                              "manifest": manifest},
+                                   missing_ref: None})
+        self.assertEqual(packages, {self.pref: {"files": {"boost.lib": {}, "boost2.lib": {}}},
+                                    missing_pref: None})
+
+        # The cached file lists are updated with the uploads and removals
+        save(os.path.join(self.server_store.package(self.pref), CONANINFO), "")
+        self.server_store.update_last_package_revision(self.pref)
+        _, packages = service.get_snapshots([], [self.pref], "lasote")
+        self.assertEqual(sorted(packages[self.pref]["files"]),
+                         ["boost.lib", "boost2.lib", CONANINFO])
+        self.server_store.remove_package_files(self.pref, ["boost.lib", "boost2.lib"])
+        _, packages = service.get_snapshots([], [self.pref], "lasote")
+        self.assertEqual(list(packages[self.pref]["files"]), [CONANINFO])
+        self.server_store.remove_package(self.pref)
+        _, packages = service.get_snapshots([], [self.pref], "lasote")
+        self.assertEqual(packages, {self.pref: None})
+
+        # Not readable references are not returned
+        service = ConanServiceV2(BasicAuthorizer([], []), self.server_store)
+        self.assertEqual(service.get_snapshots([self.ref], [self.pref], "pepe"), ({}, {}))
@@ -256,3 +256,13 @@ class ToolCopyTest(unittest.TestCase):
                          sorted(os.listdir(os.path.join(dst_folder, "include"))))
         self.assertEqual(sorted(["AttributeStorage.h", "file.h"]),
                          sorted(os.listdir(os.path.join(dst_folder, "include", "sub"))))
+
+    def test_modified_source_listed_again(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include/header.h"), "")
+        dst_folder = temp_folder()
+        copy(None, "*.h", src_folder, dst_folder)
+        save(os.path.join(src_folder, "include/other.h"), "")
+        copy(None, "*.h", src_folder, dst_folder)
+        self.assertEqual(sorted(["header.h", "other.h"]),
+                         sorted(os.listdir(os.path.join(dst_folder, "include"))))
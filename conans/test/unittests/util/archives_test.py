@@ -0,0 +1,73 @@
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+import conans
+from conans.errors import ConanException
+from conans.model.manifest import gather_files
+from conans.test.utils.test_files import temp_folder
+from conans.util.archives import ARCHIVE_CODECS, benchmark_codecs, \
+    benchmark_extraction, find_package_archive, get_archive_codec, write_archive
+from conans.util.files import load, save, tar_extract
+
+
+@pytest.mark.parametrize("codec_name", list(ARCHIVE_CODECS))
+def test_archive_codecs_deterministic(codec_name):
+    folder = temp_folder()
+    save(os.path.join(folder, "lib/mylib.a"), "library " * 1000)
+    save(os.path.join(folder, "include/header.h"), "header")
+    files, symlinks = gather_files(folder)
+    codec = get_archive_codec(codec_name)
+
+    contents = []
+    for _ in range(2):
+        buffer = io.BytesIO()
+        write_archive(codec, buffer, codec.archive_name, sorted(files.items()), symlinks)
+        contents.append(buffer.getvalue())
+    assert contents[0] == contents[1]
+
+    dest = temp_folder()
+    tar_extract(io.BytesIO(contents[0]), dest)
+    assert load(os.path.join(dest, "lib/mylib.a")) == "library " * 1000
+
+
+def test_find_package_archive():
+    assert find_package_archive(["conaninfo.txt", "conan_package.txz"]) == "conan_package.txz"
+    assert find_package_archive({"conan_package.tar": "", "conan_package.tgz": ""}) == \
+        "conan_package.tgz"
+    assert find_package_archive(["conaninfo.txt"]) is None
+    with pytest.raises(ConanException, match="Invalid compression format 'zip'"):
+        get_archive_codec("zip")
+
+
+def test_benchmark_codecs():
+    folder = temp_folder()
+    save(os.path.join(folder, "lib/mylib.a"), "library " * 10000)
+    result = benchmark_codecs(folder)
+    assert [r[0] for r in result] == ["gzip", "xz", "none"]
+    ratios = {name: ratio for name, _, ratio, _, _ in result}
+    assert ratios["xz"] < ratios["none"]
+    assert ratios["gzip"] < ratios["none"]
+
+
+def test_benchmark_entry_point():
+    folder = temp_folder()
+    save(os.path.join(folder, "lib/mylib.a"), "library " * 1000)
+    root = os.path.dirname(os.path.dirname(conans.__file__))
+    out = subprocess.check_output([sys.executable, "-m", "conans.util.archives", folder],
+                                  cwd=root).decode()
+    for codec_name in ("gzip", "xz", "none"):
+        assert codec_name in out
+    assert "extract 1 files" in out
+
+
+def test_benchmark_extraction():
+    folder = temp_folder()
+    save(os.path.join(folder, "lib/mylib.a"), "library " * 1000)
+    save(os.path.join(folder, "include/mylib.h"), "header")
+    files, tar_extract_time, extractall_time = benchmark_extraction(folder)
+    assert files == 2
+    assert tar_extract_time >= 0 and extractall_time >= 0
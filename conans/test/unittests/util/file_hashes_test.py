@@ -1,12 +1,14 @@
 import os
 import unittest
 
+import mock
 import six
 
 from conans.client.tools.files import check_md5, check_sha1, check_sha256
 from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import save
+from conans.util import files
+from conans.util.files import save, md5sum, sha1sum, sha256sum, file_digests_registry
 
 
 class HashesTest(unittest.TestCase):
@@ -29,3 +31,29 @@ class HashesTest(unittest.TestCase):
 
         with six.assertRaisesRegex(self, ConanException, "sha256 signature failed for 'file.txt' file."):
             check_sha256(filepath, "invalid")
+
+    def test_digests_registry(self):
+        folder = temp_folder()
+        filepath = os.path.join(folder, "file.txt")
+        save(filepath, "a file")
+
+        with mock.patch("conans.util.files._multi_algorithm_sum",
+                        wraps=files._multi_algorithm_sum) as multi_sum:
+            with file_digests_registry.enabled():
+                self.assertEqual(md5sum(filepath), "d6d0c756fb8abfb33e652a20e85b70bc")
+                self.assertEqual(sha1sum(filepath), "eb599ec83d383f0f25691c184f656d40384f9435")
+                self.assertEqual(sha256sum(filepath), "7365d029861e32c521f8089b00a6fb32daf06150"
+                                                      "25b69b599d1ce53501b845c2")
+                self.assertEqual(md5sum(filepath), "d6d0c756fb8abfb33e652a20e85b70bc")
+                # The file was read once, for the three digests
+                self.assertEqual(1, multi_sum.call_count)
+
+                # A modified file is hashed again
+                save(filepath, "other file content")
+                self.assertEqual(md5sum(filepath), "6bb46552004ed140a26530dabdba65ab")
+                self.assertEqual(2, multi_sum.call_count)
+
+            # disabled outside of the command, not cached
+            md5sum(filepath)
+            md5sum(filepath)
+            self.assertEqual(4, multi_sum.call_count)
@@ -1,16 +1,19 @@
 # coding=utf-8
-
+import io
 import os
 import platform
+import stat
 import tarfile
 import unittest
 
 import pytest
+from mock import mock
 
 from conans.client.tools.files import chdir
 from conans.model.manifest import gather_files
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import tar_extract, gzopen_without_timestamps, save
+from conans.util.files import tar_extract, gzopen_without_timestamps, load, save, \
+    _TarExtractor
 
 
 class TarExtractTest(unittest.TestCase):
@@ -63,3 +66,91 @@ class TarExtractTest(unittest.TestCase):
             with open(self.tgz_file, 'rb') as file_handler:
                 tar_extract(file_handler, destination_dir)
             check_files(destination_dir)
+
+
+def _tar_file(members):
+    """ members: [(TarInfo, content bytes or None)]
+    """
+    buffer = io.BytesIO()
+    tar = tarfile.open(fileobj=buffer, mode="w")
+    for info, content in members:
+        if content is not None:
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+        else:
+            tar.addfile(info)
+    tar.close()
+    buffer.seek(0)
+    return buffer
+
+
+def _member(name, member_type=tarfile.REGTYPE, linkname="", mode=0o644, mtime=1234567890):
+    info = tarfile.TarInfo(name)
+    info.type = member_type
+    info.linkname = linkname
+    info.mode = mode
+    info.mtime = mtime
+    return info
+
+
+class TarExtractSafetyTest(unittest.TestCase):
+
+    def test_many_files(self):
+        members = [(_member("folder{}/file{}.h".format(i % 7, i), mode=0o600 if i % 2 else 0o755),
+                    "content {}".format(i).encode()) for i in range(500)]
+        members.append((_member("folder0", tarfile.DIRTYPE, mode=0o750, mtime=1000), None))
+        # The last one wins, like extractall()
+        members.append((_member("folder1/file1.h"), b"new content"))
+        destination_dir = temp_folder()
+        with mock.patch.object(_TarExtractor, "_WRITERS", 4):  # Not in the machine CPUs
+            tar_extract(_tar_file(members), destination_dir)
+
+        for i in range(500):
+            path = os.path.join(destination_dir, "folder{}".format(i % 7), "file{}.h".format(i))
+            if i == 1:
+                continue
+            self.assertEqual(load(path), "content {}".format(i))
+            self.assertEqual(os.path.getmtime(path), 1234567890)
+            if platform.system() != "Windows":
+                self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600 if i % 2 else 0o755)
+        self.assertEqual(load(os.path.join(destination_dir, "folder1", "file1.h")), "new content")
+        self.assertEqual(os.path.getmtime(os.path.join(destination_dir, "folder0")), 1000)
+
+    def test_windows_separators(self):
+        destination_dir = temp_folder()
+        tar_extract(_tar_file([(_member("folder\\file.txt"), b"hello")]), destination_dir)
+        self.assertEqual(load(os.path.join(destination_dir, "folder", "file.txt")), "hello")
+
+    def test_skip_not_safe(self):
+        parent = temp_folder()
+        destination_dir = os.path.join(parent, "dest")
+        members = [(_member("../outside.txt"), b"evil"),
+                   (_member("folder/../../outside2.txt"), b"evil"),
+                   (_member(os.path.join(parent, "absolute.txt")), b"evil"),
+                   (_member("hardlink.txt", tarfile.LNKTYPE, linkname="file.txt"), None),
+                   (_member("folder/../file.txt"), b"good")]
+        tar_extract(_tar_file(members), destination_dir)
+        self.assertEqual(sorted(os.listdir(parent)), ["dest"])
+        self.assertEqual(os.listdir(destination_dir), ["file.txt"])
+        self.assertEqual(load(os.path.join(destination_dir, "file.txt")), "good")
+
+    @pytest.mark.skipif(platform.system() == "Windows", reason="Requires symlinks")
+    def test_skip_through_symlinks(self):
+        outside = temp_folder()
+        destination_dir = temp_folder()
+        members = [(_member("evil", tarfile.SYMTYPE, linkname=outside), None),
+                   (_member("evil/file.txt"), b"evil"),
+                   (_member("evil_file", tarfile.SYMTYPE, linkname=outside + "/file2.txt"), None),
+                   (_member("evil_file"), b"evil"),
+                   (_member("evil2", tarfile.SYMTYPE, linkname="folder/.."), None),
+                   (_member("evil2/../file3.txt"), b"evil"),
+                   (_member("good", tarfile.SYMTYPE, linkname="folder"), None),
+                   (_member("folder/file.txt"), b"good"),
+                   (_member("good/file2.txt"), b"good2")]
+        tar_extract(_tar_file(members), destination_dir)
+        self.assertEqual(os.listdir(outside), [])
+        self.assertFalse(os.path.exists(os.path.join(os.path.dirname(destination_dir),
+                                                     "file3.txt")))
+        self.assertEqual(os.readlink(os.path.join(destination_dir, "evil")), outside)
+        self.assertEqual(load(os.path.join(destination_dir, "good", "file.txt")), "good")
+        self.assertEqual(load(os.path.join(destination_dir, "folder", "file2.txt")), "good2")
@@ -2,6 +2,7 @@ import os
 import unittest
 import uuid
 
+import mock
 import six
 import pytest
 
@@ -29,6 +30,35 @@ class LocalStoreTest(unittest.TestCase):
         self.assertEqual("access_token", access_token)
         self.assertEqual("pepe", localdb.get_username("myurl1"))
 
+    def test_login_cached(self):
+        tmp_dir = temp_folder()
+        db_file = os.path.join(tmp_dir, "dbfile")
+        localdb = LocalDB.create(db_file)
+        localdb.store("pepe", "token", "access_token", "myurl1")
+        self.assertEqual(("pepe", "token", "access_token"), localdb.get_login("myurl1"))
+
+        with mock.patch("sqlite3.connect") as connect:
+            for _ in range(3):
+                self.assertEqual(("pepe", "token", "access_token"), localdb.get_login("myurl1"))
+        connect.assert_not_called()
+
+        # Read again if the database is written by other LocalDB or process
+        other_db = LocalDB.create(db_file)
+        self.assertEqual(("pepe", "token", "access_token"), other_db.get_login("myurl1"))
+        other_db.store("pepe", "token2", None, "myurl1")
+        self.assertEqual(("pepe", "token2", None), other_db.get_login("myurl1"))
+        self.assertEqual(("pepe", "token2", None), localdb.get_login("myurl1"))
+
+        # A token updated in place, keeping the size and mtime of the file, is read again
+        st = os.stat(db_file)
+        other_db.store("pepe", "token3", None, "myurl1")
+        os.utime(db_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(st.st_size, os.stat(db_file).st_size)
+        self.assertEqual(("pepe", "token3", None), localdb.get_login("myurl1"))
+
+        localdb.clean()
+        self.assertEqual((None, None, None), localdb.get_login("myurl1"))
+
     def test_token_encryption_ascii(self):
         tmp_dir = temp_folder()
         db_file = os.path.join(tmp_dir, "dbfile")
@@ -0,0 +1,15 @@
+from jinja2 import StrictUndefined, UndefinedError
+import pytest
+
+from conans.util.templates import compiled_template
+
+
+def test_compiled_template():
+    template = compiled_template("{{ name }}/{{ version }}", undefined=StrictUndefined)
+    assert template.render(name="pkg", version="0.1") == "pkg/0.1"
+    assert template.render(name="other", version="1.0") == "other/1.0"
+    # Compiled once for the same source and options
+    assert compiled_template("{{ name }}/{{ version }}", undefined=StrictUndefined) is template
+    with pytest.raises(UndefinedError):
+        template.render(name="pkg")
+    assert compiled_template("{{ name }}/{{ version }}").render(name="pkg") == "pkg/"
@@ -0,0 +1,169 @@
+""" Formats of the archives of the packages: the files of a package are stored in the servers in
+a single "conan_package.<extension>" file, the extension identifies the codec that compressed it.
+The archives are deterministic, compressing the same files always gives the same checksums.
+"""
+import io
+import os
+import stat
+import sys
+import tarfile
+import time
+from collections import OrderedDict
+
+from conans import ARCHIVE_TAR, ARCHIVE_XZ
+from conans.errors import ConanException
+from conans.model.manifest import gather_files
+from conans.paths import PACKAGE_TAR_NAME, PACKAGE_TGZ_NAME, PACKAGE_TXZ_NAME
+from conans.util.env_reader import get_env
+from conans.util.files import gzopen_without_timestamps, human_size, mkdir_tmp, rmdir, tar_extract
+
+
+class ArchiveCodec(object):
+    """ capability: the one the server needs to accept archives of this format, None for all
+    """
+    def __init__(self, name, archive_name, capability=None):
+        self.name = name
+        self.archive_name = archive_name
+        self.capability = capability
+
+    def open(self, name, fileobj):
+        """ returns a TarFile to write the archive into fileobj
+        """
+        raise NotImplementedError()
+
+
+class _GzipCodec(ArchiveCodec):
+    def open(self, name, fileobj):
+        return gzopen_without_timestamps(name, mode="w", fileobj=fileobj)
+
+
+class _XzCodec(ArchiveCodec):
+    def open(self, name, fileobj):
+        # xz has no timestamps. Presets over 6 mostly increase the memory to decompress
+        preset = get_env("CONAN_COMPRESSION_LEVEL", 6)
+        return tarfile.open(name, mode="w:xz", fileobj=fileobj, preset=preset,
+                            format=tarfile.GNU_FORMAT)
+
+
+class _TarCodec(ArchiveCodec):
+    def open(self, name, fileobj):
+        return tarfile.TarFile.taropen(name, mode="w", fileobj=fileobj, format=tarfile.GNU_FORMAT)
+
+
+GZIP_CODEC = _GzipCodec("gzip", PACKAGE_TGZ_NAME)
+ARCHIVE_CODECS = OrderedDict((codec.name, codec) for codec in
+                             (GZIP_CODEC,
+                              _XzCodec("xz", PACKAGE_TXZ_NAME, ARCHIVE_XZ),
+                              _TarCodec("none", PACKAGE_TAR_NAME, ARCHIVE_TAR)))
+PACKAGE_ARCHIVE_NAMES = [codec.archive_name for codec in ARCHIVE_CODECS.values()]
+
+
+def get_archive_codec(name):
+    try:
+        return ARCHIVE_CODECS[name]
+    except KeyError:
+        raise ConanException("Invalid compression format '{}', possible values: {}"
+                             .format(name, ", ".join(ARCHIVE_CODECS)))
+
+
+def find_package_archive(files):
+    """ the name of the package archive in the files (names or {name: path}), the first in the
+    codecs order if there are several, or None
+    """
+    for name in PACKAGE_ARCHIVE_NAMES:
+        if name in files:
+            return name
+    return None
+
+
+def write_archive(codec, fileobj, name, files, symlinks):
+    """ files: sorted [(relative name, absolute path)]
+    symlinks: {relative name: link destination}
+    """
+    archive = codec.open(name, fileobj)
+    for filename, dest in sorted(symlinks.items()):
+        info = tarfile.TarInfo(name=filename)
+        info.type = tarfile.SYMTYPE
+        info.linkname = dest
+        info.size = 0  # A symlink shouldn't have size
+        archive.addfile(tarinfo=info)
+
+    mask = ~(stat.S_IWOTH | stat.S_IWGRP)
+    for filename, abs_path in files:
+        info = tarfile.TarInfo(name=filename)
+        st = os.stat(abs_path)
+        info.size = st.st_size
+        info.mode = st.st_mode & mask
+        if os.path.islink(abs_path):
+            info.type = tarfile.SYMTYPE
+            info.size = 0  # A symlink shouldn't have size
+            info.linkname = os.readlink(abs_path)
+            archive.addfile(tarinfo=info)
+        else:
+            with open(abs_path, 'rb') as file_handler:
+                archive.addfile(tarinfo=info, fileobj=file_handler)
+    archive.close()
+
+
+def benchmark_codecs(folder, codecs=None):
+    """ Compresses and extracts the files of the folder (like a package folder of the cache)
+    with every codec, returns [(codec name, size, ratio, compress MB/s, extract MB/s)]
+    """
+    files, symlinks = gather_files(folder)
+    total = sum(os.path.getsize(p) for p in files.values() if not os.path.islink(p)) or 1
+    mega = 1024.0 * 1024.0
+    result = []
+    for codec in (codecs or ARCHIVE_CODECS.values()):
+        buffer = io.BytesIO()
+        start = time.time()
+        write_archive(codec, buffer, codec.archive_name, sorted(files.items()), symlinks)
+        compress_time = max(time.time() - start, 1e-6)
+        size = buffer.tell()
+        buffer.seek(0)
+        tmp_folder = mkdir_tmp()
+        try:
+            start = time.time()
+            tar_extract(buffer, tmp_folder)
+            extract_time = max(time.time() - start, 1e-6)
+        finally:
+            rmdir(tmp_folder)
+        result.append((codec.name, size, float(size) / total, total / mega / compress_time,
+                       total / mega / extract_time))
+    return result
+
+
+def benchmark_extraction(folder):
+    """ Extracts the uncompressed archive of the files of the folder with tar_extract() and with
+    TarFile.extractall(), returns (files, tar_extract seconds, extractall seconds)
+    """
+    files, symlinks = gather_files(folder)
+    buffer = io.BytesIO()
+    write_archive(ARCHIVE_CODECS["none"], buffer, PACKAGE_TAR_NAME, sorted(files.items()),
+                  symlinks)
+
+    def extractall(fileobj, destination_dir):
+        with tarfile.open(fileobj=fileobj) as the_tar:
+            the_tar.extractall(destination_dir)
+
+    result = [len(files)]
+    for extract in (tar_extract, extractall):
+        buffer.seek(0)
+        tmp_folder = mkdir_tmp()
+        try:
+            start = time.time()
+            extract(buffer, tmp_folder)
+            result.append(time.time() - start)
+        finally:
+            rmdir(tmp_folder)
+    return tuple(result)
+
+
+
+if __name__ == "__main__":
+    # python -m conans.util.archives <folder>, like a package folder of the cache
+    for codec_name, archive_size, ratio, compress_speed, extract_speed in \
+            benchmark_codecs(sys.argv[1]):
+        print("{:<6} {:>10} ratio {:.3f}  compress {:8.1f} MB/s  extract {:8.1f} MB/s"
+              .format(codec_name, human_size(archive_size), ratio, compress_speed, extract_speed))
+    print("extract {} files: {:.2f}s, tarfile extractall {:.2f}s"
+          .format(*benchmark_extraction(sys.argv[1])))
@@ -0,0 +1,131 @@
+import fnmatch
+import os
+import re
+import threading
+import time
+from collections import namedtuple, OrderedDict
+
+# parent is the index of the parent folder in DirSnapshot.folders, -1 for the root
+SnapshotFolder = namedtuple("SnapshotFolder", "path parent is_link subfolders files links")
+
+
+def pattern_matcher(pattern, ignore_case, normcase=True):
+    """ returns a function name -> bool, a precompiled equivalent of fnmatch.fnmatch(name, pattern)
+    (or fnmatch.fnmatchcase() if not normcase), lowercasing both name and pattern if ignore_case
+    """
+    if ignore_case:
+        pattern = pattern.lower()
+    if normcase:
+        pattern = os.path.normcase(pattern)
+    match = re.compile(fnmatch.translate(pattern)).match
+    if not ignore_case and not normcase:
+        return lambda name: match(name) is not None
+
+    def matcher(name):
+        if ignore_case:
+            name = name.lower()
+        if normcase:
+            name = os.path.normcase(name)
+        return match(name) is not None
+    return matcher
+
+
+def _list_folder(path):
+    """ returns (mtime_ns, subfolders, files, symlinked subfolders) or None if the folder cannot
+    be listed (os.walk() ignores those too). Symlinks to folders are considered folders
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        subfolders, files, links = [], [], set()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    subfolders.append(entry.name)
+                    if entry.is_symlink():
+                        links.add(entry.name)
+                else:
+                    files.append(entry.name)
+    except OSError:
+        return None
+    return mtime, subfolders, files, links
+
+
+class DirSnapshot(object):
+    """ The folders and files of a tree, listed once to be reused by several copies of its files.
+    The folders are in the same top-down order os.walk() would return them.
+    Adding, removing or renaming files or folders inside the tree changes the modification time
+    of their parent folder, valid() checks them before the snapshot is reused
+    """
+    # Folders modified this close to the snapshot could be modified again without changing their
+    # modification time (file systems timestamps resolution), they are listed again to validate
+    _RACY_NS = 2 * 10 ** 9
+
+    def __init__(self, root, followlinks=False, skip_folder=None):
+        """
+        param followlinks: list the contents of the symlinks to folders too
+        param skip_folder: function (folder path, subfolder name) -> True for the subfolders
+                           that must not be listed
+        """
+        self.root = root
+        self.folders = []  # [SnapshotFolder]
+        self._mtimes = []
+        self._time_ns = int(time.time() * 10 ** 9)
+
+        pending = [(root, -1, os.path.islink(root))]
+        while pending:
+            path, parent, is_link = pending.pop()
+            listing = _list_folder(path)
+            if listing is None:
+                continue
+            mtime, subfolders, files, links = listing
+            index = len(self.folders)
+            self.folders.append(SnapshotFolder(path, parent, is_link, subfolders, files, links))
+            self._mtimes.append(mtime)
+            # Reversed, so the first subfolder is popped (and its subtree listed) first
+            for name in reversed(subfolders):
+                if name in links and not followlinks:
+                    continue
+                if skip_folder is not None and skip_folder(path, name):
+                    continue
+                pending.append((os.path.join(path, name), index, name in links))
+
+    def valid(self):
+        for folder, mtime in zip(self.folders, self._mtimes):
+            try:
+                if os.stat(folder.path).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+            if self._time_ns - mtime < self._RACY_NS:
+                listing = _list_folder(folder.path)
+                if listing is None or listing[1:3] != (folder.subfolders, folder.files):
+                    return False
+        return True
+
+
+class DirSnapshotCache(object):
+    """ The last snapshots taken, reused while they are valid
+    """
+    def __init__(self, max_snapshots=None):
+        self._max_snapshots = max_snapshots
+        self._snapshots = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, root, followlinks=False, skip_folder=None, key=None):
+        """ the key must identify the skip_folder behavior, as it is not compared
+        """
+        cache_key = (root, followlinks, key)
+        with self._lock:
+            snapshot = self._snapshots.pop(cache_key, None)
+        if snapshot is None or not snapshot.valid():
+            snapshot = DirSnapshot(root, followlinks, skip_folder)
+        with self._lock:
+            self._snapshots[cache_key] = snapshot
+            if self._max_snapshots is not None:
+                while len(self._snapshots) > self._max_snapshots:
+                    self._snapshots.popitem(last=False)
+        return snapshot
@@ -3,15 +3,17 @@ import gzip
 import hashlib
 import os
 import platform
+import posixpath
 import re
 import shutil
 import stat
 import sys
 import tarfile
 import tempfile
+import threading
 
 
-from os.path import abspath, join as joinpath, realpath
+from os.path import abspath, realpath
 from contextlib import contextmanager
 
 import six
@@ -142,30 +144,135 @@ def md5(content):
 
 
 def md5sum(file_path):
-    return _generic_algorithm_sum(file_path, "md5")
+    return file_digests_registry.digest(file_path, "md5")
 
 
 def sha1sum(file_path):
-    return _generic_algorithm_sum(file_path, "sha1")
+    return file_digests_registry.digest(file_path, "sha1")
 
 
 def sha256sum(file_path):
-    return _generic_algorithm_sum(file_path, "sha256")
+    return file_digests_registry.digest(file_path, "sha256")
+
+
+def _new_hash(algorithm_name):
+    try:
+        return hashlib.new(algorithm_name)
+    except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
+        return hashlib.new(algorithm_name, usedforsecurity=False)
 
 
 def _generic_algorithm_sum(file_path, algorithm_name):
+    return _multi_algorithm_sum(file_path, (algorithm_name, ))[algorithm_name]
+
 
+def _multi_algorithm_sum(file_path, algorithm_names):
+    """ computes several digests of a file reading it just once
+    """
+    hashes = [(name, _new_hash(name)) for name in algorithm_names]
     with open(file_path, 'rb') as fh:
-        try:
-            m = hashlib.new(algorithm_name)
-        except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
-            m = hashlib.new(algorithm_name, usedforsecurity=False)
         while True:
-            data = fh.read(8192)
+            data = fh.read(65536)
             if not data:
                 break
-            m.update(data)
-        return m.hexdigest()
+            for _, m in hashes:
+                m.update(data)
+    return {name: m.hexdigest() for name, m in hashes}
+
+
+class FileDigestsRegistry(object):
+    """ While enabled (one per Conan command), it computes md5, sha1 and sha256 of a file in a
+    single read the first time any of them is requested, and returns the stored ones later, so
+    the manifest, the integrity check, the uploader and the tracer do not read the same
+    files again. The stored digests of a file are discarded if its size, modification time,
+    change time or inode change. A file rewritten with the same size within the timestamp
+    resolution of the filesystem (up to 2 seconds in some of them) after being hashed is not
+    detected, the registry only lives for one command to limit that window
+    """
+    ALGORITHMS = ("md5", "sha1", "sha256")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._digests = {}  # {file_path: (signature, {algorithm_name: digest})}
+        self._depth = 0
+
+    @contextmanager
+    def enabled(self):
+        with self._lock:
+            self._depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if not self._depth:
+                    self._digests.clear()
+
+    def digest(self, file_path, algorithm_name):
+        if not self._depth or algorithm_name not in self.ALGORITHMS:
+            return _generic_algorithm_sum(file_path, algorithm_name)
+        file_path = os.path.abspath(file_path)
+        st = os.stat(file_path)
+        signature = st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino
+        with self._lock:
+            cached = self._digests.get(file_path)
+        if cached is None or cached[0] != signature:
+            cached = signature, _multi_algorithm_sum(file_path, self.ALGORITHMS)
+            with self._lock:
+                self._digests[file_path] = cached
+        return cached[1][algorithm_name]
+
+
+file_digests_registry = FileDigestsRegistry()
+
+
+# The hardlinked files of the sources staged in the build folders being built
+_staged_hardlinks = set()
+_staged_hardlinks_lock = threading.Lock()
+
+
+@contextmanager
+def staged_hardlinks(paths):
+    """ While active, save() and save_append() replace these hardlinked files (the sources
+    staged in a build folder) with a copy of their own before writing them, so the other places
+    linking them are not modified. Other files are written as always
+    """
+    paths = set(os.path.normcase(os.path.abspath(p)) for p in paths)
+    with _staged_hardlinks_lock:
+        _staged_hardlinks.update(paths)
+    try:
+        yield
+    finally:
+        with _staged_hardlinks_lock:
+            _staged_hardlinks.difference_update(paths)
+
+
+def break_hardlink(path):
+    """ Replaces a staged hardlinked file with a copy of its own, see staged_hardlinks()
+    """
+    if not _staged_hardlinks:
+        return
+    path = os.path.normcase(os.path.abspath(path))
+    with _staged_hardlinks_lock:
+        if path not in _staged_hardlinks:
+            return
+        _staged_hardlinks.discard(path)
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return
+        if not stat.S_ISREG(st.st_mode) or st.st_nlink < 2:
+            return
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path), suffix=".conan_unlink",
+                                        dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            shutil.copy2(path, tmp_path)
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode) | stat.S_IWUSR)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
 
 
 def save_append(path, content, encoding="utf-8"):
@@ -174,6 +281,7 @@ def save_append(path, content, encoding="utf-8"):
     except Exception:
         pass
 
+    break_hardlink(path)
     with open(path, "ab") as handle:
         handle.write(to_file_bytes(content, encoding=encoding))
 
@@ -205,6 +313,7 @@ def save(path, content, only_if_modified=False, encoding="utf-8"):
         if old_content == new_content:
             return
 
+    break_hardlink(path)
     with open(path, "wb") as handle:
         handle.write(new_content)
 
@@ -282,6 +391,34 @@ def remove(path):
         raise
 
 
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2,
+               "G": 1024 ** 3, "GB": 1024 ** 3, "T": 1024 ** 4, "TB": 1024 ** 4}
+
+
+def parse_size(text):
+    """ Converts a human size definition like "500", "300MB" or "10G" into bytes (int)
+    """
+    if text is None:
+        return None
+    if isinstance(text, int):
+        return text
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$", str(text))
+    if not match or match.group(2).upper() not in _SIZE_UNITS:
+        raise ValueError("Invalid size '{}', use a number of bytes or a KB, MB, GB, TB "
+                         "suffix".format(text))
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def human_size(size_bytes):
+    """ Inverse of parse_size() for output messages, "1.5MB"
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size_bytes) < 1024:
+            return "{:.1f}{}".format(size_bytes, unit) if unit != "B" else "{}B".format(size_bytes)
+        size_bytes /= 1024.0
+    return "{:.1f}TB".format(size_bytes)
+
+
 def mkdir(path):
     """Recursive mkdir, doesnt fail if already existing"""
     if os.path.exists(path):
@@ -289,6 +426,20 @@ def mkdir(path):
     os.makedirs(path)
 
 
+def copy_is_up_to_date(src, dst):
+    """ True if dst is a regular file with the size, modification time and permissions that
+    shutil.copy2(src, dst) would give it, so copying again can be skipped
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.lstat(dst)
+    except OSError:
+        return False
+    return (stat.S_ISREG(dst_stat.st_mode) and src_stat.st_mode == dst_stat.st_mode and
+            src_stat.st_size == dst_stat.st_size and
+            src_stat.st_mtime_ns == dst_stat.st_mtime_ns)
+
+
 def path_exists(path, basedir):
     """Case sensitive, for windows, optional
     basedir for skip caps check for tmp folders in testing for example (returned always
@@ -342,31 +493,183 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, **kwargs):
     return t
 
 
-def tar_extract(fileobj, destination_dir):
-    """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
-    def badpath(path, base):
-        # joinpath will ignore base if path is absolute
-        return not realpath(abspath(joinpath(base, path))).startswith(base)
-
-    def safemembers(members):
-        base = realpath(abspath(destination_dir))
-
-        for finfo in members:
-            if badpath(finfo.name, base) or finfo.islnk():
-                logger.warning("file:%s is skipped since it's not safe." % str(finfo.name))
-                continue
+class _TarExtractor(object):
+    """ Extracts the members of a tar stream reading them once, in order. The member names are
+    normalized lexically and only their folders are resolved (once per folder), the folders are
+    created once and the files are written by a bounded pool of threads.
+    Not safe members are skipped: absolute paths, escaping the destination folder (also through
+    symlinks), hardlinks and special files
+    """
+    _WRITERS = min(8, os.cpu_count() or 1)
+    _PENDING = 64  # files read from the tar and not written yet
+    _POOL_THRESHOLD = 64  # the first files are written directly, small tars do not need threads
+    _INLINE_SIZE = 1024 * 1024  # bigger files are written directly from the tar stream
+
+    def __init__(self, destination_dir):
+        self._base = realpath(abspath(destination_dir))
+        self._base_prefix = os.path.join(self._base, "")
+        self._safe_folders = {""}  # relative folders that are real folders inside the base
+        self._folder_members = []  # [(path, TarInfo)], attributes set at the end, as extractall
+        self._pending = {}  # {path: AsyncResult}
+        self._slots = threading.BoundedSemaphore(self._PENDING)
+        self._pool = None
+        self._files = 0
+
+    def _inside(self, path):
+        return path == self._base or path.startswith(self._base_prefix)
+
+    def _safe_folder(self, relative):
+        """ True if the relative folder resolves inside the base. It is resolved only the first
+        time, real folders cannot be replaced by symlinks later, so they are not resolved again
+        """
+        if relative in self._safe_folders:
+            return True
+        path = os.path.join(self._base, relative)
+        resolved = realpath(path)
+        if not self._inside(resolved):
+            return False
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        if resolved == os.path.normpath(path):  # No symlinks in the way
+            self._safe_folders.add(relative)
+        return True
+
+    def _relative_path(self, name):
+        """ the normalized relative path of the member, or None if it is not safe
+        """
+        # Fixes unzip a windows zipped file in linux
+        name = name.replace("\\", "/")
+        if name.startswith("/") or os.path.isabs(name) or os.path.splitdrive(name)[0]:
+            return None
+        components = name.split("/")
+        if ".." in components:
+            # A ".." after a symlink goes to the parent of the symlink destination, not lexical
+            resolved = realpath(os.path.join(self._base, name))
+            if not self._inside(resolved):
+                return None
+            relative = os.path.relpath(resolved, self._base).replace(os.sep, "/")
+        else:
+            relative = posixpath.normpath(name)
+        return "" if relative == "." else relative
+
+    def _wait(self, path):
+        pending = self._pending.pop(path, None)
+        if pending is not None:
+            pending.get()
+
+    def _write(self, path, member, content):
+        """ content: bytes or the file object of the member
+        """
+        fd = None
+        if _NOFOLLOW or not os.path.islink(path):
+            try:
+                fd = os.open(path, _EXTRACT_FLAGS, 0o666)
+            except OSError as e:
+                if e.errno != errno.ELOOP:
+                    raise
+        if fd is None:
+            # An existing symlink, written through it only if it resolves inside the base
+            path = realpath(path)
+            if not self._inside(path):
+                logger.warning("file:%s is skipped since it's not safe." % str(member.name))
+                return
+            fd = os.open(path, _EXTRACT_FLAGS & ~_NOFOLLOW, 0o666)
+        with open(fd, "wb") as handle:
+            if isinstance(content, bytes):
+                handle.write(content)
             else:
-                # Fixes unzip a windows zipped file in linux
-                finfo.name = finfo.name.replace("\\", "/")
-                yield finfo
+                shutil.copyfileobj(content, handle, 1024 * 1024)
+        _set_member_attributes(path, member)
 
-    the_tar = tarfile.open(fileobj=fileobj)
-    # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
+    def _write_async(self, path, member, content):
+        def write():
+            try:
+                self._write(path, member, content)
+            finally:
+                self._slots.release()
+        if self._pool is None:
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(self._WRITERS)
+        self._slots.acquire()
+        self._pending[path] = self._pool.apply_async(write)
+        if len(self._pending) > 2 * self._PENDING:
+            # Only the not finished ones are kept, the finished ones raise their errors now
+            for pending_path, pending in list(self._pending.items()):
+                if pending.ready():
+                    del self._pending[pending_path]
+                    pending.get()
+
+    def _extract_member(self, the_tar, member):
+        relative = self._relative_path(member.name)
+        if relative is None or member.islnk():
+            return False
+        folder, name = posixpath.split(relative)
+        if member.isdir():
+            if not self._safe_folder(relative):
+                return False
+            self._folder_members.append((os.path.join(self._base, relative), member))
+            return True
+        if not name or not self._safe_folder(folder) or not (member.isfile() or member.issym()):
+            return False
+        path = os.path.join(self._base, relative)
+        self._wait(path)
+        if member.issym():
+            if os.path.lexists(path):
+                if not os.path.islink(path) and os.path.isdir(path):
+                    return False  # Replacing a real folder would invalidate _safe_folders
+                os.unlink(path)
+            os.symlink(member.linkname, path)
+            return True
+        self._files += 1
+        if (member.size > self._INLINE_SIZE or self._files <= self._POOL_THRESHOLD or
+                self._WRITERS < 2):
+            self._write(path, member, the_tar.extractfile(member))
+        else:
+            self._write_async(path, member, the_tar.extractfile(member).read())
+        return True
+
+    def extract(self, fileobj):
+        the_tar = tarfile.open(fileobj=fileobj)
+        try:
+            if not os.path.isdir(self._base):
+                os.makedirs(self._base)
+            for member in the_tar:
+                if not self._extract_member(the_tar, member):
+                    logger.warning("file:%s is skipped since it's not safe." % str(member.name))
+            for pending in self._pending.values():
+                pending.get()
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+            the_tar.close()
+        # As extractall(), the folders attributes are set after their contents are extracted
+        self._folder_members.sort(key=lambda folder: folder[0], reverse=True)
+        for path, member in self._folder_members:
+            _set_member_attributes(path, member)
+
+
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+_EXTRACT_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | _NOFOLLOW
+
+
+def _set_member_attributes(path, member):
+    # NOTE: As extractall() errors are ignored, it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
-    # the_tar.errorlevel = 2  # raise exception if any error
-    the_tar.extractall(path=destination_dir, members=safemembers(the_tar))
-    the_tar.close()
+    try:
+        os.chmod(path, member.mode)
+    except OSError:
+        pass
+    try:
+        os.utime(path, (member.mtime, member.mtime))
+    except OSError:
+        pass
+
+
+def tar_extract(fileobj, destination_dir):
+    """Extract tar file controlling not absolute paths and fixing the routes
+    if the tar was zipped in windows"""
+    _TarExtractor(destination_dir).extract(fileobj)
 
 
 def list_folder_subdirs(basedir, level):
@@ -15,6 +15,12 @@ class NoLock(object):
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
         pass
 
+    def acquire(self, blocking=True):  # @UnusedVariable
+        return True
+
+    def release(self):
+        pass
+
 
 class SimpleLock(object):
 
@@ -27,6 +33,14 @@ class SimpleLock(object):
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
         self._lock.release()
 
+    def acquire(self, blocking=True):
+        """ returns False if not blocking and the lock is already taken by another process
+        """
+        return self._lock.acquire(blocking=blocking)
+
+    def release(self):
+        self._lock.release()
+
 
 READ_BUSY_DELAY = 0.5
 WRITE_BUSY_DELAY = 0.25
@@ -90,15 +104,26 @@ class ReadLock(Lock):
 class WriteLock(Lock):
 
     def __enter__(self):
-        while True:
-            with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
-                readers = self._readers()
-                if readers == 0:
-                    save(self._count_file, "-1")
-                    break
+        while not self.acquire(blocking=False):
             self._info_locked()
             time.sleep(WRITE_BUSY_DELAY)
 
+    def acquire(self, blocking=True):
+        """ returns False if not blocking and there are readers or another writer
+        """
+        if blocking:
+            self.__enter__()
+            return True
+        with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+            readers = self._readers()
+            if readers == 0:
+                save(self._count_file, "-1")
+                return True
+        return False
+
+    def release(self):
+        self.__exit__(None, None, None)
+
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
             save(self._count_file, "0")
@@ -1,6 +1,16 @@
-from jinja2 import Template
+from functools import lru_cache
 
 
 def render_layout_file(content, ref=None, settings=None, options=None):
+    from jinja2 import Template
     t = Template(content)
     return t.render(reference=ref, settings=settings, options=options)
+
+
+@lru_cache(maxsize=128)
+def compiled_template(source, **kwargs):
+    """ the jinja2.Template of the source, compiled only the first time. The generators render
+    the same templates for every dependency, and compiling them is much slower than rendering
+    """
+    from jinja2 import Template
+    return Template(source, **kwargs)
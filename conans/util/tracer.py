@@ -20,7 +20,7 @@ TRACER_ACTIONS = ["UPLOADED_RECIPE", "UPLOADED_PACKAGE",
                   "GOT_RECIPE_FROM_LOCAL_CACHE", "GOT_PACKAGE_FROM_LOCAL_CACHE",
                   "REST_API_CALL", "COMMAND",
                   "EXCEPTION",
-                  "DOWNLOAD",
+                  "DOWNLOAD", "DOWNLOAD_CACHE", "HTTP_CONNECTIONS",
                   "UNZIP", "ZIP"]
 
 MASKED_FIELD = "**********"
@@ -165,6 +165,21 @@ def log_download(url, duration):
     _append_action("DOWNLOAD", {"url": url, "duration": duration})
 
 
+def log_download_cache_stats(stats):
+    _append_action("DOWNLOAD_CACHE", {"hits": stats.hits, "misses": stats.misses,
+                                      "bytes_saved": stats.bytes_saved,
+                                      "evicted": stats.evicted})
+    logger.debug("DOWNLOAD CACHE: %s" % stats)
+
+
+def log_http_connections(connections_stats):
+    for host, (opened, requests) in sorted(connections_stats.items()):
+        _append_action("HTTP_CONNECTIONS", {"host": host, "opened": opened,
+                                            "reused": requests - opened})
+        logger.debug("HTTP CONNECTIONS: %s: %s opened, %s reused"
+                     % (host, opened, requests - opened))
+
+
 def log_uncompressed_file(src_path, duration, dest_folder):
     _append_action("UNZIP", {"src": src_path, "dst": dest_folder, "duration": duration})
 